@@ -0,0 +1,69 @@
+import sys
+import json
+import time
+import random
+from blindcv import render
+from blindcv.render import LAYOUTS, RenderContext
+from blindcv.incremental import IncrementalRenderer
+from blindcv.service import latency_summary
+from benchmarks.bench_templates import classic_profile, minimalist_profile, same_pdf, sentence
+
+# Edit-to-PDF latency: a profile is rendered once, then one field is edited
+# and the PDF made again, either as a full render or through the incremental
+# renderer (incremental.py), which lays out only the sections the edit
+# touches and replays the rest. Edits are grouped by where the field sits:
+# the last section (email, interests: nothing after it moves), an earlier
+# section (everything below it is laid out again) and the header (full
+# render). Every incremental PDF must match the full render byte for byte,
+# apart from the creation date.
+#   python -m benchmarks.bench_incremental [profiles]   (from the repo root)
+
+EDITS = {
+    "classic": {"last section": ["email", "github"], "earlier section": ["education", "projects"],
+                "header": ["name"]},
+    "minimalist": {"last section": ["interests"], "earlier section": ["education", "skills"],
+                   "header": ["email"]},
+}
+
+
+def edit(rng, profile, field):
+    value = profile.get(field)
+    if isinstance(value, list):
+        profile[field] = value + [sentence(rng, 1)]
+    elif field in ("email", "github"):
+        profile[field] = f"{sentence(rng, 1).lower()}@example.com"
+    else:
+        profile[field] = sentence(rng, rng.randint(3, 20))
+
+
+def main(count=100):
+    render.RENDER_CACHE = None
+    rng = random.Random(11)
+    timings = {}
+    mismatches = 0
+    for i in range(count):
+        layout = "classic" if i % 2 else "minimalist"
+        profile = classic_profile(rng, rng.choice(["basic", "highlight"])) if i % 2 else minimalist_profile(rng)
+        renderer = IncrementalRenderer()
+        renderer.render(profile)
+        for where, fields in EDITS[layout].items():
+            edit(rng, profile, rng.choice(fields))
+            start = time.perf_counter()
+            full = LAYOUTS[layout](RenderContext(profile), None)
+            full_s = time.perf_counter() - start
+            start = time.perf_counter()
+            incremental = renderer.render(profile)
+            inc_s = time.perf_counter() - start
+            samples = timings.setdefault(f"{layout}, {where}", ([], []))
+            samples[0].append(full_s)
+            samples[1].append(inc_s)
+            mismatches += not same_pdf(full, incremental)
+
+    for name, (full, incremental) in timings.items():
+        print(f"{name:32} full {json.dumps(latency_summary(full))}")
+        print(f"{'':32} incr {json.dumps(latency_summary(incremental))}")
+    print(f"{mismatches} incremental PDFs differ from the full render")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
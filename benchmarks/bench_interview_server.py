@@ -0,0 +1,109 @@
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import asyncio
+import argparse
+import tempfile
+import contextlib
+from blindcv import render
+from blindcv.stt import ReplayBackend
+from blindcv.service import latency_summary
+from blindcv.interview_server import Connection, InterviewServer
+from benchmarks.bench_session import SCRIPTS, synth_corpus
+
+# Load test for the interview server (interview_server.py): N simulated
+# terminals run test-mode interviews at the same time over TCP, each sending
+# the recorded answers of the synthesised corpus. Every session gets its own
+# replay recognizer; --latency makes each recognition take that long, as a
+# network recognizer (Google) would. Reports, per level of concurrency, the
+# turn latency seen by the client (answer sent -> next prompt received),
+# whole sessions per second, and the server's own counters.
+#   python -m benchmarks.bench_interview_server [--sessions 1 10 50 100] [--latency 0.3] [--stt-workers 32]
+
+
+async def client(host, port, mode, answers, turns):
+    reader, writer = await asyncio.open_connection(host, port)
+    conn = Connection(reader, writer)
+    try:
+        await conn.send(b"H", {"mode": mode})
+        answers = iter(answers)
+        sent = None
+        while True:
+            kind, payload = await conn.read()
+            if sent is not None and kind in (b"P", b"R"):
+                turns.append(time.perf_counter() - sent)
+                sent = None
+            if kind == b"E":
+                raise RuntimeError(json.loads(payload)["error"])
+            if kind == b"F":
+                return payload
+            if kind == b"P" and json.loads(payload)["listen"]:
+                await conn.send(b"U", next(answers))
+                sent = time.perf_counter()
+    finally:
+        writer.close()
+
+
+async def load(server, sessions, mode, answers):
+    listener = await server.start("127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+    turns = []
+    start = time.perf_counter()
+    pdfs = await asyncio.gather(*(client("127.0.0.1", port, mode, answers, turns) for _ in range(sessions)))
+    wall = time.perf_counter() - start
+    listener.close()
+    await listener.wait_closed()
+    if not all(pdf.startswith(b"%PDF") for pdf in pdfs):
+        raise RuntimeError("a session returned no PDF")
+    return wall, turns
+
+
+def run_level(sessions, corpus, workdir, latency, stt_workers, work_workers):
+    folder = os.path.join(corpus, "test")
+    answers = []
+    for name in sorted(n for n in os.listdir(folder) if n.endswith(".wav")):
+        with open(os.path.join(folder, name), "rb") as f:
+            answers.append(f.read())
+    output_dir = tempfile.mkdtemp(dir=workdir)
+    server = InterviewServer(output_dir, stt_factory=lambda: ReplayBackend(SCRIPTS["test"], latency=latency),
+                             stt_workers=stt_workers, work_workers=work_workers)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            wall, turns = asyncio.run(load(server, sessions, "test", answers))
+        stats = server.stats()
+    finally:
+        server.close()
+    return {"sessions": sessions, "wall_seconds": round(wall, 3),
+            "sessions_per_second": round(sessions / wall, 2), "turn": latency_summary(turns),
+            "completed": stats["completed"], "failed": stats["failed"]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 10, 50, 100])
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds each recognition takes")
+    parser.add_argument("--stt-workers", type=int, default=32)
+    parser.add_argument("--work-workers", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    os.environ.update(BLINDCV_TTS="null", HOME=tempfile.gettempdir())
+    os.environ.pop("BLINDCV_STORE", None)
+    render.RENDER_CACHE = None
+    workdir = tempfile.mkdtemp()
+    try:
+        corpus = os.path.join(workdir, "corpus")
+        synth_corpus(corpus)
+        results = [run_level(n, corpus, workdir, args.latency, args.stt_workers, args.work_workers)
+                   for n in args.sessions]
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    print(json.dumps({"latency_seconds": args.latency, "stt_workers": args.stt_workers, "levels": results},
+                     indent=4))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+import sys
+import copy
+import random
+import timeit
+from blindcv.parse import KeywordExtractor
+
+# Microbenchmark: compiled KeywordExtractor vs the hard-coded if-chain that
+# simulate_llm_parser used before, on long monologues and growing rule tables.
+#   python -m benchmarks.bench_keyword_parser [repeats]   (from the repo root)
+
+
+def legacy_simulate_llm_parser(monologue):
+    # Verbatim copy of the pre-rule-table parser, kept as the baseline
+    parsed = {
+        "name": "Not provided",
+        "tag": "Not provided",
+        "location": "Not provided",
+        "education": "Not provided",
+        "experience": [],
+        "projects": [],
+        "email": "Not provided",
+        "skills": [],
+        "interests": []
+    }
+
+    if "backend" in monologue.lower():
+        parsed["tag"] = "Backend Engineer"
+        parsed["skills"] = ["Python", "APIs", "Databases"]
+
+    if "tcs" in monologue.lower():
+        parsed["experience"].append({
+            "company": "TCS",
+            "role": "Software Intern",
+            "duration": "6 months",
+            "bullets": [
+                "Built internal HR tool",
+                "Improved dashboard performance"
+            ]
+        })
+
+    if "resume" in monologue.lower():
+        parsed["projects"].append({
+            "title": "BlindCVBuilder",
+            "description": "Voice-based resume builder for blind users"
+        })
+
+    if "koch" in monologue.lower():
+        parsed["location"] = "Kochi"
+
+    if "n i t" in monologue.lower():
+        parsed["education"] = "B.Tech in Computer Science from NIT Calicut"
+
+    if "alenso" in monologue.lower():
+        parsed["name"] = "Alenso"
+
+    return parsed
+
+
+def legacy_rule_loop(rules, defaults, monologue):
+    # The if-chain generalised to N rules: one lower() and one substring search per rule
+    parsed = copy.deepcopy(defaults)
+    for rule in rules:
+        if rule["keyword"] in monologue.lower():
+            for field, value in rule.get("set", {}).items():
+                parsed[field] = copy.deepcopy(value)
+            for field, value in rule.get("append", {}).items():
+                parsed.setdefault(field, []).append(copy.deepcopy(value))
+    return parsed
+
+
+WORDS = ("i worked as a backend developer at tcs for six months and built an internal tool "
+         "i studied at n i t calicut and now live in kochi my name is alenso and i made a resume builder "
+         "that helps blind users write their cv with only their voice").split()
+
+
+def monologue(n_words, seed=1):
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(n_words))
+
+
+def synthetic_rules(n, seed=2):
+    rng = random.Random(seed)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    rules = []
+    for i in range(n):
+        word = "".join(rng.choice(letters) for _ in range(rng.randint(4, 9)))
+        rules.append({"keyword": word, "append": {"skills": word}})
+    return rules
+
+
+def best_of(fn, repeats):
+    runs = timeit.repeat(fn, number=1, repeat=repeats)
+    return min(runs) * 1000
+
+
+def main(repeats=20):
+    default = KeywordExtractor.from_file()
+
+    # Same answers as the old function before timing anything
+    for text in [monologue(n, seed) for n in (5, 50, 500) for seed in range(20)] + ["", "I'm Alenso from Kochi"]:
+        assert default.parse(text) == legacy_simulate_llm_parser(text), text
+
+    print("Default rule table (6 rules)")
+    print(f"{'words':>8} {'legacy ms':>10} {'compiled ms':>12}")
+    for n_words in (50, 500, 5000, 50000):
+        text = monologue(n_words)
+        legacy = best_of(lambda: legacy_simulate_llm_parser(text), repeats)
+        compiled = best_of(lambda: default.parse(text), repeats)
+        print(f"{n_words:>8} {legacy:>10.3f} {compiled:>12.3f}")
+
+    print()
+    print("Growing rule tables on a 2000-word monologue")
+    print(f"{'rules':>8} {'legacy ms':>10} {'compiled ms':>12} {'compile ms':>11}")
+    text = monologue(2000)
+    base = [r for r in default.rules]
+    for n_rules in (6, 100, 1000, 5000):
+        rules = base + synthetic_rules(n_rules - len(base))
+        compile_ms = best_of(lambda: KeywordExtractor(rules, default.defaults), 1)
+        extractor = KeywordExtractor(rules, default.defaults)
+        assert extractor.parse(text) == legacy_rule_loop(rules, default.defaults, text)
+        legacy = best_of(lambda: legacy_rule_loop(rules, default.defaults, text), max(3, repeats // 4))
+        compiled = best_of(lambda: extractor.parse(text), repeats)
+        print(f"{n_rules:>8} {legacy:>10.3f} {compiled:>12.3f} {compile_ms:>11.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
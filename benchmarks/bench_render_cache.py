@@ -0,0 +1,78 @@
+import sys
+import json
+import time
+import random
+import shutil
+import tempfile
+from blindcv import render
+from blindcv.render import LAYOUTS, RenderContext, detect_template
+from blindcv.render_cache import RenderCache
+from benchmarks.bench_templates import classic_profile, minimalist_profile, best_of
+
+# Render cache (render_cache.py): per-render time with no cache, on a miss
+# (render + hash + store; back to back, and with idle gaps in which the
+# background disk write can run), on a memory hit and on a disk hit (a fresh
+# cache over the same directory, as in a new process), then a
+# regeneration-heavy run where 80% of the requests repeat a profile.
+#   python -m benchmarks.bench_render_cache [repeats]   (from the repo root)
+
+
+def render_all(batch):
+    return [LAYOUTS[detect_template(p)](RenderContext(p), None) for p in batch]
+
+
+def one_at_a_time(batch, cache):
+    render.RENDER_CACHE = cache
+    samples = []
+    for profile in batch:
+        start = time.perf_counter()
+        render_all([profile])
+        samples.append(time.perf_counter() - start)
+        time.sleep(0.005)
+    return sum(samples) / len(samples) * 1000
+
+
+def main(repeats=5):
+    rng = random.Random(3)
+    batch = [classic_profile(rng, rng.choice(["basic", "highlight"])) if i % 2 else minimalist_profile(rng)
+             for i in range(200)]
+    directory = tempfile.mkdtemp()
+    per = lambda ms: ms / len(batch)
+    try:
+        render.RENDER_CACHE = None
+        uncached = per(best_of(lambda: render_all(batch), repeats))
+
+        def cold():
+            render.RENDER_CACHE = RenderCache(tempfile.mkdtemp(dir=directory))
+            render_all(batch)  # caller's latency; the disk writes finish behind it
+        miss = per(best_of(cold, repeats))
+        memory = per(best_of(lambda: render_all(batch), repeats))
+
+        render.RENDER_CACHE.flush()
+        warm = render.RENDER_CACHE.directory
+
+        # One request at a time with idle gaps, as in an interview: the disk write hides in the gap
+        idle_uncached = one_at_a_time(batch, None)
+        idle_miss = one_at_a_time(batch, RenderCache(tempfile.mkdtemp(dir=directory)))
+
+        def from_disk():
+            render.RENDER_CACHE = RenderCache(warm)
+            render_all(batch)
+        disk = per(best_of(from_disk, repeats))
+
+        print(f"{len(batch)} profiles, per render, back to back: uncached {uncached:.3f} ms, miss {miss:.3f} ms, "
+              f"memory hit {memory:.4f} ms, disk hit {disk:.3f} ms")
+        print(f"One at a time with idle gaps: uncached {idle_uncached:.3f} ms, miss {idle_miss:.3f} ms")
+
+        render.RENDER_CACHE = RenderCache(tempfile.mkdtemp(dir=directory))
+        workload = [rng.choice(batch) if rng.random() < 0.8 else minimalist_profile(rng) for _ in range(2000)]
+        start_ms = best_of(lambda: render_all(workload), 1)
+        print(f"2000 requests, 80% repeats: {start_ms / len(workload):.3f} ms per request "
+              f"(uncached {uncached:.3f} ms)")
+        print("Cache:", json.dumps(render.RENDER_CACHE.stats(), indent=4))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
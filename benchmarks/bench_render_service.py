@@ -0,0 +1,100 @@
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import http.client
+from blindcv import render
+from blindcv.service import RenderService, make_server, latency_summary
+
+# Load test for the render service: starts it in-process on a free port, then
+# N client threads POST the sample profiles over keep-alive connections as
+# fast as they can. Prints client-side throughput and p50/p99, and the
+# service's own view from /stats. A second run with more clients than the
+# admission limit shows back-pressure (503s) instead of a growing queue.
+#   python -m benchmarks.bench_render_service [--requests 2000] [--clients 8] [--cache]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLES = [
+    os.path.join(ROOT, "Files", "responses_20250406_201204.json"),
+    os.path.join(ROOT, "parsed_monologue_cv.json"),
+]
+
+
+def load_bodies():
+    bodies = []
+    for path in SAMPLES:
+        with open(path, encoding="latin-1") as f:
+            bodies.append(json.dumps(json.load(f)).encode())
+    return bodies
+
+
+def client(port, bodies, count, latencies, statuses, lock):
+    conn = http.client.HTTPConnection("127.0.0.1", port)
+    for i in range(count):
+        body = bodies[i % len(bodies)]
+        start = time.perf_counter()
+        conn.request("POST", "/render", body=body, headers={"Content-Type": "application/json"})
+        response = conn.getresponse()
+        response.read()
+        elapsed = time.perf_counter() - start
+        with lock:
+            statuses[response.status] = statuses.get(response.status, 0) + 1
+            if response.status == 200:
+                latencies.append(elapsed)
+    conn.close()
+
+
+def run(port, bodies, requests, clients):
+    latencies, statuses, lock = [], {}, threading.Lock()
+    per_client = requests // clients
+    threads = [threading.Thread(target=client, args=(port, bodies, per_client, latencies, statuses, lock))
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    return {
+        "clients": clients,
+        "requests": per_client * clients,
+        "statuses": statuses,
+        "renders_per_second": round(len(latencies) / elapsed, 1),
+        "client_latency": latency_summary(latencies),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-queue", type=int, default=None)
+    parser.add_argument("--cache", action="store_true", help="keep the render cache on")
+    args = parser.parse_args(argv)
+
+    if not args.cache:
+        render.RENDER_CACHE = None  # the two sample bodies would otherwise always hit; workers fork after this
+    service = RenderService(args.workers, args.max_queue)
+    service.warm_up()
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    bodies = load_bodies()
+    try:
+        print(f"{service.workers} workers, queue {service.max_queue}")
+        print("Steady load:", json.dumps(run(server.server_port, bodies, args.requests, args.clients), indent=4))
+        overload = (service.workers + service.max_queue) * 2
+        print(f"Overload ({overload} clients):",
+              json.dumps(run(server.server_port, bodies, overload * 20, overload), indent=4))
+        print("Service /stats:", json.dumps(service.stats(), indent=4))
+    finally:
+        server.shutdown()
+        server.server_close()
+        service.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
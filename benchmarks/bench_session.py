@@ -0,0 +1,252 @@
+import io
+import os
+import sys
+import json
+import time
+import math
+import wave
+import shutil
+import struct
+import argparse
+import tempfile
+import threading
+import contextlib
+import subprocess
+import speech_recognition as sr
+from blindcv import render, session
+from blindcv.tts import Speaker
+from blindcv.stt import RecognizerBackend
+from blindcv.audio_input import AudioInputSession
+from blindcv.vad import VoiceActivityDetector
+from blindcv.parse import KeywordExtractor
+from blindcv.journal import SessionJournal
+from blindcv.service import latency_summary
+
+# End-to-end interview latency without a microphone or a listener: whole
+# sessions run headless, the answers coming from a corpus of recorded WAVs
+# (the replay recognizer: the audio goes through calibration and listening,
+# the transcript comes from the .txt next to it) and speech going to the null
+# TTS engine. Every run reports per-stage times as JSON:
+#   tts          prompts handed to the speaker (no audio plays)
+#   calibration  ambient-noise calibration
+#   listen       capturing an answer from the audio stream
+#   recognize    the recognizer backend
+#   parse        the keyword parser (monologue)
+#   render       PDF layout
+#   write        profile JSON and PDF written to disk
+#   store        the version saved to the profile store
+# "other" is the session's wall time not covered by any stage. Replayed audio
+# is read as fast as the CPU allows, so listen is processing time, not the
+# seconds a user spends talking.
+#
+# --output keeps the report; --baseline compares against an earlier one and
+# exits 1 when a stage got slower by more than --tolerance (and --min-ms), so
+# a regression shows up between commits.
+#   python -m benchmarks.bench_session [--runs 5] [--corpus DIR] [--output t.json] [--baseline old.json]
+#
+# A corpus has one folder per mode (test, monologue) of NNN.wav + NNN.txt
+# answers in the order they are asked; without --corpus one is synthesised.
+
+# test      two questions and their confirmations (Version2.21)
+# monologue self-introduction, then the gaps the parser left (Version3.2)
+SCRIPTS = {
+    "test": ["Alen Alex", "yes", "software engineer", "yes"],
+    "monologue": [
+        "Hi, I am Alenso, a backend developer from Kochi. I studied at n i t Calicut and interned at TCS",
+        "I built a voice based resume builder for blind users in Python",
+    ],
+}
+
+STAGES = ["tts", "calibration", "listen", "recognize", "parse", "render", "write", "store"]
+
+
+# ================== CORPUS ===================
+def synth_speech(path, text, rate=16000, seconds_per_word=0.25, max_seconds=8.0):
+    # Stand-in for a recording: a tone per word, loud enough to read as speech
+    words = text.split()
+    frames = bytearray()
+    per_word = int(rate * min(seconds_per_word, max_seconds / max(len(words), 1)))
+    for i, _ in enumerate(words):
+        freq = 180 + 40 * (i % 5)
+        for n in range(per_word):
+            frames += struct.pack("<h", int(8000 * math.sin(2 * math.pi * freq * n / rate)))
+    with wave.open(path, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(bytes(frames))
+
+
+def synth_corpus(directory):
+    for mode, answers in SCRIPTS.items():
+        folder = os.path.join(directory, mode)
+        os.makedirs(folder)
+        for i, text in enumerate(answers):
+            synth_speech(os.path.join(folder, f"{i:03d}.wav"), text)
+            with open(os.path.join(folder, f"{i:03d}.txt"), "w", encoding="utf-8") as f:
+                f.write(text)
+
+
+# ================== STAGE TIMERS ===================
+class StageTimer:
+    def __init__(self):
+        self.samples = {}
+        self._lock = threading.Lock()
+
+    def add(self, stage, elapsed):
+        with self._lock:
+            self.samples.setdefault(stage, []).append(elapsed)
+
+    def wrap(self, fn, stage):
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self.add(stage, time.perf_counter() - start)
+        return timed
+
+    def wrap_generator(self, fn, stage):
+        # Each step of the generator is listening; what the caller does in between is not
+        def timed(*args, **kwargs):
+            items = fn(*args, **kwargs)
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(items)
+                except StopIteration:
+                    self.add(stage, time.perf_counter() - start)
+                    return
+                self.add(stage, time.perf_counter() - start)
+                yield item
+        return timed
+
+
+@contextlib.contextmanager
+def instrumented(timer):
+    targets = [
+        (Speaker, "speak_prompt", "tts", False),
+        (AudioInputSession, "calibrate", "calibration", False),
+        (AudioInputSession, "calibrate_from", "calibration", False),
+        (sr.Recognizer, "listen", "listen", False),
+        (VoiceActivityDetector, "capture", "listen", False),
+        (AudioInputSession, "stream_phrases", "listen", True),
+        (RecognizerBackend, "transcribe", "recognize", False),
+        (KeywordExtractor, "parse", "parse", False),
+        (session, "render_cv", "render", False),
+        (session, "render_resume", "render", False),
+        (session, "write_output", "write", False),
+        (SessionJournal, "compact", "write", False),
+        (session, "save_version", "store", False),
+    ]
+    originals = [(owner, name, getattr(owner, name)) for owner, name, _, _ in targets]
+    for owner, name, stage, generator in targets:
+        fn = getattr(owner, name)
+        setattr(owner, name, timer.wrap_generator(fn, stage) if generator else timer.wrap(fn, stage))
+    try:
+        yield timer
+    finally:
+        for owner, name, fn in originals:
+            setattr(owner, name, fn)
+
+
+# ================== SESSIONS ===================
+def run_session(mode, corpus, workdir):
+    os.environ["BLINDCV_REPLAY_DIR"] = os.path.join(corpus, mode)
+    output_dir = tempfile.mkdtemp(dir=workdir)
+    timer = StageTimer()
+    with instrumented(timer), contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        if mode == "monologue":
+            result = session.run_monologue(output_dir=output_dir)
+        else:
+            result = session.run_interview(mode, output_dir=output_dir)
+        wall = time.perf_counter() - start
+    if not result or not os.path.exists(result[1]):
+        raise RuntimeError(f"{mode} session produced no PDF")
+    return wall, timer.samples
+
+
+def summarize(runs):
+    walls = [wall for wall, _ in runs]
+    stages = {}
+    for stage in STAGES:
+        per_run = [sum(samples.get(stage, ())) for _, samples in runs]
+        calls = [elapsed for _, samples in runs for elapsed in samples.get(stage, ())]
+        if not calls:
+            continue
+        stages[stage] = dict(latency_summary(calls), calls_per_run=len(calls) / len(runs),
+                             total_ms=latency_summary(per_run)["p50_ms"])
+    covered = [sum(sum(samples.get(stage, ())) for stage in STAGES) for _, samples in runs]
+    stages["other"] = {"total_ms": latency_summary([w - c for w, c in zip(walls, covered)])["p50_ms"]}
+    return {"runs": len(runs), "session": latency_summary(walls), "stages": stages}
+
+
+def regressions(report, baseline, tolerance, min_ms):
+    found = []
+    for mode, result in report["modes"].items():
+        old_stages = baseline.get("modes", {}).get(mode, {}).get("stages", {})
+        for stage, timing in result["stages"].items():
+            old = old_stages.get(stage)
+            if old is None:
+                continue
+            new_ms, old_ms = timing["total_ms"], old["total_ms"]
+            if new_ms > old_ms * (1 + tolerance) and new_ms - old_ms > min_ms:
+                found.append(f"{mode}/{stage}: {old_ms} -> {new_ms} ms per session")
+    return found
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modes", nargs="+", choices=list(SCRIPTS), default=list(SCRIPTS))
+    parser.add_argument("--corpus", help="folder with test/ and monologue/ replay answers")
+    parser.add_argument("--render-cache", action="store_true", help="keep the render cache on (off by default)")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-ms", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    os.environ.update(BLINDCV_STT="replay", BLINDCV_TTS="null", BLINDCV_CONFIRM="each")
+    os.environ.pop("BLINDCV_STORE", None)
+    if not args.render_cache:
+        render.RENDER_CACHE = None
+    workdir = tempfile.mkdtemp()
+    try:
+        corpus = args.corpus
+        if corpus is None:
+            corpus = os.path.join(workdir, "corpus")
+            synth_corpus(corpus)
+        report = {"commit": git_commit(), "python": sys.version.split()[0], "modes": {}}
+        for mode in args.modes:
+            run_session(mode, corpus, workdir)  # warm-up: imports, parser rules, template plans
+            runs = [run_session(mode, corpus, workdir) for _ in range(args.runs)]
+            report["modes"][mode] = summarize(runs)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    text = json.dumps(report, indent=4)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    if args.baseline:
+        with open(args.baseline) as f:
+            found = regressions(report, json.load(f), args.tolerance, args.min_ms)
+        for line in found:
+            print("REGRESSION", line, file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
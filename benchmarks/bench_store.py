@@ -0,0 +1,105 @@
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+from blindcv.service import latency_summary
+from blindcv.store import ProfileStore, import_profiles
+
+# Profile store at scale: bulk-loads N generated profiles (several versions
+# per user) into a fresh database, then times latest() and diff() for random
+# users. For comparison it also times the old way of finding a user's latest
+# CV, listing and parsing every responses_*.json file in a directory, on a
+# smaller directory (it grows linearly with the file count).
+#   python -m benchmarks.bench_store [--profiles 100000] [--files 5000]
+
+FIELDS = ["tag", "city", "education", "experience", "projects", "achievements"]
+
+
+def profiles(rng, count, users):
+    for i in range(count):
+        user = rng.randrange(users)
+        yield {
+            "name": f"User {user}", "email": f"user{user}@example.com", "style": "basic",
+            **{field: f"{field} {rng.randrange(1000)}" for field in FIELDS},
+        }
+
+
+def time_calls(fn, args):
+    samples = []
+    for arg in args:
+        start = time.perf_counter()
+        fn(*arg)
+        samples.append(time.perf_counter() - start)
+    return latency_summary(samples)
+
+
+def scan_latest(directory, email):
+    # What finding a CV took before the store: open every file
+    best = None
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name)) as f:
+            profile = json.load(f)
+        if profile.get("email") == email:
+            best = name
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=100000)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(5)
+    users = args.profiles // 3
+    workdir = tempfile.mkdtemp()
+    try:
+        store = ProfileStore(os.path.join(workdir, "profiles.db"))
+        start = time.perf_counter()
+        items = ((p, f"2025-01-01T00:00:{i % 60:02d}", None) for i, p in enumerate(profiles(rng, args.profiles, users)))
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == 5000:
+                store.save_many(batch)
+                batch = []
+        store.save_many(batch)
+        load = time.perf_counter() - start
+        stats = store.stats()
+        print(f"Loaded {args.profiles} profiles in {load:.1f}s ({args.profiles / load:.0f}/s): {stats}, "
+              f"{os.path.getsize(store.path) / 1e6:.0f} MB")
+
+        emails = [(f"user{rng.randrange(users)}@example.com",) for _ in range(args.lookups)]
+        print("latest():", json.dumps(time_calls(store.latest, emails)))
+        pairs = []
+        for (email,) in emails[:args.lookups // 4]:
+            count = len(store.versions(email))
+            if count > 1:
+                pairs.append((email, count - 1, count))
+        print("diff(latest two):", json.dumps(time_calls(store.diff, pairs)))
+        store.close()
+
+        files = os.path.join(workdir, "files")
+        os.makedirs(files)
+        for i, profile in enumerate(profiles(rng, args.files, args.files // 3)):
+            with open(os.path.join(files, f"responses_20250101_{i // 3600:02d}{i // 60 % 60:02d}{i % 60:02d}.json"), "w") as f:
+                json.dump(profile, f, indent=4)
+        scans = [(files, f"user{rng.randrange(args.files // 3)}@example.com") for _ in range(5)]
+        print(f"Directory scan over {args.files} files:", json.dumps(time_calls(scan_latest, scans)))
+
+        store = ProfileStore(os.path.join(workdir, "imported.db"))
+        start = time.perf_counter()
+        added = import_profiles(store, files)
+        print(f"Importer: {added} versions from {args.files} files in {time.perf_counter() - start:.2f}s")
+        store.close()
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+import re
+import sys
+import random
+import timeit
+from fpdf import FPDF
+from blindcv.qr_cache import add_qr_image
+from blindcv import render
+from blindcv.render import RenderContext, render_cv, render_resume, write_pdf
+from blindcv.template import compile_template, load_template
+
+# Per-render time of the compiled templates vs the hand-written layout
+# classes they replaced (kept below as the baseline; only the two-column
+# list follows the later switch to measured columns). Every profile
+# is first rendered both ways and the PDFs must match byte for byte, apart
+# from the creation date.
+#   python -m benchmarks.bench_templates [repeats]   (from the repo root)
+
+
+# ================== BASELINE: hand-written layouts ===================
+class LegacyClassicPDF(FPDF):
+    def __init__(self, context):
+        super().__init__()
+        self.context = context
+        self.style = context.style
+
+    def header(self):
+        data = self.context.profile
+        self.set_font("Arial", 'B', 16)
+        self.cell(0, 10, data.get("name", "Your Name"), ln=True, align="C")
+        self.set_font("Arial", 'I', 10)
+        self.cell(0, 8, data.get("tag", "Your Tagline"), ln=True, align="C")
+        self.line(10, self.get_y(), 200, self.get_y())
+        self.ln(5)
+
+    def section_title(self, title):
+        self.set_font("Arial", 'B', 13)
+        if self.style == "highlight":
+            self.set_fill_color(220, 240, 255)
+            self.set_text_color(0, 0, 120)
+            self.cell(0, 10, title, ln=True, fill=True)
+            self.set_text_color(0, 0, 0)
+        else:
+            self.cell(0, 10, title, ln=True)
+        self.line(10, self.get_y(), 200, self.get_y())
+        self.ln(4)
+
+    def section_content(self, content):
+        self.set_font("Arial", size=11)
+        for line in content.split(". "):
+            self.multi_cell(0, 8, f"- {line.strip()}")
+        self.ln(2)
+
+    def add_hyperlink(self, label, url):
+        self.set_text_color(0, 0, 255)
+        self.set_font("Arial", 'U', 11)
+        self.cell(0, 8, f"{label}: {url}", ln=True, link=url)
+        self.set_text_color(0, 0, 0)
+
+    def add_qr_code(self, url):
+        add_qr_image(self, url, x=160, y=self.get_y() + 10, w=30)
+
+
+def legacy_render_cv(context, output_pdf):
+    data = context.profile
+    pdf = LegacyClassicPDF(context)
+    pdf.add_page()
+
+    for section in ["education", "experience", "projects", "responsibilities", "achievements"]:
+        pdf.section_title(section.replace("_", " ").upper())
+        pdf.section_content(data.get(section, "Not provided"))
+
+    pdf.section_title("CONTACT")
+    for label in ["email", "github", "linkedin"]:
+        val = data.get(label)
+        if val and val.lower() != "not provided":
+            pdf.add_hyperlink(label.capitalize(), val)
+            if label == "linkedin" and data.get("qr_code", "").lower() == "yes":
+                pdf.add_qr_code(val)
+
+    return write_pdf(pdf, output_pdf)
+
+
+
+class LegacyMinimalistResumePDF(FPDF):
+    def __init__(self, context):
+        super().__init__()
+        self.context = context
+
+    def header(self):
+        data = self.context.profile
+        self.set_font("Times", 'B', 20)
+        self.cell(0, 10, data.get("name", "Your Name").upper(), ln=True, align="C")
+        self.set_font("Times", size=11)
+        contact_line = f"{data.get('location', '')} | {data.get('email', '')} | linkedin.com/in/testuser | github.com/testuser"
+        self.cell(0, 8, contact_line, ln=True, align="C")
+        self.ln(3)
+
+    def section_title(self, title):
+        self.set_font("Times", 'B', 13)
+        self.cell(0, 8, title.upper(), ln=True)
+        self.set_draw_color(150)
+        self.set_line_width(0.3)
+        self.line(10, self.get_y(), 200, self.get_y())
+        self.ln(2)
+
+    def bullet_section(self, lines):
+        self.set_font("Times", size=11)
+        for line in lines:
+            self.multi_cell(0, 6, f"- {line}")
+        self.ln(2)
+
+    def experience_block(self, role, company, duration, bullets):
+        self.set_font("Times", 'B', 12)
+        self.cell(0, 7, f"{company}", ln=True)
+        self.set_font("Times", 'I', 11)
+        self.cell(0, 6, f"{role} | {duration}", ln=True)
+        self.bullet_section(bullets)
+
+    def project_block(self, title, description):
+        self.set_font("Times", 'B', 12)
+        self.cell(0, 7, title, ln=True)
+        self.set_font("Times", size=11)
+        self.multi_cell(0, 6, description)
+        self.ln(1)
+
+    def two_column_list(self, label, items):
+        self.set_font("Times", 'B', 11)
+        self.cell(0, 6, f"{label}:", ln=True)
+        self.set_font("Times", size=11)
+        half = (len(items) + 1) // 2
+        col1 = items[:half]
+        col2 = items[half:]
+        # Measured columns (the original padded col1 to 40 characters)
+        col_w = max(self.get_string_width(f"{item}") for item in col1) + 10 + 2 * self.c_margin
+        for i in range(len(col1)):
+            self.cell(col_w, 6, f"{col1[i]}", 0, 0)
+            self.cell(0, 6, f"{col2[i]}" if i < len(col2) else "", 0, 1)
+        self.ln(1)
+
+
+def legacy_render_resume(context, output_pdf):
+    data = context.profile
+    pdf = LegacyMinimalistResumePDF(context)
+    pdf.set_auto_page_break(auto=False, margin=10)
+    pdf.add_page()
+
+    pdf.section_title("Education")
+    pdf.multi_cell(0, 6, data.get("education", "Not provided"))
+    pdf.ln(2)
+
+    if data.get("experience"):
+        pdf.section_title("Experience")
+        for exp in data["experience"]:
+            pdf.experience_block(exp["role"], exp["company"], exp["duration"], exp["bullets"])
+
+    if data.get("projects"):
+        pdf.section_title("Projects")
+        for proj in data["projects"]:
+            pdf.project_block(proj["title"], proj["description"])
+
+    if data.get("skills"):
+        pdf.section_title("Technical Skills")
+        pdf.two_column_list("Skills", data["skills"])
+
+    if data.get("interests"):
+        pdf.section_title("Interests")
+        pdf.two_column_list("Areas of Interest", data["interests"])
+
+    return write_pdf(pdf, output_pdf)
+
+
+# ================== PROFILES ===================
+WORDS = ("built designed led shipped a voice based resume tool for blind users with python "
+         "and apis at a startup in kochi improving latency by forty percent").split()
+
+
+def sentence(rng, n):
+    return " ".join(rng.choice(WORDS) for _ in range(n)).capitalize()
+
+
+def classic_profile(rng, style):
+    paragraph = lambda: ". ".join(sentence(rng, rng.randint(5, 25)) for _ in range(rng.randint(1, 4)))
+    return {
+        "name": sentence(rng, 2), "tag": sentence(rng, 3), "style": style,
+        "education": paragraph(), "experience": paragraph(), "projects": paragraph(),
+        "responsibilities": paragraph(), "achievements": paragraph(),
+        "email": "user@example.com", "github": "https://github.com/user",
+        "linkedin": rng.choice(["https://linkedin.com/in/user", "Not provided"]),
+        "qr_code": rng.choice(["yes", "no"]),
+    }
+
+
+def minimalist_profile(rng):
+    return {
+        "name": sentence(rng, 2), "location": "Kochi", "email": "user@example.com",
+        "education": sentence(rng, 12),
+        "experience": [{"company": sentence(rng, 2), "role": sentence(rng, 2), "duration": "6 months",
+                        "bullets": [sentence(rng, rng.randint(4, 20)) for _ in range(rng.randint(1, 3))]}
+                       for _ in range(rng.randint(0, 2))],
+        "projects": [{"title": sentence(rng, 3), "description": sentence(rng, rng.randint(8, 40))}
+                     for _ in range(rng.randint(0, 2))],
+        "skills": [rng.choice(WORDS) for _ in range(rng.randint(0, 7))],
+        "interests": [rng.choice(WORDS) for _ in range(rng.randint(0, 4))],
+    }
+
+
+CREATION_DATE = re.compile(rb"/CreationDate \(D:\d+\)")
+
+
+def same_pdf(a, b):
+    return CREATION_DATE.sub(b"", a) == CREATION_DATE.sub(b"", b)
+
+
+def best_of(fn, repeats):
+    return min(timeit.repeat(fn, number=1, repeat=repeats)) * 1000
+
+
+def main(repeats=5):
+    render.RENDER_CACHE = None  # time the drawing, not the PDF cache
+    rng = random.Random(7)
+    suites = {
+        "basic": (legacy_render_cv, render_cv, [classic_profile(rng, "basic") for _ in range(100)]),
+        "highlight": (legacy_render_cv, render_cv, [classic_profile(rng, "highlight") for _ in range(100)]),
+        "minimalist": (legacy_render_resume, render_resume, [minimalist_profile(rng) for _ in range(100)]),
+    }
+
+    for name, (legacy, compiled, profiles) in suites.items():
+        for profile in profiles:
+            context = RenderContext(profile)
+            assert same_pdf(legacy(context, None), compiled(context, None)), (name, profile)
+
+    compile_ms = best_of(lambda: [compile_template(load_template(n), n) for n in suites], repeats)
+    print(f"Compiling all three templates: {compile_ms:.2f} ms (once per process)")
+    print(f"{'template':>11} {'legacy ms':>10} {'compiled ms':>12}   per render, {len(profiles)} profiles")
+    for name, (legacy, compiled, profiles) in suites.items():
+        contexts = [RenderContext(p) for p in profiles]
+        old = best_of(lambda: [legacy(c, None) for c in contexts], repeats) / len(contexts)
+        new = best_of(lambda: [compiled(c, None) for c in contexts], repeats) / len(contexts)
+        print(f"{name:>11} {old:>10.3f} {new:>12.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,63 @@
+import sys
+import json
+import random
+from blindcv import render
+from blindcv.render import LAYOUTS, PlanPDF, RenderContext, detect_template
+from blindcv.text_metrics import TEXT_CACHE
+from benchmarks.bench_templates import classic_profile, minimalist_profile, same_pdf, best_of
+
+# Render time with and without the text measurement cache (string widths and
+# multi_cell line breaks, text_metrics.py). The batch mixes generated
+# profiles with repeats of the sample profiles, the way a bulk run sees the
+# same section titles, skills and boilerplate over and over. Every profile is
+# rendered both ways first and the PDFs must match byte for byte.
+#   python -m benchmarks.bench_text_cache [repeats]   (from the repo root)
+
+SAMPLES = ["Files/responses_20250406_201204.json", "parsed_monologue_cv.json"]
+
+
+def profiles(rng, n=300):
+    samples = []
+    for path in SAMPLES:
+        with open(path, encoding="latin-1") as f:
+            samples.append(json.load(f))
+    batch = []
+    for i in range(n):
+        pick = i % 3
+        if pick == 0:
+            batch.append(classic_profile(rng, rng.choice(["basic", "highlight"])))
+        elif pick == 1:
+            batch.append(minimalist_profile(rng))
+        else:
+            batch.append(rng.choice(samples))
+    return batch
+
+
+def render_bytes(profile):
+    return LAYOUTS[detect_template(profile)](RenderContext(profile), None)
+
+
+def main(repeats=5):
+    render.RENDER_CACHE = None  # time the drawing, not the PDF cache
+    batch = profiles(random.Random(11))
+
+    for profile in batch:
+        PlanPDF.text_cache = None
+        plain = render_bytes(profile)
+        PlanPDF.text_cache = TEXT_CACHE
+        assert same_pdf(plain, render_bytes(profile)), profile
+
+    PlanPDF.text_cache = None
+    before = best_of(lambda: [render_bytes(p) for p in batch], repeats) / len(batch)
+    PlanPDF.text_cache = TEXT_CACHE
+    TEXT_CACHE.clear()
+    after = best_of(lambda: [render_bytes(p) for p in batch], repeats) / len(batch)
+
+    print(f"{len(batch)} profiles, per render: uncached {before:.3f} ms, cached {after:.3f} ms "
+          f"({(1 - after / before) * 100:.0f}% faster)")
+    # Hit ratios across all repeats; the first pass over the batch is the cold one
+    print("Cache:", json.dumps(TEXT_CACHE.stats(), indent=4))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
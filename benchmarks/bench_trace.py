@@ -0,0 +1,58 @@
+import os
+import sys
+import random
+import shutil
+import timeit
+import tempfile
+from blindcv import render, trace
+from blindcv.render import RenderContext, render_cv
+from benchmarks.bench_templates import classic_profile, best_of
+
+# Cost of the tracing layer (trace.py): per call of an empty function with
+# and without @traced and of an empty `with span()`, tracing off, on with
+# metrics only, and on writing JSON lines; then the same for a whole render,
+# where it should disappear in the noise.
+#   python -m benchmarks.bench_trace [repeats]   (from the repo root)
+
+
+def plain():
+    pass
+
+
+@trace.traced("bench")
+def decorated():
+    pass
+
+
+def with_span():
+    with trace.span("bench", n=1):
+        pass
+
+
+def per_call_ns(fn, number=200000):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e9
+
+
+def main(repeats=5):
+    render.RENDER_CACHE = None
+    rng = random.Random(1)
+    profiles = [classic_profile(rng, "basic") for _ in range(100)]
+    render_all = lambda: [render_cv(RenderContext(p), None) for p in profiles]
+    directory = tempfile.mkdtemp()
+    try:
+        modes = [("off", lambda: trace.disable()),
+                 ("metrics", lambda: trace.enable()),
+                 ("jsonl", lambda: trace.enable(os.path.join(directory, "trace.jsonl")))]
+        print(f"plain function: {per_call_ns(plain):.0f} ns")
+        for name, switch in modes:
+            switch()
+            print(f"tracing {name:8} @traced {per_call_ns(decorated):6.0f} ns   span() {per_call_ns(with_span):6.0f} ns   "
+                  f"render {best_of(render_all, repeats) / len(profiles):.3f} ms")
+        trace.disable()
+    finally:
+        trace.disable()
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,100 @@
+import sys
+import math
+import json
+import time
+import random
+import struct
+import speech_recognition as sr
+from blindcv.vad import PROFILES, VoiceActivityDetector
+from blindcv.audio_input import ReplayStream, WavReplaySource
+
+# Answer capture with fixed limits (Recognizer.listen with the interviews'
+# old listen_options) against voice activity detection (vad.py) with each
+# question's profile. The answers are synthetic: room noise, then a tone per
+# word with pauses between sentences, then silence. Per answer:
+#   wait_ms    how long the user waits after they stop talking until capture ends (None if cut)
+#   sent_s     seconds of audio handed to the recognizer (its payload)
+#   cut        the answer was truncated before the user finished
+#   cpu_ms     processing time of the capture
+#   python -m benchmarks.bench_vad
+
+RATE = 16000
+THRESHOLD = 300
+
+# name -> (profile, sentences as word counts, pause between sentences in seconds)
+ANSWERS = {
+    "yes": ("short", [1], 0),
+    "name": ("normal", [3], 0),
+    "email": ("normal", [6], 0),
+    "experience": ("long", [8, 10, 9], 0.9),
+    "projects": ("long", [12, 7], 1.1),
+}
+
+FIXED = {
+    "test": dict(timeout=3, phrase_time_limit=4),
+    "full": dict(timeout=5),
+}
+
+
+def synth_answer(rng, sentences, pause, lead=0.8, tail=3.0, word_seconds=0.3):
+    samples = []
+    noise = lambda seconds: [int(rng.gauss(0, 60)) for _ in range(int(RATE * seconds))]
+    samples += noise(lead)
+    for i, words in enumerate(sentences):
+        if i:
+            samples += noise(pause)
+        for w in range(words):
+            freq = 160 + 30 * (w % 6)
+            samples += [int(3000 * math.sin(2 * math.pi * freq * n / RATE)) for n in range(int(RATE * word_seconds))]
+    speech_end = len(samples)
+    samples += noise(tail)
+    pcm = struct.pack(f"<{len(samples)}h", *samples)
+    return pcm, lead, speech_end / RATE
+
+
+class Source(sr.AudioSource):
+    SAMPLE_RATE = RATE
+    SAMPLE_WIDTH = 2
+    CHUNK = 1024
+
+    def __init__(self, pcm):
+        self.stream = ReplayStream(pcm)
+
+
+def measure(pcm, speech_start, speech_end, capture):
+    source = Source(pcm)
+    start = time.process_time()
+    try:
+        audio = capture(source)
+    except sr.WaitTimeoutError:
+        return {"timeout": True}
+    cpu = time.process_time() - start
+    consumed = source.stream.offset / WavReplaySource.SAMPLE_WIDTH / RATE
+    sent = len(audio.frame_data) / audio.sample_width / RATE
+    cut = consumed < speech_end
+    return {"wait_ms": None if cut else round((consumed - speech_end) * 1000), "sent_s": round(sent, 2),
+            "cut": cut, "cpu_ms": round(cpu * 1000, 2)}
+
+
+def main():
+    rng = random.Random(7)
+    recognizer = sr.Recognizer()
+    recognizer.energy_threshold = THRESHOLD
+    recognizer.dynamic_energy_threshold = False
+    vad = VoiceActivityDetector()
+    report = {}
+    for name, (profile, sentences, pause) in ANSWERS.items():
+        pcm, speech_start, speech_end = synth_answer(rng, sentences, pause)
+        row = {"speech_s": round(speech_end - speech_start, 2), "profile": profile}
+        for label, options in FIXED.items():
+            row[f"fixed_{label}"] = measure(pcm, speech_start, speech_end,
+                                            lambda source: recognizer.listen(source, **options))
+        row["vad"] = measure(pcm, speech_start, speech_end,
+                             lambda source: vad.capture(source, THRESHOLD, PROFILES[profile]))
+        report[name] = row
+    print(json.dumps(report, indent=4))
+    print(json.dumps(vad.stats()))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
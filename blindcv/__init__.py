@@ -0,0 +1,20 @@
+# BlindCVBuilder: voice-driven CV builder for blind and visually impaired users.
+#
+#   tts       spoken prompts (pyttsx3 + pre-synthesized prompt cache)
+#   stt       speech recognition backends and streaming transcription
+#   vad       voice activity detection: when an answer ends, silence trimmed
+#   parse     keyword rules turning a self-introduction into CV fields
+#   render    PDF layouts (finished PDFs cached by content in render_cache)
+#   incremental  re-render after an edit, laying out only the sections it touches
+#   mail      emailing the finished CV (background queue, pooled SMTP, outbox)
+#   smtp_debug  local SMTP stand-in for development and tests
+#   journal   crash-safe answer log an interrupted interview resumes from
+#   store     saved CVs and their versions (SQLite)
+#   session   the voice interviews end to end
+#   interview_server  many interviews at once over TCP, one asyncio task each
+#   trace     per-stage spans and metrics (off unless BLINDCV_TRACE / BLINDCV_METRICS_PORT)
+#   batch     bulk re-rendering across processes
+#
+# Nothing is imported here: pyttsx3, speech_recognition, fpdf and qrcode are
+# only loaded by the modules that use them, so `python -m blindcv render`
+# starts without the audio stack.
@@ -0,0 +1,301 @@
+import math
+import audioop
+from collections import deque
+import speech_recognition as sr
+from .trace import traced
+from .vad import VoiceActivityDetector
+
+# One long-lived microphone for the whole interview. The device is opened and
+# calibrated once; between questions the PyAudio stream is only paused, so the
+# next listen starts immediately instead of reopening the device and spending
+# another half second in adjust_for_ambient_noise. A one-buffer energy probe
+# before each listen triggers a re-calibration only when the room gets
+# noticeably louder or quieter than it was at the last calibration.
+# Given a capture profile, listening ends on voice activity (vad.py) instead
+# of Recognizer.listen's fixed pause and phrase limit.
+
+
+class WavReplaySource(sr.AudioSource):
+    """Plays recorded answers back as if they were spoken into the microphone.
+
+    The WAV files are converted to 16 kHz mono and joined with stretches of
+    silence, so Recognizer.listen splits them into one phrase per file.
+    """
+
+    SAMPLE_RATE = 16000
+    SAMPLE_WIDTH = 2
+    CHUNK = 1024
+    # Reads are not paced in real time, so nothing may be read while a prompt "plays"
+    live = False
+
+    def __init__(self, wav_files, gap_seconds=1.0):
+        self.wav_files = list(wav_files)
+        self.gap_seconds = gap_seconds
+        self.stream = None
+
+    def _pcm(self):
+        gap = b"\0" * int(self.SAMPLE_RATE * self.gap_seconds) * self.SAMPLE_WIDTH
+        parts = [gap]
+        for path in self.wav_files:
+            with sr.AudioFile(path) as source:
+                audio = sr.Recognizer().record(source)
+            parts.append(audio.get_raw_data(convert_rate=self.SAMPLE_RATE, convert_width=self.SAMPLE_WIDTH))
+            parts.append(gap)
+        return b"".join(parts)
+
+    def __enter__(self):
+        self.stream = ReplayStream(self._pcm())
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stream = None
+
+
+class ReplayStream:
+    def __init__(self, pcm):
+        self.pcm = pcm
+        self.offset = 0
+
+    def read(self, size):
+        # size is in frames; an empty read tells Recognizer.listen the stream ended
+        end = self.offset + size * WavReplaySource.SAMPLE_WIDTH
+        chunk = self.pcm[self.offset:end]
+        self.offset = end
+        return chunk
+
+
+class PrependedStream:
+    """Serves buffers captured while arming before reading the live stream again."""
+
+    def __init__(self, buffers, stream):
+        self.buffers = deque(buffers)
+        self.stream = stream
+
+    def read(self, size):
+        if self.buffers:
+            return self.buffers.popleft()
+        return self.stream.read(size)
+
+
+class AudioInputSession:
+    def __init__(self, microphone_factory=None, recognizer=None,
+                 calibration_duration=0.5, drift_ratio=2.0, probe_smoothing=0.5, vad=None):
+        self.microphone_factory = microphone_factory or sr.Microphone
+        self.recognizer = recognizer or sr.Recognizer()
+        self.vad = vad or VoiceActivityDetector()
+        self.calibration_duration = calibration_duration
+        self.drift_ratio = drift_ratio
+        self.probe_smoothing = probe_smoothing
+        self.microphone = None
+        self.source = None
+        self.baseline_energy = None
+        self.ambient_energy = None
+        self.calibrations = 0
+
+    # ---------- lifetime ----------
+    def open(self, calibrate=True):
+        if self.source is None:
+            self.microphone = self.microphone_factory()
+            self.source = self.microphone.__enter__()
+            if calibrate:
+                self.calibrate()
+            self._pause()
+        return self
+
+    def close(self):
+        if self.microphone is not None:
+            self.microphone.__exit__(None, None, None)
+        self.microphone = None
+        self.source = None
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _pyaudio_stream(self):
+        stream = getattr(self.source, "stream", None)
+        return getattr(stream, "pyaudio_stream", None)
+
+    def _resume(self):
+        # Frames buffered while paused would contain the spoken prompt, so the
+        # stream is stopped between listens and restarted clean here.
+        stream = self._pyaudio_stream()
+        if stream is not None and stream.is_stopped():
+            stream.start_stream()
+
+    def _pause(self):
+        stream = self._pyaudio_stream()
+        if stream is not None and not stream.is_stopped():
+            stream.stop_stream()
+
+    # ---------- calibration ----------
+    def _probe(self):
+        buffer = self.source.stream.read(self.source.CHUNK)
+        return audioop.rms(buffer, self.source.SAMPLE_WIDTH) if buffer else 0
+
+    @traced("calibration")
+    def calibrate(self, duration=None):
+        self._resume()
+        self.recognizer.adjust_for_ambient_noise(self.source, duration=duration or self.calibration_duration)
+        self.baseline_energy = self.ambient_energy = max(self._probe(), 1)
+        self.calibrations += 1
+
+    @traced("calibration")
+    def calibrate_from(self, energies, min_seconds=0.25):
+        """Calibrate from buffer energies read while a prompt was playing.
+
+        The prompt leaks into the microphone, so instead of averaging like
+        adjust_for_ambient_noise this takes the quiet gaps between words (a
+        low percentile) as the noise floor. Returns False if there was too
+        little audio to judge.
+        """
+        seconds_per_buffer = self.source.CHUNK / self.source.SAMPLE_RATE
+        if len(energies) * seconds_per_buffer < min_seconds:
+            return False
+        floor = max(sorted(energies)[len(energies) // 5], 1)
+        self.recognizer.energy_threshold = max(floor * self.recognizer.dynamic_energy_ratio, 50)
+        self.baseline_energy = self.ambient_energy = floor
+        self.calibrations += 1
+        return True
+
+    def drifted(self):
+        ratio = self.ambient_energy / self.baseline_energy
+        return ratio > self.drift_ratio or ratio < 1 / self.drift_ratio
+
+    def check_drift(self):
+        energy = max(self._probe(), 1)
+        self.ambient_energy = (self.probe_smoothing * energy
+                               + (1 - self.probe_smoothing) * self.ambient_energy)
+        if self.drifted():
+            self.calibrate()
+
+    # ---------- capture ----------
+    def _capture(self, source, timeout, phrase_time_limit, profile):
+        if profile is None:
+            return self.recognizer.listen(source, timeout=timeout, phrase_time_limit=phrase_time_limit)
+        return self.vad.capture(source, self.recognizer.energy_threshold, profile)
+
+    @traced("listen")
+    def listen(self, timeout=None, phrase_time_limit=None, profile=None):
+        """Capture one answer; with a vad.PROFILES entry as profile, timeout and phrase_time_limit are ignored."""
+        self.open()
+        self._resume()
+        try:
+            self.check_drift()
+            return self._capture(self.source, timeout, phrase_time_limit, profile)
+        finally:
+            self._pause()
+
+    @traced("listen")
+    def listen_after(self, playback_done, barge_in=None, barge_in_ratio=3.0, barge_in_buffers=3,
+                     timeout=None, phrase_time_limit=None, profile=None, on_barge_in=None):
+        """Arm the microphone while a prompt plays and start listening the moment it ends.
+
+        playback_done is a threading.Event set by the player. The device is
+        opened, and on first use calibrated, from the audio read during
+        playback, so no dead air is spent on either afterwards. If barge_in
+        (an Event) is given, a few buffers in a row louder than
+        barge_in_ratio times the threshold set it and capture starts at once,
+        keeping the onset of the answer. on_barge_in() is called right then,
+        to cut a player that cannot poll the event.
+        """
+        self.open(calibrate=False)
+        self._resume()
+        source = self.source
+        stream = source.stream
+        try:
+            energies = []
+            recent = deque(maxlen=barge_in_buffers + 3)
+            loud = 0
+            barged = False
+            if not getattr(source, "live", True):
+                playback_done.wait()
+            while not playback_done.is_set():
+                buffer = stream.read(source.CHUNK)
+                if not buffer:
+                    break
+                energy = audioop.rms(buffer, source.SAMPLE_WIDTH)
+                energies.append(energy)
+                recent.append(buffer)
+                if barge_in is not None and self.calibrations and \
+                        energy > self.recognizer.energy_threshold * barge_in_ratio:
+                    loud += 1
+                    if loud >= barge_in_buffers:
+                        barged = True
+                        barge_in.set()
+                        if on_barge_in is not None:
+                            on_barge_in()
+                        break
+                else:
+                    loud = 0
+
+            if barged:
+                source.stream = PrependedStream(recent, stream)
+            elif not self.calibrations:
+                if not self.calibrate_from(energies):
+                    self.calibrate()
+            elif energies:
+                self.ambient_energy = max(sorted(energies)[len(energies) // 5], 1)
+                if self.drifted():
+                    self.calibrate_from(energies)
+            return self._capture(source, timeout, phrase_time_limit, profile)
+        finally:
+            source.stream = stream
+            self._pause()
+
+    def stream_phrases(self, chunk_pause=0.35, end_pause=None, timeout=None,
+                       max_chunk_seconds=10, preroll_seconds=0.3):
+        """Yield the utterance as AudioData chunks cut at short pauses.
+
+        A pause of chunk_pause seconds closes the current chunk so it can be
+        recognized while the user keeps talking; a pause of end_pause
+        (default: the recognizer's pause_threshold) ends the utterance.
+        """
+        self.open()
+        self._resume()
+        try:
+            self.check_drift()
+            source = self.source
+            seconds_per_buffer = source.CHUNK / source.SAMPLE_RATE
+            end_pause = end_pause or self.recognizer.pause_threshold
+            threshold = self.recognizer.energy_threshold
+            preroll = deque(maxlen=max(1, math.ceil(preroll_seconds / seconds_per_buffer)))
+            frames = []
+            heard = chunk_has_speech = False
+            silence = waited = 0.0
+
+            while True:
+                buffer = source.stream.read(source.CHUNK)
+                if not buffer:
+                    break
+                speaking = audioop.rms(buffer, source.SAMPLE_WIDTH) > threshold
+                if not heard:
+                    if not speaking:
+                        preroll.append(buffer)
+                        waited += seconds_per_buffer
+                        if timeout and waited > timeout:
+                            raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                        continue
+                    heard = True
+                    frames = list(preroll)
+
+                frames.append(buffer)
+                if speaking:
+                    silence = 0.0
+                    chunk_has_speech = True
+                else:
+                    silence += seconds_per_buffer
+                if silence >= end_pause:
+                    break
+                if chunk_has_speech and (silence >= chunk_pause
+                                         or len(frames) * seconds_per_buffer >= max_chunk_seconds):
+                    yield sr.AudioData(b"".join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+                    frames = []
+                    chunk_has_speech = False
+
+            if chunk_has_speech:
+                yield sr.AudioData(b"".join(frames), source.SAMPLE_RATE, source.SAMPLE_WIDTH)
+        finally:
+            self._pause()
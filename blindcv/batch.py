@@ -0,0 +1,114 @@
+import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ALL_COMPLETED, FIRST_COMPLETED, wait
+from .render import LAYOUTS, RenderContext, detect_template
+
+# Bulk CV rendering: re-renders a directory or JSONL file of profiles across a
+# process pool with the layouts from render.py.
+
+WARMUP_PROFILES = {
+    "classic": {"name": "Warm Up", "tag": "Warm Up", "education": "Warm up. Fonts",
+                "email": "warm@up.invalid", "style": "highlight"},
+    "minimalist": {"name": "Warm Up", "education": "Warm up",
+                   "experience": [{"company": "A", "role": "B", "duration": "C", "bullets": ["D"]}],
+                   "projects": [{"title": "A", "description": "B"}], "skills": ["A", "B"]},
+}
+
+
+# ================== INPUT ===================
+def iter_jobs(source, output_dir):
+    """Yield (label, output_pdf, profile, error) for every profile in a directory or JSONL file.
+
+    A profile that is not valid JSON comes back with profile None and the
+    parse error, so one bad file does not stop the batch.
+    """
+    if os.path.isdir(source):
+        names = sorted(n for n in os.listdir(source) if n.endswith(".json"))
+        for name in names:
+            path = os.path.join(source, name)
+            stem = os.path.splitext(name)[0]
+            if stem.startswith("responses_"):
+                stem = "cv_" + stem[len("responses_"):]
+            with open(path, "rb") as f:
+                yield (path, os.path.join(output_dir, stem + ".pdf")) + parse_profile(f.read())
+    else:
+        # Read as bytes so an undecodable line fails on its own, not the whole file
+        with open(source, "rb") as f:
+            for lineno, line in enumerate(f, 1):
+                if line.strip():
+                    label = f"{source}:{lineno}"
+                    yield (label, os.path.join(output_dir, f"cv_{lineno:06d}.pdf")) + parse_profile(line)
+
+
+def parse_profile(data):
+    """(profile, None), or (None, error) when data is not UTF-8 JSON."""
+    try:
+        return json.loads(data.decode("utf-8")), None
+    except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+# ================== WORKER ===================
+def warm_worker(templates):
+    # Push one page through each layout so FPDF's core-font metrics are
+    # loaded before the first real job arrives.
+    for template in templates:
+        LAYOUTS[template](RenderContext(dict(WARMUP_PROFILES[template])), os.devnull)
+
+
+def render_job(profile, output_pdf, template):
+    if template == "auto":
+        template = detect_template(profile)
+    start = time.perf_counter()
+    LAYOUTS[template](RenderContext(profile), output_pdf)
+    return time.perf_counter() - start
+
+
+# ================== DRIVER ===================
+def run_batch(source, output_dir, template="auto", workers=None, max_in_flight=None):
+    os.makedirs(output_dir, exist_ok=True)
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    warm = list(LAYOUTS) if template == "auto" else [template]
+
+    summary = {"rendered": 0, "failed": 0, "failures": [], "render_seconds": 0.0}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=warm_worker, initargs=(warm,)) as pool:
+        pending = {}
+
+        def fail(label, error):
+            summary["failed"] += 1
+            summary["failures"].append({"source": label, "error": error})
+
+        def drain(return_when):
+            done, _ = wait(pending, return_when=return_when)
+            for future in done:
+                label = pending.pop(future)
+                try:
+                    summary["render_seconds"] += future.result()
+                    summary["rendered"] += 1
+                except Exception as e:
+                    fail(label, f"{type(e).__name__}: {e}")
+
+        for label, output_pdf, profile, error in iter_jobs(source, output_dir):
+            if error is not None:
+                fail(label, error)
+                continue
+            # Keep at most max_in_flight jobs queued so huge inputs stay bounded in memory
+            if len(pending) >= max_in_flight:
+                drain(FIRST_COMPLETED)
+            pending[pool.submit(render_job, profile, output_pdf, template)] = label
+        if pending:
+            drain(ALL_COMPLETED)
+
+    elapsed = time.perf_counter() - start
+    total = summary["rendered"] + summary["failed"]
+    summary.update({
+        "total": total,
+        "workers": workers,
+        "elapsed_seconds": round(elapsed, 3),
+        "cvs_per_second": round(summary["rendered"] / elapsed, 2) if elapsed else 0.0,
+        "render_seconds": round(summary["render_seconds"], 3),
+    })
+    return summary
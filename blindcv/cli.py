@@ -0,0 +1,163 @@
+import sys
+import json
+import argparse
+
+# python -m blindcv interview|interview-server|render|batch|serve|smtp-debug|store ...
+# Each subcommand imports its modules when it runs, so `render` and `batch`
+# never load the TTS driver or the speech recognition stack.
+
+TEMPLATES = ["auto", "classic", "minimalist"]
+
+
+def cmd_interview(args):
+    from .session import run_interview, run_monologue
+    if args.mode == "monologue":
+        streaming = False if args.no_streaming else None
+        return 0 if run_monologue(streaming=streaming, output_dir=args.output_dir) else 1
+    run_interview(args.mode, confirm=args.confirm, output_dir=args.output_dir)
+    return 0
+
+
+def cmd_interview_server(args):
+    from .interview_server import serve
+    serve(args.host, args.port, args.output_dir, args.stt_workers, args.work_workers)
+    return 0
+
+
+def cmd_render(args):
+    from .render import render_profile
+    with open(args.profile) as f:
+        profile = json.load(f)
+    if args.output_pdf == "-":
+        # Straight to stdout, nothing touches the disk
+        template = render_profile(profile, sys.stdout.buffer, args.template, args.style)
+        sys.stdout.buffer.flush()
+        print(f"Rendered to stdout ({template})", file=sys.stderr)
+        return 0
+    template = render_profile(profile, args.output_pdf, args.template, args.style)
+    print(f"Rendered {args.output_pdf} ({template})")
+    return 0
+
+
+def cmd_batch(args):
+    from .batch import run_batch
+    summary = run_batch(args.source, args.output_dir, args.template, args.workers, args.max_in_flight)
+    print(f"Rendered {summary['rendered']}/{summary['total']} CVs in {summary['elapsed_seconds']}s "
+          f"({summary['cvs_per_second']} CVs/s, {summary['workers']} workers)")
+    for failure in summary["failures"]:
+        print(f"  FAILED {failure['source']}: {failure['error']}")
+    if args.summary:
+        with open(args.summary, "w") as f:
+            json.dump(summary, f, indent=4)
+    return 1 if summary["failed"] else 0
+
+
+def cmd_serve(args):
+    from .service import serve
+    serve(args.host, args.port, args.socket, args.workers, args.max_queue, args.verbose)
+    return 0
+
+
+def cmd_smtp_debug(args):
+    from .smtp_debug import serve
+    serve(args.host, args.port, args.dir)
+    return 0
+
+
+def cmd_store(args):
+    from .store import ProfileStore, import_profiles
+    store = ProfileStore(args.db)
+    try:
+        if args.store_command == "import":
+            added = import_profiles(store, args.source)
+            print(f"Imported {added} new versions from {args.source}: {store.stats()}")
+            return 0
+        if args.store_command == "latest":
+            result = store.latest(args.user)
+        elif args.store_command == "versions":
+            result = store.versions(args.user)
+        else:
+            result = store.diff(args.user, args.old, args.new)
+        if not result:
+            print(f"No saved CV for {args.user}")
+            return 1
+        print(json.dumps(result, indent=4))
+        return 0
+    finally:
+        store.close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="blindcv", description="Voice-powered CV builder.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    interview = commands.add_parser("interview", help="build a CV by voice")
+    interview.add_argument("--mode", choices=["full", "test", "monologue"], default="full",
+                           help="full questionnaire, two-question test run, or free self-introduction")
+    interview.add_argument("--confirm", choices=["each", "batch"], default=None,
+                           help="confirm every answer, or read them all back at the end")
+    interview.add_argument("--no-streaming", action="store_true",
+                           help="monologue: recognize in one request after the user stops")
+    interview.add_argument("--output-dir", default=".")
+    interview.set_defaults(func=cmd_interview)
+
+    interview_server = commands.add_parser("interview-server", help="run many voice interviews over TCP")
+    interview_server.add_argument("--host", default="127.0.0.1")
+    interview_server.add_argument("--port", type=int, default=8766)
+    interview_server.add_argument("--output-dir", default=".", help="one folder per session is created here")
+    interview_server.add_argument("--stt-workers", type=int, default=8, help="recognitions running at once")
+    interview_server.add_argument("--work-workers", type=int, default=4, help="threads for journal, render and store")
+    interview_server.set_defaults(func=cmd_interview_server)
+
+    render = commands.add_parser("render", help="render one profile JSON to PDF")
+    render.add_argument("profile", help="responses_*.json or parsed monologue JSON")
+    render.add_argument("output_pdf", help="where the PDF goes; - for stdout")
+    render.add_argument("--template", choices=TEMPLATES, default="auto")
+    render.add_argument("--style", choices=["basic", "highlight"], default=None,
+                        help="classic layout style; defaults to the profile's own choice")
+    render.set_defaults(func=cmd_render)
+
+    batch = commands.add_parser("batch", help="render many profiles in parallel")
+    batch.add_argument("source", help="directory of responses_*.json files or a .jsonl file")
+    batch.add_argument("output_dir", help="where the PDFs are written")
+    batch.add_argument("--template", choices=TEMPLATES, default="auto")
+    batch.add_argument("--workers", type=int, default=None)
+    batch.add_argument("--max-in-flight", type=int, default=None)
+    batch.add_argument("--summary", help="also write the summary JSON to this path")
+    batch.set_defaults(func=cmd_batch)
+
+    serve = commands.add_parser("serve", help="run the local HTTP render service")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--socket", help="listen on this Unix socket instead of TCP")
+    serve.add_argument("--workers", type=int, default=None)
+    serve.add_argument("--max-queue", type=int, default=None,
+                       help="requests allowed to wait for a worker before answering 503 (default 8 per worker)")
+    serve.add_argument("--verbose", action="store_true", help="log every request")
+    serve.set_defaults(func=cmd_serve)
+
+    smtp_debug = commands.add_parser("smtp-debug", help="local SMTP stand-in that keeps every message")
+    smtp_debug.add_argument("--host", default="127.0.0.1")
+    smtp_debug.add_argument("--port", type=int, default=8025)
+    smtp_debug.add_argument("--dir", help="also save each message here as .eml")
+    smtp_debug.set_defaults(func=cmd_smtp_debug)
+
+    store = commands.add_parser("store", help="saved CVs and their versions")
+    store.add_argument("--db", default=None, help="database file (BLINDCV_STORE, default profiles.db)")
+    store_commands = store.add_subparsers(dest="store_command", required=True)
+    store_import = store_commands.add_parser("import", help="import responses_*.json files or a .jsonl file")
+    store_import.add_argument("source")
+    for name, help_text in (("latest", "newest version of a user's CV"), ("versions", "every version, oldest first")):
+        sub = store_commands.add_parser(name, help=help_text)
+        sub.add_argument("user", help="email, or name for profiles without one")
+    store_diff = store_commands.add_parser("diff", help="fields that changed between two versions")
+    store_diff.add_argument("user")
+    store_diff.add_argument("old", type=int)
+    store_diff.add_argument("new", type=int)
+    store.set_defaults(func=cmd_store)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
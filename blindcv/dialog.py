@@ -0,0 +1,233 @@
+import re
+import time
+import threading
+from .vad import profile_for
+
+# Question/answer loop behind the guided interviews. The prompt is
+# played on the calling thread (pyttsx3 expects that) while a listener
+# thread arms the microphone: the device is opened and calibrated during the
+# prompt and capture starts the instant playback ends. If the user starts
+# answering before the prompt is over (barge-in), the prompt is cut and the
+# answer is captured from its first syllable.
+#
+# Confirmation strategies:
+#   each   - "You said: X. Should I save this?" after every answer (default)
+#   batch  - record every answer first, then read them back in groups and
+#            re-ask only the fields the user names; answers the recognizer
+#            was unsure about are still confirmed one at a time
+#
+# With vad on, each answer is captured with the profile of its question key
+# (vad.QUESTION_PROFILES): a yes/no ends quickly, a project description may run
+# long.
+
+SKIPPED = "Skipped by user"
+
+DONE_WORDS = {"done", "correct", "nothing", "finished", "no"}
+
+# Fixed lines spoken by the engine, for the prompt-audio cache
+DIALOG_PROMPTS = [
+    "Skipping this question.",
+    "Repeating the question.",
+    "Pausing for a few seconds.",
+    "Okay, let's try again.",
+    "I didn't catch that. Please try again.",
+    "Here is what I recorded.",
+    "Say the name of any field you want to change, or say done.",
+    "Anything else to change? Say a field name, or say done.",
+    "I couldn't match that to a field.",
+]
+
+
+def field_label(key):
+    return key.replace("_", " ")
+
+
+def fields_named(reply, keys):
+    """Keys whose label is said as whole words in reply, except "X is done"/"X is correct"."""
+    cmd = reply.lower()
+    named = []
+    for key in keys:
+        for match in re.finditer(rf"\b{re.escape(field_label(key))}\b", cmd):
+            if not DONE_WORDS & set(re.findall(r"[a-z']+", cmd[match.end():])[:2]):
+                named.append(key)
+                break
+    return named
+
+
+def voice_command(response):
+    """"skip", "repeat" or "pause" if the answer is one of those commands, else None."""
+    cmd = response.lower()
+    for command in ("skip", "repeat", "pause"):
+        if command in cmd:
+            return command
+    return None
+
+
+def confirm_prompt(response):
+    return f"You said: {response}. Should I save this? Say Yes or No."
+
+
+def ask_steps(question, confirm=True, min_confidence=0.75, key=None):
+    """The ask loop without any audio: a generator of what to do next.
+
+    Yields ("listen", text, key), to be answered with send((answer,
+    confidence)), ("say", text), ("pause",) and ("do", fn, args) for work
+    the driver runs where it likes (fn's result is sent back); returns the
+    accepted answer.
+    DialogEngine drives it with the microphone, the interview server over
+    the network (run_steps / InterviewSession.run_steps).
+    """
+    while True:
+        response, confidence = yield ("listen", question, key)
+        if not response:
+            yield ("say", "I didn't catch that. Please try again.")
+            continue
+        command = voice_command(response)
+        if command == "skip":
+            yield ("say", "Skipping this question.")
+            return SKIPPED
+        if command == "repeat":
+            yield ("say", "Repeating the question.")
+            continue
+        if command == "pause":
+            yield ("say", "Pausing for a few seconds.")
+            yield ("pause",)
+            continue
+
+        if not confirm and (confidence is None or confidence >= min_confidence):
+            return response
+        reply, _ = yield ("listen", confirm_prompt(response), "confirm")
+        if reply and "yes" in reply.lower():
+            return response
+        yield ("say", "Okay, let's try again.")
+
+
+def run_steps(steps, listen, say, pause):
+    """Drive ask_steps-style steps with blocking listen(text, key), say(text) and pause()."""
+    reply = None
+    try:
+        while True:
+            action = steps.send(reply)
+            reply = None
+            if action[0] == "listen":
+                reply = listen(action[1], action[2])
+            elif action[0] == "say":
+                say(action[1])
+            elif action[0] == "do":
+                reply = action[1](*action[2])
+            else:
+                pause()
+    except StopIteration as done:
+        return done.value
+
+
+class DialogEngine:
+    def __init__(self, speak, mic, stt, interrupt=None, barge_in=True, pause_seconds=5,
+                 listen_options=None, confirm="each", min_confidence=0.75, group_size=4, vad=True):
+        # speak(text, stop_event) plays a prompt, returning early once stop_event is set;
+        # interrupt() is called on barge-in for players that cannot poll the event.
+        self.speak = speak
+        self.mic = mic
+        self.stt = stt
+        self.interrupt = interrupt
+        self.barge_in = barge_in
+        self.pause_seconds = pause_seconds
+        self.listen_options = listen_options or {}
+        self.confirm = confirm
+        self.min_confidence = min_confidence
+        self.group_size = group_size
+        self.vad = vad
+        self.wall_time = None
+
+    def say(self, text):
+        self.speak(text, None)
+
+    def prompt_and_listen(self, text, key=None):
+        """Speak text and return what the user answered, or None."""
+        return self.prompt_and_transcribe(text, key)[0]
+
+    def prompt_and_transcribe(self, text, key=None):
+        """Speak text and return (answer, confidence); answer is None if nothing was understood."""
+        playback_done = threading.Event()
+        stop = threading.Event() if self.barge_in else None
+        options = dict(self.listen_options, profile=profile_for(key)) if self.vad else self.listen_options
+        result = {}
+
+        def listen():
+            # The prompt is cut the moment the user starts talking, not after the answer
+            try:
+                result["audio"] = self.mic.listen_after(playback_done, barge_in=stop,
+                                                        on_barge_in=self.interrupt, **options)
+            except Exception as e:
+                result["error"] = e
+
+        listener = threading.Thread(target=listen, daemon=True)
+        listener.start()
+        try:
+            self.speak(text, stop)
+        finally:
+            playback_done.set()
+        listener.join()
+
+        if "error" in result:
+            print(f"STT Error: {result['error']}")
+            return None, None
+        try:
+            return self.stt.transcribe(result["audio"])
+        except Exception as e:
+            print(f"STT Error: {e}")
+            return None, None
+
+    def ask(self, question, confirm=True, key=None):
+        """Ask until an answer is accepted; handles skip, repeat and pause.
+
+        With confirm=False the answer is kept without a yes/no round trip
+        unless the recognizer reported a confidence below min_confidence.
+        """
+        steps = ask_steps(question, confirm, self.min_confidence, key)
+        return run_steps(steps, self.prompt_and_transcribe, self.say, lambda: time.sleep(self.pause_seconds))
+
+    def interview(self, questions, answers=None, on_answer=None):
+        """Ask every question in {key: question} and return {key: answer}.
+
+        Keys already in answers (a resumed session) are not asked again;
+        on_answer(key, answer) runs as soon as each answer is accepted.
+        """
+        start = time.perf_counter()
+        batch = self.confirm == "batch"
+        answers = dict(answers or {})
+        for key, question in questions.items():
+            if key not in answers:
+                answers[key] = self.ask(question, confirm=not batch, key=key)
+                if on_answer:
+                    on_answer(key, answers[key])
+        if batch:
+            self.read_back(questions, answers, on_answer)
+        self.wall_time = time.perf_counter() - start
+        print(f"Interview took {self.wall_time:.1f}s with '{self.confirm}' confirmation.")
+        return answers
+
+    def read_back(self, questions, answers, on_answer=None):
+        keys = list(answers)
+        self.say("Here is what I recorded.")
+        for i in range(0, len(keys), self.group_size):
+            group = keys[i:i + self.group_size]
+            self.say(". ".join(f"{field_label(k)}: {answers[k]}" for k in group) + ".")
+
+        prompt = "Say the name of any field you want to change, or say done."
+        while True:
+            reply = self.prompt_and_listen(prompt)
+            if not reply:
+                self.say("I didn't catch that. Please try again.")
+                continue
+            flagged = fields_named(reply, keys)
+            if not flagged:
+                if DONE_WORDS & set(re.findall(r"[a-z']+", reply.lower())):
+                    return answers
+                self.say("I couldn't match that to a field.")
+                continue
+            for key in flagged:
+                answers[key] = self.ask(questions[key], key=key)
+                if on_answer:
+                    on_answer(key, answers[key])
+            prompt = "Anything else to change? Say a field name, or say done."
@@ -0,0 +1,133 @@
+import copy
+from operator import attrgetter
+from .template import get_plan
+from .render import PlanPDF, RenderContext, classic_template, detect_template, write_pdf
+
+# Incremental re-render for edits ("change my email" during a voice session).
+# The renderer keeps, for every template section of its last render, what
+# laying the section out added to the document (page content, links, fonts,
+# images) and the pen state it started and ended in. On the next render a
+# section none of whose fields changed, starting from exactly the state it was
+# recorded from (page, position, font, colours, fonts and images registered
+# so far), is replayed by appending the recorded content; everything else is
+# laid out again. The PDF is byte for byte what a full render makes.
+#
+# An edit that changes a section's height moves every section after it, so
+# those are laid out again too; an edit to a header field, a different
+# template or a changed template file starts from scratch.
+
+# FPDF pen state a section can change and the next one depends on
+PEN = ("x", "y", "lasth", "font_family", "font_style", "font_size_pt", "font_size", "underline",
+       "draw_color", "fill_color", "text_color", "color_flag", "ws", "line_width")
+pen = attrgetter(*PEN)
+
+
+def pen_state(pdf):
+    return pdf.page, tuple(pdf.fonts), tuple(pdf.images), pen(pdf)
+
+
+def changed_fields(old, new):
+    return {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+
+
+class Fragment:
+    """What one section added to a document, and the state it left behind."""
+
+    __slots__ = ("start", "offset", "links_offset", "fonts_offset", "images_offset",
+                 "pages", "links", "fonts", "images", "end", "font")
+
+    def __init__(self, pdf):
+        self.start = pen_state(pdf)
+        self.offset = len(pdf.pages[pdf.page])
+        self.links_offset = len(pdf.page_links.get(pdf.page, ()))
+        self.fonts_offset = len(pdf.fonts)
+        self.images_offset = len(pdf.images)
+
+    def finish(self, pdf):
+        first = self.start[0]
+        pages = range(first, pdf.page + 1)
+        self.pages = [pdf.pages[first][self.offset:]] + [pdf.pages[p] for p in pages[1:]]
+        self.links = [list(pdf.page_links.get(p, ())) for p in pages]
+        self.links[0] = self.links[0][self.links_offset:]
+        # FPDF strips image data from its dicts when writing the document, so keep copies
+        self.fonts = [(key, dict(font)) for key, font in list(pdf.fonts.items())[self.fonts_offset:]]
+        self.images = [(key, dict(info)) for key, info in list(pdf.images.items())[self.images_offset:]]
+        self.end = pen(pdf)
+        self.font = next((key for key, font in pdf.fonts.items() if font is pdf.current_font), None)
+        return self
+
+    def replay(self, pdf):
+        for i, content in enumerate(self.pages):
+            if i:
+                pdf.page += 1
+                pdf.pages[pdf.page] = content
+            else:
+                pdf.pages[pdf.page] += content
+            if self.links[i]:
+                pdf.page_links.setdefault(pdf.page, []).extend(self.links[i])
+        for key, font in self.fonts:
+            pdf.fonts[key] = dict(font)
+        for key, info in self.images:
+            pdf.images[key] = dict(info)
+        for attr, value in zip(PEN, self.end):
+            setattr(pdf, attr, value)
+        if self.font is not None:
+            pdf.current_font = pdf.fonts[self.font]
+            pdf.unifontsubset = pdf.current_font["type"] == "TTF"
+
+
+class IncrementalRenderer:
+    """Renders successive versions of one profile, re-laying out only the sections an edit touches.
+
+    template is a template name, or "auto" to pick it per profile like render_profile.
+    """
+
+    def __init__(self, template="auto"):
+        self.template = template
+        self.profile = None
+        self.plan = None
+        self.fragments = []
+        self.laid_out = 0
+        self.replayed = 0
+
+    def template_for(self, context):
+        if self.template != "auto":
+            return self.template
+        if detect_template(context.profile) == "minimalist":
+            return "minimalist"
+        return classic_template(context.style)
+
+    def render(self, profile, output_pdf=None, style=None):
+        context = RenderContext(profile, style)
+        plan = get_plan(self.template_for(context))
+        dirty = None
+        if plan is self.plan:
+            dirty = changed_fields(self.profile, profile)
+            if dirty & plan.header_fields:
+                dirty = None
+
+        pdf = PlanPDF(context, plan)
+        pdf.add_page()
+        fragments = []
+        previous = self.fragments if dirty is not None else [None] * len(plan.sections)
+        for (fields, ops), old in zip(plan.sections, previous):
+            if old is not None and not fields & dirty and old.start == pen_state(pdf):
+                old.replay(pdf)
+                fragments.append(old)
+                self.replayed += 1
+                continue
+            fragment = Fragment(pdf)
+            for op in ops:
+                op(pdf, profile)
+            fragments.append(fragment.finish(pdf))
+            self.laid_out += 1
+
+        self.profile = copy.deepcopy(profile)  # callers edit their dict in place
+        self.plan = plan
+        self.fragments = fragments
+        return write_pdf(pdf, output_pdf)
+
+    def stats(self):
+        total = self.laid_out + self.replayed
+        return {"laid_out": self.laid_out, "replayed": self.replayed,
+                "replay_ratio": round(self.replayed / total, 3) if total else None}
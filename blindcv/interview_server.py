@@ -0,0 +1,326 @@
+import io
+import os
+import re
+import json
+import time
+import uuid
+import struct
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import speech_recognition as sr
+from .tts import Speaker
+from .stt import load_backend
+from .dialog import DIALOG_PROMPTS, ask_steps
+from .parse import IncrementalParser
+from .journal import SessionJournal
+from .render import RenderContext, render_cv, render_resume, write_output
+from .session import (INTERVIEWS, STATUS_PROMPTS, RESUME_PROMPT, MAIL_WAIT_SECONDS, QUESTION_BANK,
+                      MONOLOGUE_PROMPTS, gap_fill_steps)
+from .vad import VoiceActivityDetector
+from .trace import span
+
+# Many voice interviews on one box (kiosk terminals). Every connection is an
+# interview running as an asyncio task with its own state; the blocking work
+# goes to pools shared by all of them: recognition to the STT pool, journal
+# writes, rendering and the profile store to the work pool, and speech (for
+# clients that want prompt audio) to one speech thread (tts.Speaker). Each
+# session keeps its files in <output_dir>/<session id>/, so nothing is shared
+# between users but the profile store. Answers arrive as whole recordings;
+# the silence around the speech is trimmed (vad.py) before recognition.
+#
+# Protocol: TCP, length-prefixed frames, a 1-byte kind + 4-byte big-endian
+# length + payload.
+#   client -> server   H  hello JSON {"mode": "test"|"full"|"monologue", "session": id to resume, "audio": bool}
+#                      U  one answer, as WAV bytes (the terminal does its own endpointing)
+#   server -> client   S  session JSON {"session", "resumed"}
+#                      P  prompt JSON {"text", "listen"}: listen means an U frame is expected next
+#                      W  WAV of the prompt just sent (only with "audio": true)
+#                      R  result JSON {"json", "pdf", "bytes"}, followed by
+#                      F  the PDF
+#                      E  error JSON {"error"}
+#   python -m blindcv interview-server --port 8766 --output-dir sessions/
+#
+# Answers are confirmed one by one ("each"); the read-back mode needs the
+# single-user dialog.
+
+MAX_FRAME = 16 << 20
+SESSION_ID = re.compile(r"^[0-9a-f]{8,32}$")
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    async def read(self):
+        try:
+            kind, length = struct.unpack(">cI", await self.reader.readexactly(5))
+            if length > MAX_FRAME:
+                raise ProtocolError(f"frame of {length} bytes")
+            return kind, await self.reader.readexactly(length)
+        except asyncio.IncompleteReadError:
+            raise ConnectionResetError("client hung up")
+
+    async def send(self, kind, payload):
+        if isinstance(payload, dict):
+            payload = json.dumps(payload).encode()
+        self.writer.write(struct.pack(">cI", kind, len(payload)) + payload)
+        await self.writer.drain()
+
+
+def decode_wav(data):
+    with sr.AudioFile(io.BytesIO(data)) as source:
+        return sr.Recognizer().record(source)
+
+
+class InterviewSession:
+    """One interview: its connection, recognizer, journal and folder."""
+
+    def __init__(self, server, conn, session_id, mode, audio=False):
+        self.server = server
+        self.conn = conn
+        self.id = session_id
+        self.mode = mode
+        self.audio = audio
+        self.directory = os.path.join(server.output_dir, session_id)
+        self.stt = server.stt_factory()
+        self.journal = None
+        self.turns = []
+
+    # ---------- pools ----------
+    async def work(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.server.work_pool, fn, *args)
+
+    async def recognize(self, wav):
+        def transcribe():
+            return self.stt.transcribe(self.server.vad.trim(decode_wav(wav)))
+        return await asyncio.get_running_loop().run_in_executor(self.server.stt_pool, transcribe)
+
+    # ---------- talking ----------
+    async def say(self, text, listen=False):
+        await self.conn.send(b"P", {"text": text, "listen": listen})
+        if self.audio:
+            wav = await asyncio.wrap_future(self.server.speaker.synthesize(text))
+            if wav:
+                await self.conn.send(b"W", wav)
+
+    async def prompt_and_transcribe(self, text):
+        await self.say(text, listen=True)
+        kind, payload = await self.conn.read()
+        if kind != b"U":
+            raise ProtocolError(f"expected an answer, got {kind!r}")
+        start = time.perf_counter()
+        try:
+            return await self.recognize(payload)
+        except sr.UnknownValueError:
+            return None, None
+        except Exception as e:
+            print(f"[{self.id}] STT Error: {e}")
+            return None, None
+        finally:
+            self.turns.append(time.perf_counter() - start)
+
+    async def run_steps(self, steps):
+        # dialog.run_steps over the wire; "do" work goes to the work pool
+        reply = None
+        try:
+            while True:
+                action = steps.send(reply)
+                reply = None
+                if action[0] == "listen":
+                    reply = await self.prompt_and_transcribe(action[1])
+                elif action[0] == "say":
+                    await self.say(action[1])
+                elif action[0] == "do":
+                    reply = await self.work(action[1], *action[2])
+                else:
+                    await asyncio.sleep(self.server.pause_seconds)
+        except StopIteration as done:
+            return done.value
+
+    # ---------- interviews ----------
+    async def run(self):
+        os.makedirs(self.directory, exist_ok=True)
+        name = "parsed_monologue_cv.json" if self.mode == "monologue" else f"interview_{self.mode}"
+        self.journal = await self.work(SessionJournal, os.path.join(self.directory, name + ".journal"))
+        await self.conn.send(b"S", {"session": self.id, "resumed": self.journal.resumed})
+        if self.journal.resumed:
+            await self.say(RESUME_PROMPT)
+        with span("interview_session", mode=self.mode):
+            if self.mode == "monologue":
+                return await self.run_monologue()
+            return await self.run_guided()
+
+    async def run_guided(self):
+        config = INTERVIEWS[self.mode]
+        for key, question in config["questions"].items():
+            if key not in self.journal.data:
+                answer = await self.run_steps(ask_steps(question, key=key))
+                await self.work(self.journal.set, key, answer)
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        json_file = os.path.join(self.directory, f"responses_{timestamp}.json")
+        pdf_file = os.path.join(self.directory, f"cv_{timestamp}.pdf")
+        await self.work(self.journal.compact, json_file, config["mock_answers"])
+        await self.say("All responses recorded. Generating your CV.")
+        profile, pdf_bytes = await self.finish(json_file, pdf_file, "classic", render_cv)
+        await self.say("Your CV has been created successfully.")
+        email = profile.get("email")
+        if config["email"] and email and "@" in email:
+            await self.say(await self.send_email(email, pdf_bytes, os.path.basename(pdf_file)))
+        return json_file, pdf_file, pdf_bytes
+
+    async def run_monologue(self):
+        if not self.journal.resumed:
+            intro, _ = await self.prompt_and_transcribe("Please introduce yourself. Start speaking now.")
+            if not intro:
+                await self.work(self.journal.discard)
+                await self.say("Sorry, I didn't catch that.")
+                return None
+            parsed = await self.work(IncrementalParser().result, intro)
+            await self.work(self.journal.update, parsed)
+        await self.run_steps(gap_fill_steps(self.journal))
+        json_file = os.path.join(self.directory, "parsed_monologue_cv.json")
+        await self.work(self.journal.compact, json_file)
+        pdf_file = os.path.join(self.directory, "AI_Resume_Final_Auto.pdf")
+        _, pdf_bytes = await self.finish(json_file, pdf_file, "minimalist", render_resume)
+        await self.say("Your resume has been created and saved successfully.")
+        return json_file, pdf_file, pdf_bytes
+
+    async def finish(self, json_file, pdf_file, template, layout):
+        def render_and_save():
+            context = RenderContext.from_json(json_file)
+            pdf_bytes = layout(context, None)
+            write_output(pdf_bytes, pdf_file)
+            self.server.save_version(context.profile, json_file, template, pdf_bytes, pdf_file)
+            return context.profile, pdf_bytes
+        return await self.work(render_and_save)
+
+    async def send_email(self, receiver, pdf_bytes, filename):
+        from . import mail
+        try:
+            delivery = await self.work(mail.get_queue().send, receiver, pdf_bytes, filename)
+            await asyncio.wait_for(asyncio.wrap_future(delivery), MAIL_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            return "Your email is still on its way. I will finish sending it next time."
+        except Exception as e:
+            print(f"[{self.id}] Email failed: {e}")
+            return "I was unable to send the email."
+        return "Your CV has been emailed successfully."
+
+
+class InterviewServer:
+    def __init__(self, output_dir=".", stt_factory=None, stt_workers=8, work_workers=4, speaker=None,
+                 pause_seconds=5):
+        self.output_dir = output_dir
+        # stt_factory() builds each session's own recognizer backend: a shared one
+        # would mix sessions' state (a replay script, the latency report).
+        # Vosk models are loaded once per process either way (stt.load_vosk_model)
+        self.stt_factory = stt_factory or load_backend
+        self.stt_pool = ThreadPoolExecutor(stt_workers, thread_name_prefix="stt")
+        self.work_pool = ThreadPoolExecutor(work_workers, thread_name_prefix="work")
+        self.speaker = speaker or Speaker()
+        self.pause_seconds = pause_seconds
+        self.vad = VoiceActivityDetector()
+        self.store = None
+        self._store_lock = threading.Lock()
+        self.active = set()
+        self.started = self.completed = self.failed = 0
+        self.turns = []
+        self.server = None
+
+    def save_version(self, profile, source, template, pdf_bytes, pdf_path):
+        # One profile store for every session (store.py serialises its writes)
+        from .store import ProfileStore
+        try:
+            with self._store_lock:
+                if self.store is None:
+                    self.store = ProfileStore(os.environ.get("BLINDCV_STORE") or
+                                              os.path.join(self.output_dir, "profiles.db"))
+            user, version = self.store.save(profile, source=source)
+            self.store.record_render(user, version, template, pdf_bytes, pdf_path)
+        except Exception as e:
+            print(f"Profile store unavailable: {e}")
+
+    async def handle(self, reader, writer):
+        conn = Connection(reader, writer)
+        session = None
+        try:
+            kind, payload = await conn.read()
+            hello = json.loads(payload) if kind == b"H" else None
+            if not isinstance(hello, dict) or hello.get("mode", "test") not in ("test", "full", "monologue"):
+                raise ProtocolError("expected a hello frame with mode test, full or monologue")
+            session_id = hello.get("session") or uuid.uuid4().hex
+            if not SESSION_ID.match(session_id):
+                raise ProtocolError("session ids are 8-32 lowercase hex digits")
+            if session_id in self.active:
+                raise ProtocolError(f"session {session_id} is already connected")
+            session = InterviewSession(self, conn, session_id, hello.get("mode", "test"), hello.get("audio", False))
+            self.active.add(session_id)
+            self.started += 1
+            result = await session.run()
+            if result is not None:
+                json_file, pdf_file, pdf_bytes = result
+                await conn.send(b"R", {"json": json_file, "pdf": pdf_file, "bytes": len(pdf_bytes)})
+                await conn.send(b"F", pdf_bytes)
+            self.completed += 1
+        except ConnectionResetError:
+            self.failed += 1  # the journal keeps the answers; reconnect with the same session id
+        except Exception as e:
+            self.failed += 1
+            try:
+                await conn.send(b"E", {"error": f"{type(e).__name__}: {e}"})
+            except ConnectionError:
+                pass
+        finally:
+            writer.close()
+            if session is not None:
+                # Free the id first: every record is already flushed, so a reconnect can replay the journal
+                self.active.discard(session.id)
+                self.turns.extend(session.turns)
+                if session.journal is not None:
+                    await session.work(session.journal.close)  # fsyncs, so off the loop
+
+    async def start(self, host="127.0.0.1", port=8766):
+        self.server = await asyncio.start_server(self.handle, host, port)
+        return self.server
+
+    def stats(self):
+        from .service import latency_summary
+        return {"active": len(self.active), "started": self.started, "completed": self.completed,
+                "failed": self.failed, "recognition": latency_summary(self.turns), "speech": self.speaker.stats(),
+                "vad": self.vad.stats()}
+
+    def close(self):
+        if self.server is not None:
+            self.server.close()
+        self.stt_pool.shutdown()
+        self.work_pool.shutdown()
+        self.speaker.close(5)
+        if self.store is not None:
+            self.store.close()
+
+
+def serve(host="127.0.0.1", port=8766, output_dir=".", stt_workers=8, work_workers=4):
+    server = InterviewServer(output_dir, stt_workers=stt_workers, work_workers=work_workers)
+    # Fixed prompts are synthesised once, so clients asking for audio mostly get cached clips
+    prompts = [q for config in INTERVIEWS.values() for q in config["questions"].values()]
+    server.speaker.warm(prompts + list(QUESTION_BANK.values()) + STATUS_PROMPTS + DIALOG_PROMPTS
+                        + MONOLOGUE_PROMPTS + [RESUME_PROMPT])
+
+    async def main():
+        listener = await server.start(host, port)
+        print(f"Interview server on {host}:{listener.sockets[0].getsockname()[1]}, sessions in {output_dir}")
+        async with listener:
+            await listener.serve_forever()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        print(json.dumps(server.stats(), indent=4))
@@ -0,0 +1,132 @@
+import os
+import json
+import time
+
+# Crash-safe interview progress. Every accepted answer is appended to a
+# journal file as one JSON line, so saving an answer costs one small append
+# instead of rewriting the whole profile. Lines are flushed to the OS at
+# once and fsynced in batches (every fsync_every records or fsync_interval
+# seconds, and always on sync/close): a crashed process loses nothing, a
+# power cut at most the last batch.
+#
+# compact() folds the journal into the final profile JSON atomically
+# (temporary file, fsync, rename) and deletes the journal. A journal left
+# behind by a crash is replayed when it is opened again, so the interview
+# resumes after the last saved answer. Only a torn last line (no newline) is
+# dropped; any other malformed record raises ValueError and the file is left
+# as it is. Blank lines are skipped. Records:
+#   {"op": "set", "key": k, "value": v}       answer for one field
+#   {"op": "append", "key": k, "value": v}    add an item to a list field
+#   {"op": "update", "value": {...}}          several fields at once
+
+
+def write_json_atomic(path, data, indent=4):
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    # The rename itself is only durable once the directory entry is on disk
+    if hasattr(os, "O_DIRECTORY"):
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+class SessionJournal:
+    def __init__(self, path, fsync_every=8, fsync_interval=1.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.data = {}
+        self.records = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._replay()
+        self.resumed = self.records > 0
+        self._file = open(path, "a")
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            return
+        good = 0
+        complete = True
+        with open(self.path, "rb") as f:
+            lines = f.readlines()
+        for number, line in enumerate(lines, 1):
+            if line.strip():
+                try:
+                    self._apply(json.loads(line))
+                except ValueError as e:
+                    if number == len(lines) and not line.endswith(b"\n"):
+                        break  # torn final line from a crash mid-write
+                    # A bad record before the end is not a crash; keep the file for inspection
+                    raise ValueError(f"{self.path} line {number}: malformed journal record ({e})") from None
+                self.records += 1
+            good += len(line)
+            complete = line.endswith(b"\n")
+        if good < os.path.getsize(self.path):
+            with open(self.path, "r+b") as f:
+                f.truncate(good)
+        if good and not complete:
+            with open(self.path, "ab") as f:
+                f.write(b"\n")
+
+    def _apply(self, record):
+        op = record.get("op") if isinstance(record, dict) else None
+        if op in ("set", "append") and "key" in record and "value" in record:
+            if op == "set":
+                self.data[record["key"]] = record["value"]
+            else:
+                items = self.data.setdefault(record["key"], [])
+                if not isinstance(items, list):
+                    raise ValueError(f"cannot append to non-list field {record['key']!r}")
+                items.append(record["value"])
+        elif op == "update" and isinstance(record.get("value"), dict):
+            self.data.update(record["value"])
+        else:
+            raise ValueError(f"unknown journal record {record!r}")
+
+    def _write(self, record):
+        self._file.write(json.dumps(record) + "\n")
+        self._file.flush()
+        self._apply(record)
+        self.records += 1
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+            self.sync()
+
+    def set(self, key, value):
+        self._write({"op": "set", "key": key, "value": value})
+
+    def append(self, key, value):
+        self._write({"op": "append", "key": key, "value": value})
+
+    def update(self, values):
+        self._write({"op": "update", "value": values})
+
+    def sync(self):
+        if self._unsynced:
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def discard(self):
+        """Close and delete the journal, dropping whatever it recorded."""
+        self.close()
+        os.remove(self.path)
+
+    def compact(self, profile_path, extra=None):
+        """Write the profile (plus extra fields) to profile_path atomically and drop the journal."""
+        self.close()
+        write_json_atomic(profile_path, dict(self.data, **(extra or {})))
+        os.remove(self.path)
+        return profile_path
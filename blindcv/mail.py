@@ -0,0 +1,300 @@
+import os
+import time
+import uuid
+import queue
+import smtplib
+import threading
+from concurrent.futures import Future
+from email import message_from_binary_file
+from email.mime.multipart import MIMEMultipart
+from email.mime.application import MIMEApplication
+from email.mime.text import MIMEText
+from .trace import traced
+
+# Emails the finished CV to the address the user gave in the interview.
+# Delivery runs in the background: MailQueue.enqueue() writes the message to
+# an on-disk outbox first (so it survives a crash) and returns a Future;
+# worker threads send it over pooled SMTP connections that stay logged in
+# between messages, retrying transient failures with exponential backoff.
+# Whatever is still in the outbox is sent again when the next queue starts.
+#
+# Environment:
+#   BLINDCV_SMTP_HOST, BLINDCV_SMTP_PORT        server (smtp.gmail.com:587)
+#   BLINDCV_SMTP_USER, BLINDCV_SMTP_PASSWORD    sender login
+#   BLINDCV_SMTP_TLS    0 skips STARTTLS, e.g. for the debug server (smtp_debug.py)
+#   BLINDCV_OUTBOX      undelivered messages (~/.blindcv/outbox)
+
+SENDER_EMAIL = "your_email@gmail.com"
+SENDER_PASSWORD = "your_app_password"
+SMTP_HOST = "smtp.gmail.com"
+SMTP_PORT = 587
+
+SUBJECT = "Your CV from BlindCVBuilder"
+BODY = "Hello! Attached is the CV you just created."
+
+
+def smtp_config():
+    return {
+        "host": os.environ.get("BLINDCV_SMTP_HOST", SMTP_HOST),
+        "port": int(os.environ.get("BLINDCV_SMTP_PORT", SMTP_PORT)),
+        "user": os.environ.get("BLINDCV_SMTP_USER", SENDER_EMAIL),
+        "password": os.environ.get("BLINDCV_SMTP_PASSWORD", SENDER_PASSWORD),
+        "starttls": os.environ.get("BLINDCV_SMTP_TLS", "1") != "0",
+    }
+
+
+def build_message(receiver_email, pdf_bytes, filename="cv.pdf", sender=None):
+    msg = MIMEMultipart()
+    msg["From"] = sender or smtp_config()["user"]
+    msg["To"] = receiver_email
+    msg["Subject"] = SUBJECT
+    msg.attach(MIMEText(BODY, "plain"))
+
+    part = MIMEApplication(pdf_bytes, Name=filename)
+    part['Content-Disposition'] = f'attachment; filename="{filename}"'
+    msg.attach(part)
+    return msg
+
+
+def is_permanent(error):
+    # 5xx replies (bad address, rejected login, ...) will not succeed on retry
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    return isinstance(error, smtplib.SMTPResponseException) and error.smtp_code >= 500
+
+
+# ================== CONNECTIONS ===================
+class SMTPPool:
+    """Logged-in SMTP connections kept open between messages."""
+
+    def __init__(self, config=None, size=2, idle_timeout=60, timeout=30):
+        self.config = config or smtp_config()
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.opened = 0
+        self.reused = 0
+        self._idle = []  # (server, last used)
+        self._lock = threading.Lock()
+
+    def connect(self):
+        config = self.config
+        server = smtplib.SMTP(config["host"], config["port"], timeout=self.timeout)
+        try:
+            if config["starttls"]:
+                server.starttls()
+            if config["user"]:
+                server.login(config["user"], config["password"])
+        except Exception:
+            server.close()
+            raise
+        with self._lock:
+            self.opened += 1
+        return server
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                server, last_used = self._idle.pop()
+            # Servers hang up on idle clients; NOOP costs one round trip, a new login several
+            if time.monotonic() - last_used < self.idle_timeout and self.alive(server):
+                with self._lock:
+                    self.reused += 1
+                return server
+            self.discard(server)
+        return self.connect()
+
+    def release(self, server):
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append((server, time.monotonic()))
+                return
+        self.discard(server)
+
+    @staticmethod
+    def alive(server):
+        try:
+            return server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    @staticmethod
+    def discard(server):
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for server, _ in idle:
+            self.discard(server)
+
+
+# ================== OUTBOX ===================
+class Outbox:
+    """One <id>.eml file per undelivered message; permanent failures move to failed/."""
+
+    def __init__(self, directory=None):
+        self.directory = directory or os.environ.get("BLINDCV_OUTBOX") or \
+            os.path.join(os.path.expanduser("~"), ".blindcv", "outbox")
+
+    def path(self, message_id):
+        return os.path.join(self.directory, message_id + ".eml")
+
+    def add(self, msg):
+        os.makedirs(self.directory, exist_ok=True)
+        message_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        path = self.path(message_id)
+        # Written under a temporary name and renamed, so a crash never leaves half a message
+        with open(path + ".tmp", "wb") as f:
+            f.write(msg.as_bytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+        return message_id
+
+    def load(self, message_id):
+        with open(self.path(message_id), "rb") as f:
+            return message_from_binary_file(f)
+
+    def pending(self):
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name[:-4] for name in os.listdir(self.directory) if name.endswith(".eml"))
+
+    def remove(self, message_id):
+        os.remove(self.path(message_id))
+
+    def fail(self, message_id):
+        failed = os.path.join(self.directory, "failed")
+        os.makedirs(failed, exist_ok=True)
+        os.replace(self.path(message_id), os.path.join(failed, message_id + ".eml"))
+
+
+# ================== DELIVERY QUEUE ===================
+class MailQueue:
+    """Background delivery; enqueue() returns at once with a Future of the message id."""
+
+    def __init__(self, pool=None, outbox=None, workers=2, max_attempts=5, backoff=2.0, max_backoff=60.0):
+        self.pool = pool or SMTPPool(size=workers)
+        self.outbox = outbox or Outbox()
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.sent = 0
+        self.retries = 0
+        self.failed = 0
+        self._jobs = queue.Queue()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._threads = [threading.Thread(target=self._worker, name=f"mail-{i}", daemon=True)
+                         for i in range(workers)]
+        for t in self._threads:
+            t.start()
+        self.recovered = self.recover()
+
+    def recover(self):
+        # Messages an earlier run accepted but never delivered
+        pending = self.outbox.pending()
+        for message_id in pending:
+            self._jobs.put((message_id, Future()))
+        return len(pending)
+
+    def enqueue(self, msg):
+        future = Future()
+        self._jobs.put((self.outbox.add(msg), future))
+        return future
+
+    def send(self, receiver_email, pdf_bytes, filename="cv.pdf"):
+        return self.enqueue(build_message(receiver_email, pdf_bytes, filename, self.pool.config["user"]))
+
+    def _worker(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            message_id, future = job
+            try:
+                self._deliver(message_id)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(message_id)
+
+    @traced("send_email")
+    def _deliver(self, message_id):
+        msg = self.outbox.load(message_id)
+        for attempt in range(1, self.max_attempts + 1):
+            server = None
+            try:
+                server = self.pool.acquire()
+                server.send_message(msg)
+            except (smtplib.SMTPException, OSError) as e:
+                if server is not None:
+                    # A reply means the connection still works; anything else, drop it
+                    if isinstance(e, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)):
+                        self.pool.release(server)
+                    else:
+                        self.pool.discard(server)
+                if is_permanent(e):
+                    self.outbox.fail(message_id)
+                    with self._lock:
+                        self.failed += 1
+                    raise
+                if attempt == self.max_attempts:
+                    raise  # still in the outbox for the next run
+                delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+                print(f"Email to {msg['To']} failed ({e}); retry {attempt}/{self.max_attempts - 1} in {delay:g}s")
+                with self._lock:
+                    self.retries += 1
+                if self._stop.wait(delay):
+                    raise
+            else:
+                self.pool.release(server)
+                self.outbox.remove(message_id)
+                with self._lock:
+                    self.sent += 1
+                return
+
+    def stats(self):
+        with self._lock:
+            return {
+                "sent": self.sent,
+                "retries": self.retries,
+                "failed": self.failed,
+                "queued": self._jobs.qsize(),
+                "recovered": self.recovered,
+                "connections_opened": self.pool.opened,
+                "connections_reused": self.pool.reused,
+            }
+
+    def close(self, timeout=None):
+        # Lets queued messages go out first; ones waiting out a backoff stay in the outbox
+        self._stop.set()
+        for _ in self._threads:
+            self._jobs.put(None)
+        for t in self._threads:
+            t.join(timeout)
+        self.pool.close()
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_queue():
+    """The process-wide delivery queue, started (and the outbox replayed) on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = MailQueue()
+        return _queue
+
+
+def send_email(receiver_email, pdf_bytes, filename="cv.pdf"):
+    """Send the rendered CV and wait for delivery; raises on failure."""
+    return get_queue().send(receiver_email, pdf_bytes, filename).result()
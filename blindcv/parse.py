@@ -0,0 +1,165 @@
+import os
+import re
+import copy
+import json
+from .trace import traced
+
+# Turns the spoken self-introduction into CV fields with a rule table
+# (parser_rules.json) instead of hard-coded checks. Each rule has a trigger,
+# either a case-insensitive substring ("keyword") or a regular expression
+# ("regex"), and actions: "set" assigns fields and "append" adds an entry to a
+# list field. Rules fire at most once and are applied in table order.
+#
+# The transcript is lower-cased once. Small tables (the shipped one) then use
+# plain substring checks, which are fastest below ~128 keywords. Larger tables
+# compile every keyword into one trie-shaped regex found in a single
+# left-to-right scan (each search resumes one character after the previous
+# hit, so overlapping keywords are not lost), so the cost barely grows with
+# the number of rules; see benchmarks/bench_keyword_parser.py. Regex rules
+# are compiled one by one, so matches may overlap and backreferences keep
+# their meaning. The group-free ones are also joined into one pattern and
+# scanned once: a transcript where it finds nothing skips every rule, and the
+# rules it reports need no search of their own.
+
+TRIE_MIN_KEYWORDS = 128
+
+DEFAULT_RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parser_rules.json")
+
+
+def trie_pattern(words):
+    """Build a regex matching any of words, shaped as a trie so matching never backtracks across words."""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node):
+        ends_here = "" in node
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        # Greedy "?" keeps trying the longer keyword first
+        return "(?:" + "|".join(branches) + ")" + ("?" if ends_here else "")
+
+    return build(trie)
+
+
+class KeywordExtractor:
+    def __init__(self, rules, defaults=None):
+        self.rules = rules
+        self.defaults = defaults or {}
+
+        keyword_rules = {}
+        regex_rules = []
+        for index, rule in enumerate(rules):
+            if "keyword" in rule:
+                keyword_rules.setdefault(rule["keyword"].lower(), []).append(index)
+            elif "regex" in rule:
+                regex_rules.append(index)
+            else:
+                raise ValueError(f"Rule {index} needs a 'keyword' or 'regex' trigger")
+
+        self.keyword_rules = keyword_rules
+        self.keyword_scan = None
+        if len(keyword_rules) >= TRIE_MIN_KEYWORDS:
+            self.keyword_scan = re.compile(trie_pattern(keyword_rules))
+            # The scan reports the longest keyword starting at each position, so a
+            # match also fires every shorter keyword that is a prefix of it.
+            self.fires = {}
+            for keyword in keyword_rules:
+                self.fires[keyword] = [i for end in range(1, len(keyword) + 1)
+                                       for i in keyword_rules.get(keyword[:end], ())]
+
+        self.regex_rules = [(i, re.compile(rules[i]["regex"], re.IGNORECASE)) for i in regex_rules]
+        self.regex_scan = None
+        # Only group-free rules are joined: a group would shift every later backreference
+        joinable = [i for i, pattern in self.regex_rules if pattern.groups == 0]
+        if joinable:
+            try:
+                self.regex_scan = re.compile("|".join(f"(?P<r{i}>{rules[i]['regex']})" for i in joinable),
+                                             re.IGNORECASE)
+                self.joined = set(joinable)
+            except re.error:
+                pass  # e.g. an inline global flag; every rule is searched on its own
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_RULES_FILE):
+        with open(path, encoding="utf-8") as f:
+            table = json.load(f)
+        return cls(table["rules"], table.get("defaults"))
+
+    def matched_rules(self, text):
+        matched = set()
+        lowered = text.lower()
+        if self.keyword_scan is None:
+            for keyword, indexes in self.keyword_rules.items():
+                if keyword in lowered:
+                    matched.update(indexes)
+        else:
+            search = self.keyword_scan.search
+            found = set()
+            m = search(lowered)
+            while m:
+                found.add(m.group())
+                m = search(lowered, m.start() + 1)
+            for keyword in found:
+                matched.update(self.fires[keyword])
+        if self.regex_rules:
+            skip = set()
+            if self.regex_scan is not None:
+                # A hit fires its rule for certain; no hit at all rules out every joined rule
+                found = {int(m.lastgroup[1:]) for m in self.regex_scan.finditer(text)}
+                matched.update(found)
+                skip = found if found else self.joined
+            for index, pattern in self.regex_rules:
+                if index not in skip and pattern.search(text):
+                    matched.add(index)
+        return sorted(matched)
+
+    @traced("parse")
+    def parse(self, text):
+        parsed = copy.deepcopy(self.defaults)
+        for index in self.matched_rules(text):
+            rule = self.rules[index]
+            for field, value in rule.get("set", {}).items():
+                parsed[field] = copy.deepcopy(value)
+            for field, value in rule.get("append", {}).items():
+                parsed.setdefault(field, []).append(copy.deepcopy(value))
+        return parsed
+
+
+_extractor = None
+
+
+def default_extractor():
+    # parser_rules.json is compiled on first use and shared afterwards
+    global _extractor
+    if _extractor is None:
+        _extractor = KeywordExtractor.from_file()
+    return _extractor
+
+
+def simulate_llm_parser(monologue):
+    return default_extractor().parse(monologue)
+
+
+class IncrementalParser:
+    """Re-parses the transcript each time a streamed chunk lands, so the JSON is ready when speech ends."""
+
+    def __init__(self, extractor=None):
+        self.extractor = extractor or default_extractor()
+        self.text = None
+        self.parsed = None
+
+    def feed(self, text):
+        self.text = text
+        self.parsed = self.extractor.parse(text)
+
+    def result(self, monologue):
+        if monologue != self.text:
+            self.feed(monologue)
+        return self.parsed
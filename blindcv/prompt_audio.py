@@ -0,0 +1,162 @@
+import os
+import io
+import wave
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Pre-synthesized audio for the fixed prompts (questions, confirmations,
+# status lines). Each prompt is rendered to WAV once with pyttsx3's
+# save_to_file, kept on disk between runs, and played back from memory, so a
+# turn starts speaking without waiting on the TTS driver. Anything not in the
+# cache (e.g. "You said: ...") still goes through live TTS.
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".blindcv", "prompt_audio")
+
+_pyaudio = None
+_pyaudio_lock = threading.Lock()
+
+
+def get_pyaudio():
+    # One PyAudio instance per process; creating it enumerates every device.
+    global _pyaudio
+    with _pyaudio_lock:
+        if _pyaudio is None:
+            import pyaudio
+            _pyaudio = pyaudio.PyAudio()
+        return _pyaudio
+
+
+def read_wav(data):
+    """Return (sample_width, channels, frame_rate, frames) for WAV bytes."""
+    with wave.open(io.BytesIO(data)) as wf:
+        return wf.getsampwidth(), wf.getnchannels(), wf.getframerate(), wf.readframes(wf.getnframes())
+
+
+def wav_bytes(clip):
+    """WAV file bytes for a (sample_width, channels, frame_rate, frames) clip."""
+    sample_width, channels, frame_rate, frames = clip
+    out = io.BytesIO()
+    with wave.open(out, "wb") as wf:
+        wf.setsampwidth(sample_width)
+        wf.setnchannels(channels)
+        wf.setframerate(frame_rate)
+        wf.writeframes(frames)
+    return out.getvalue()
+
+
+def play_pcm(clip, stop_event=None):
+    sample_width, channels, frame_rate, frames = clip
+    pa = get_pyaudio()
+    stream = pa.open(format=pa.get_format_from_width(sample_width), channels=channels,
+                     rate=frame_rate, output=True)
+    # Written in 50 ms slices so a barge-in can cut the prompt short
+    step = max(1, frame_rate // 20) * sample_width * channels
+    try:
+        for offset in range(0, len(frames), step):
+            if stop_event is not None and stop_event.is_set():
+                break
+            stream.write(frames[offset:offset + step])
+    finally:
+        stream.stop_stream()
+        stream.close()
+
+
+class PromptAudioCache:
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_entries=512, player=play_pcm):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.player = player
+        self.voice = None
+        self.rate = None
+        self.hits = 0
+        self.misses = 0
+        self._clips = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(text, voice, rate):
+        return hashlib.sha1(f"{voice}|{rate}|{text}".encode("utf-8")).hexdigest()
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, key + ".wav")
+
+    def warm(self, engine, prompts):
+        """Synthesize every prompt missing from disk in one runAndWait, then load all into memory."""
+        self.voice, self.rate = engine.getProperty("voice"), engine.getProperty("rate")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        keys = {}
+        queued = False
+        for text in prompts:
+            key = self.key(text, self.voice, self.rate)
+            keys[text] = key
+            if not os.path.exists(self.path_for(key)):
+                engine.save_to_file(text, self.path_for(key))
+                queued = True
+        if queued:
+            engine.runAndWait()
+        for text, key in keys.items():
+            self._load(key)
+        self.evict()
+
+    def _load(self, key):
+        path = self.path_for(key)
+        try:
+            with open(path, "rb") as f:
+                clip = read_wav(f.read())
+        except (OSError, EOFError, wave.Error):
+            # Missing, or a driver that does not write WAV (e.g. AIFF on macOS)
+            return None
+        os.utime(path)  # eviction is least-recently-used by mtime
+        with self._lock:
+            self._clips[key] = clip
+            self._clips.move_to_end(key)
+            while len(self._clips) > self.max_entries:
+                self._clips.popitem(last=False)
+        return clip
+
+    def get(self, text):
+        key = self.key(text, self.voice, self.rate)
+        with self._lock:
+            clip = self._clips.get(key)
+            if clip is not None:
+                self._clips.move_to_end(key)
+        if clip is None:
+            clip = self._load(key)
+        with self._lock:
+            if clip is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return clip
+
+    def play(self, text, stop_event=None):
+        """Play text from the cache; return False if it has to be spoken live."""
+        clip = self.get(text)
+        if clip is None:
+            return False
+        try:
+            self.player(clip, stop_event)
+        except Exception as e:
+            print(f"Prompt playback error: {e}")
+            return False
+        return True
+
+    def evict(self):
+        # Keep the newest max_entries files on disk
+        try:
+            names = [n for n in os.listdir(self.cache_dir) if n.endswith(".wav")]
+        except OSError:
+            return
+        if len(names) <= self.max_entries:
+            return
+        paths = sorted((os.path.join(self.cache_dir, n) for n in names), key=os.path.getmtime)
+        for path in paths[:len(paths) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "in_memory": len(self._clips)}
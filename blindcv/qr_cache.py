@@ -0,0 +1,71 @@
+import zlib
+import threading
+from collections import OrderedDict
+
+# In-memory QR codes for the PDF layouts. Instead of saving a PNG and letting
+# FPDF parse it back, the QR matrix is packed straight into a 1-bit grayscale
+# image in the dict format FPDF keeps in pdf.images, and cached per (url, size).
+# qrcode is imported on the first miss; most CVs never ask for a QR code.
+
+
+def qr_image_info(url, box_size=10, border=4):
+    """Encode url and return an FPDF image info dict (1 bit per pixel, Flate-compressed)."""
+    import qrcode
+    qr = qrcode.QRCode(box_size=box_size, border=border)
+    qr.add_data(url)
+    qr.make(fit=True)
+    matrix = qr.get_matrix()  # already includes the quiet-zone border
+
+    width = len(matrix) * box_size
+    pad = -width % 8
+    rows = []
+    for modules in matrix:
+        # DeviceGray with 1 bit per component: 0 is black, 1 is white
+        bits = "".join(("0" if dark else "1") * box_size for dark in modules) + "1" * pad
+        row = int(bits, 2).to_bytes((width + pad) // 8, "big")
+        rows.append(row * box_size)
+    return {"w": width, "h": width, "cs": "DeviceGray", "bpc": 1, "f": "FlateDecode",
+            "data": zlib.compress(b"".join(rows))}
+
+
+class QRImageCache:
+    """Bounded LRU cache of QR image info dicts, safe to share between threads."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, url, box_size=10):
+        key = (url, box_size)
+        with self._lock:
+            info = self._images.get(key)
+            if info is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return info
+            self.misses += 1
+        info = qr_image_info(url, box_size)
+        with self._lock:
+            self._images[key] = info
+            while len(self._images) > self.maxsize:
+                self._images.popitem(last=False)
+        return info
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._images)}
+
+
+QR_CACHE = QRImageCache()
+
+
+def add_qr_image(pdf, url, x, y, w, box_size=10):
+    # FPDF deletes info["data"] once the document is written, so every
+    # document gets its own shallow copy of the cached entry.
+    name = f"qr:{box_size}:{url}"
+    if name not in pdf.images:
+        pdf.images[name] = dict(QR_CACHE.get(url, box_size), i=len(pdf.images) + 1)
+    pdf.image(name, x=x, y=y, w=w)
@@ -0,0 +1,160 @@
+import os
+import json
+from fpdf import FPDF, FPDF_VERSION
+from .template import get_plan
+from .text_metrics import TEXT_CACHE
+from .render_cache import cache_key, default_cache
+from .trace import span
+
+# The PDF layouts, drawn from the declarative templates in templates/ (see
+# template.py). Everything here is free of audio dependencies, so rendering
+# (the render and batch commands, bulk re-renders) never loads a TTS driver or
+# the speech recognition stack.
+#   classic     - sectioned CV from the guided interview: basic.json or highlight.json
+#   minimalist  - one-page resume from the parsed self-introduction: minimalist.json
+
+
+class RenderContext:
+    """Everything one CV render needs, loaded once before the first page."""
+
+    def __init__(self, profile, style=None):
+        self.profile = profile
+        self.style = (style or profile.get("style") or "basic").lower()
+
+    @classmethod
+    def from_json(cls, json_file):
+        with open(json_file) as f:
+            return cls(json.load(f))
+
+
+# Bytes handed to the destination per write while streaming a finished PDF
+OUTPUT_CHUNK = 64 * 1024
+
+# Part of the render cache key: bump when a drawing change alters the output
+RENDERER_VERSION = f"blindcv-1/fpdf-{FPDF_VERSION}"
+
+# Finished PDFs by content (render_cache.py); None renders every time
+RENDER_CACHE = default_cache()
+
+
+def write_output(data, output_pdf):
+    """Send a finished PDF (bytes, or FPDF's latin-1 str) to output_pdf in one pass.
+
+    output_pdf is a path, anything with write() (BytesIO, an HTTP response,
+    a socket's makefile("wb")), a socket (sendall), or None to get the bytes.
+    """
+    if output_pdf is None:
+        return data.encode("latin-1") if isinstance(data, str) else data
+    if isinstance(output_pdf, (str, os.PathLike)):
+        with open(output_pdf, "wb") as f:
+            return write_output(data, f)
+    write = getattr(output_pdf, "write", None) or output_pdf.sendall
+    for start in range(0, len(data), OUTPUT_CHUNK):
+        chunk = data[start:start + OUTPUT_CHUNK]
+        write(chunk.encode("latin-1") if isinstance(chunk, str) else chunk)
+
+
+def write_pdf(pdf, output_pdf):
+    pdf.close()
+    return write_output(pdf.buffer, output_pdf)  # FPDF 1.7.2 keeps the document as a latin-1 str
+
+
+class PlanPDF(FPDF):
+    """Draws a compiled RenderPlan (template.py); the header plan repeats on every page."""
+
+    # String widths and line breaks come from this cache; None measures every time
+    text_cache = TEXT_CACHE
+
+    def __init__(self, context, plan):
+        super().__init__()
+        self.context = context
+        self.plan = plan
+        if plan.page:
+            self.set_auto_page_break(auto=plan.page.get("auto_page_break", True),
+                                     margin=plan.page.get("margin", 20))
+
+    def header(self):
+        data = self.context.profile
+        for op in self.plan.header:
+            op(self, data)
+
+    def get_string_width(self, s):
+        if self.text_cache is None or self.unifontsubset:
+            return FPDF.get_string_width(self, s)
+        fontkey = self.font_family + self.font_style
+        return self.text_cache.width(fontkey, self.current_font['cw'], s) * self.font_size / 1000.0
+
+    def multi_cell(self, w, h, txt='', border=0, align='J', fill=0, split_only=False):
+        # Replays cached line breaks; anything unusual goes to FPDF's own loop
+        if self.text_cache is None or border or split_only or self.unifontsubset or self.ws:
+            return FPDF.multi_cell(self, w, h, txt, border, align, fill, split_only)
+        if w == 0:
+            w = self.w - self.r_margin - self.x
+        wmax = (w - 2 * self.c_margin) * 1000.0 / self.font_size
+        fontkey = self.font_family + self.font_style
+        lines = self.text_cache.line_breaks(fontkey, self.current_font['cw'], txt, wmax,
+                                            self.font_size, align == 'J', self.k)
+        for ws, tw, line in lines:
+            self.ws = ws
+            if tw:
+                self._out(tw)
+            self.cell(w, h, line, 0, 2, align, fill)
+        self.x = self.l_margin
+        return []
+
+
+def draw_plan(context, plan):
+    pdf = PlanPDF(context, plan)
+    pdf.add_page()
+    data = context.profile
+    for op in plan.body:
+        op(pdf, data)
+    return pdf
+
+
+def render_template(context, template, output_pdf):
+    with span("render", template=template) as s:
+        plan = get_plan(template)
+        cache = RENDER_CACHE
+        if cache is None:
+            return write_pdf(draw_plan(context, plan), output_pdf)
+        key = cache_key(context.profile, template, plan.fingerprint, RENDERER_VERSION)
+        data = cache.get(key)
+        s.set(cached=data is not None)
+        if data is None:
+            data = write_pdf(draw_plan(context, plan), None)
+            cache.put(key, data)
+        return write_output(data, output_pdf)
+
+
+def classic_template(style):
+    # The classic layout ships as two templates; any other style falls back to basic
+    return "highlight" if style == "highlight" else "basic"
+
+
+def render_cv(context, output_pdf):
+    return render_template(context, classic_template(context.style), output_pdf)
+
+
+def render_resume(context, output_pdf):
+    return render_template(context, "minimalist", output_pdf)
+
+
+# ================== DISPATCH ===================
+# template name -> RenderContext-based render function
+LAYOUTS = {
+    "classic": render_cv,
+    "minimalist": render_resume,
+}
+
+
+def detect_template(profile):
+    # responses_*.json keeps experience as free text; the monologue parser emits a list
+    return "minimalist" if isinstance(profile.get("experience"), list) else "classic"
+
+
+def render_profile(profile, output_pdf, template="auto", style=None):
+    if template == "auto":
+        template = detect_template(profile)
+    LAYOUTS[template](RenderContext(profile, style), output_pdf)
+    return template
@@ -0,0 +1,187 @@
+import os
+import json
+import queue
+import atexit
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Finished PDFs by content: the key is a hash of the canonical profile JSON,
+# the template, the hash of the template files it was compiled from and the
+# renderer version, so re-rendering an unchanged profile (re-sending a CV,
+# a batch re-run) returns the stored bytes. Editing a template file changes
+# its hash, so every PDF made from the old version simply stops matching and
+# ages out. A PDF keeps the creation date of its first render.
+#
+# Two tiers, both LRU and size-bounded: memory, then <key>.pdf files in a
+# directory shared by every process (batch and service workers). The disk
+# tier is opt-in: the PDFs hold the users' personal details, so nothing is
+# written anywhere unless a directory is given. Disk
+# writes happen behind the render on a background thread, through a
+# temporary file and a rename, and are flushed at interpreter exit; a cache
+# directory that cannot be written is skipped, never an error.
+#
+# BLINDCV_RENDER_CACHE   directory for the disk tier (unset: memory only); "off" disables the cache
+# BLINDCV_RENDER_CACHE_MB  disk budget in MB (256)
+
+
+def cache_key(profile, template, fingerprint, renderer):
+    canonical = json.dumps([profile, template, fingerprint, renderer], sort_keys=True,
+                           separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    def __init__(self, directory=None, max_memory_bytes=32 << 20, max_disk_bytes=256 << 20):
+        self.directory = directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.memory_bytes = 0
+        self._memory = OrderedDict()
+        self._disk = None  # key -> size, loaded on first use
+        self.disk_bytes = 0
+        self._lock = threading.Lock()
+        # Disk writes happen on a background thread so a miss costs no more than the render
+        self._pending = queue.Queue()
+        self._writer = None
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pdf")
+
+    def _load_disk_index(self):
+        # Oldest first (by mtime, which hits refresh), so eviction pops from the front
+        self._disk = OrderedDict()
+        try:
+            entries = [e for e in os.scandir(self.directory) if e.name.endswith(".pdf")]
+        except OSError:
+            return
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self._disk[entry.name[:-4]] = size
+            self.disk_bytes += size
+
+    def _remember(self, key, data):
+        self._memory[key] = data
+        self.memory_bytes += len(data)
+        while self.memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+            _, old = self._memory.popitem(last=False)
+            self.memory_bytes -= len(old)
+            self.evictions += 1
+
+    def get(self, key):
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return data
+            if self.directory is None:
+                self.misses += 1
+                return None
+            if self._disk is None:
+                self._load_disk_index()
+        try:
+            with open(self._path(key), "rb") as f:
+                data = f.read()
+            os.utime(self._path(key))
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.disk_hits += 1
+            if key in self._disk:
+                self._disk.move_to_end(key)
+            else:  # written by another process
+                self._disk[key] = len(data)
+                self.disk_bytes += len(data)
+            self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        with self._lock:
+            if key not in self._memory:
+                self._remember(key, data)
+            if self.directory is None:
+                return
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_behind, name="render-cache", daemon=True)
+                self._writer.start()
+        self._pending.put((key, data))
+
+    def _write_behind(self):
+        while True:
+            key, data = self._pending.get()
+            try:
+                self._store(key, data)
+            finally:
+                self._pending.task_done()
+
+    def flush(self):
+        """Wait until every PDF handed to put() is on disk."""
+        if self._writer is not None:
+            self._pending.join()
+
+    def _store(self, key, data):
+        with self._lock:
+            if self._disk is None:
+                self._load_disk_index()
+        path = self._path(key)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+        with self._lock:
+            self.disk_bytes += len(data) - self._disk.pop(key, 0)
+            self._disk[key] = len(data)
+            stale = []
+            while self.disk_bytes > self.max_disk_bytes and len(self._disk) > 1:
+                old, size = self._disk.popitem(last=False)
+                self.disk_bytes -= size
+                self.evictions += 1
+                stale.append(old)
+        for old in stale:
+            try:
+                os.remove(self._path(old))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.disk_hits) / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self.memory_bytes,
+                "disk_entries": len(self._disk or ()),
+                "disk_bytes": self.disk_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self.memory_bytes = 0
+            self.hits = self.disk_hits = self.misses = self.evictions = 0
+
+
+def default_cache():
+    directory = os.environ.get("BLINDCV_RENDER_CACHE") or None
+    if directory is not None and directory.lower() in ("off", "0"):
+        return None
+    cache = RenderCache(directory, max_disk_bytes=int(float(os.environ.get("BLINDCV_RENDER_CACHE_MB", 256)) * (1 << 20)))
+    atexit.register(cache.flush)
+    return cache
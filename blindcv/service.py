@@ -0,0 +1,272 @@
+import os
+import json
+import time
+import signal
+import socket
+import threading
+import socketserver
+from collections import deque, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from .batch import warm_worker
+from .render import LAYOUTS, RenderContext, detect_template
+from .incremental import IncrementalRenderer
+
+# Long-lived local render service for the web front end. Worker processes
+# import FPDF and push a page through every layout once at start-up, so a
+# request only pays for its own render. Requests are admitted up to
+# workers + max_queue at a time (rendering or waiting for a worker); past
+# that the service answers 503 with Retry-After instead of letting the queue
+# and latency grow without bound.
+#
+#   POST /render[?template=auto|classic|minimalist&style=basic|highlight&session=<id>]
+#        body: a responses_*.json or parsed_monologue_cv.json profile
+#        200 application/pdf | 400 bad request | 422 render failed | 503 busy
+#        With a session id (the front end's preview while the user edits), the
+#        worker re-renders incrementally from that session's previous render
+#        (incremental.py): sections the edit did not touch are replayed. Each
+#        worker keeps the last SESSION_RENDERERS sessions; a session landing
+#        on another worker just gets a full render there.
+#   GET  /stats    counts, queue depth and p50/p99 latency (JSON)
+#   GET  /health
+
+
+class ServiceBusy(Exception):
+    pass
+
+
+SESSION_RENDERERS = 64
+MAX_SESSION_ID = 128
+
+# (session, template) -> IncrementalRenderer, least recently used first; per worker process
+_renderers = OrderedDict()
+
+
+def session_renderer(session, template):
+    key = (session, template)
+    renderer = _renderers.pop(key, None) or IncrementalRenderer(template)
+    _renderers[key] = renderer
+    while len(_renderers) > SESSION_RENDERERS:
+        _renderers.popitem(last=False)
+    return renderer
+
+
+def render_request(profile, template="auto", style=None, session=None):
+    # Runs in a worker process; returns (pdf_bytes, template, render_seconds)
+    start = time.perf_counter()
+    if session is not None:
+        data = session_renderer(session, template).render(profile, None, style)
+    if template == "auto":
+        template = detect_template(profile)
+    if session is None:
+        data = LAYOUTS[template](RenderContext(profile, style), None)
+    return data, template, time.perf_counter() - start
+
+
+def latency_summary(samples):
+    samples = sorted(samples)
+    if not samples:
+        return {"samples": 0}
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]
+    return {
+        "samples": len(samples),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 2),
+        "p50_ms": round(pick(0.50) * 1000, 2),
+        "p99_ms": round(pick(0.99) * 1000, 2),
+        "max_ms": round(samples[-1] * 1000, 2),
+    }
+
+
+class RenderService:
+    """Process pool with admission control; render() is safe to call from many threads."""
+
+    def __init__(self, workers=None, max_queue=None, latency_window=10000):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = self.workers * 8 if max_queue is None else max_queue
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker,
+                                        initargs=(list(LAYOUTS),))
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_queue)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rendered = 0
+        self.failed = 0
+        self.rejected = 0
+        # Most recent requests only, so /stats reflects current load
+        self.latencies = deque(maxlen=latency_window)
+        self.render_times = deque(maxlen=latency_window)
+
+    def warm_up(self):
+        # The pool starts processes on demand; start them all before taking traffic
+        profile = {"name": "Warm Up", "education": "Warm up"}
+        futures = [self.pool.submit(render_request, profile) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def render(self, profile, template="auto", style=None, session=None):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceBusy(f"{self.workers + self.max_queue} requests already in flight")
+        start = time.perf_counter()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            data, template, render_seconds = self.pool.submit(render_request, profile, template, style,
+                                                              session).result()
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            self._slots.release()
+            with self._lock:
+                self.in_flight -= 1
+        with self._lock:
+            self.rendered += 1
+            self.latencies.append(time.perf_counter() - start)
+            self.render_times.append(render_seconds)
+        return data, template
+
+    def stats(self):
+        with self._lock:
+            latencies = list(self.latencies)
+            render_times = list(self.render_times)
+            stats = {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self.in_flight,
+                "queued": max(0, self.in_flight - self.workers),
+                "rendered": self.rendered,
+                "failed": self.failed,
+                "rejected": self.rejected,
+            }
+        stats["latency"] = latency_summary(latencies)
+        stats["render"] = latency_summary(render_times)
+        return stats
+
+    def close(self):
+        self.pool.shutdown()
+
+
+# ================== HTTP ===================
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so clients can reuse connections
+    # Headers and body go out in two writes; with Nagle on, the body waits for
+    # the client's delayed ACK and every response gains ~40 ms
+    disable_nagle_algorithm = True
+
+    def send_body(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, status, payload, headers=None):
+        self.send_body(status, json.dumps(payload).encode(), "application/json", headers)
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        if path == "/stats":
+            self.send_json(200, self.server.service.stats())
+        elif path == "/health":
+            self.send_json(200, {"status": "ok"})
+        else:
+            self.send_json(404, {"error": f"no route for GET {path}"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if url.path != "/render":
+            return self.send_json(404, {"error": f"no route for POST {url.path}"})
+
+        query = parse_qs(url.query)
+        template = query.get("template", ["auto"])[0]
+        style = query.get("style", [None])[0]
+        session = query.get("session", [None])[0]
+        if template != "auto" and template not in LAYOUTS:
+            return self.send_json(400, {"error": f"unknown template: {template}"})
+        if session is not None and len(session) > MAX_SESSION_ID:
+            return self.send_json(400, {"error": f"session ids are at most {MAX_SESSION_ID} characters"})
+        try:
+            profile = json.loads(body)
+        except ValueError as e:
+            return self.send_json(400, {"error": f"invalid JSON: {e}"})
+        if not isinstance(profile, dict):
+            return self.send_json(400, {"error": "profile must be a JSON object"})
+
+        try:
+            data, template = self.server.service.render(profile, template, style, session)
+        except ServiceBusy as e:
+            return self.send_json(503, {"error": str(e)}, {"Retry-After": "1"})
+        except Exception as e:
+            return self.send_json(422, {"error": f"{type(e).__name__}: {e}"})
+        self.send_body(200, data, "application/pdf", {"X-Template": template})
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class UnixRenderRequestHandler(RenderRequestHandler):
+    disable_nagle_algorithm = False  # TCP_NODELAY does not exist on Unix sockets
+
+
+class RenderHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+    handler_class = RenderRequestHandler
+
+    def __init__(self, address, service, verbose=False):
+        self.service = service
+        self.verbose = verbose
+        super().__init__(address, self.handler_class)
+
+
+class UnixRenderHTTPServer(RenderHTTPServer):
+    address_family = socket.AF_UNIX
+    handler_class = UnixRenderRequestHandler
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = "localhost"
+        self.server_port = 0
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ("unix", 0)
+
+
+def make_server(service, host="127.0.0.1", port=8765, socket_path=None, verbose=False):
+    if socket_path:
+        return UnixRenderHTTPServer(socket_path, service, verbose)
+    return RenderHTTPServer((host, port), service, verbose)
+
+
+def stop_on_sigterm(signum, frame):
+    raise KeyboardInterrupt
+
+
+def serve(host="127.0.0.1", port=8765, socket_path=None, workers=None, max_queue=None, verbose=False):
+    service = RenderService(workers, max_queue)
+    service.warm_up()
+    # Installed after the workers have forked so they keep the default handler
+    signal.signal(signal.SIGTERM, stop_on_sigterm)
+    server = make_server(service, host, port, socket_path, verbose)
+    where = socket_path or f"http://{host}:{server.server_port}"
+    print(f"Render service on {where} ({service.workers} workers, queue {service.max_queue})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print(json.dumps(service.stats(), indent=4))
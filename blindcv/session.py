@@ -0,0 +1,345 @@
+import os
+from datetime import datetime
+from concurrent import futures
+from .tts import Speaker
+from .stt import load_backend, transcribe_streaming
+from .audio_input import AudioInputSession
+from .dialog import DialogEngine, DIALOG_PROMPTS, run_steps
+from .vad import profile_for
+from .parse import IncrementalParser
+from .journal import SessionJournal
+from .trace import traced
+from .render import RenderContext, render_cv, render_resume, write_output
+
+# The voice interviews end to end: ask, listen, save the answers as JSON,
+# render the PDF and (full interview) email it.
+#   full        - every question, answers confirmed, CV emailed (was Version2.1)
+#   test        - name and profession only, mock data for the rest (Version2.2 / 2.21)
+#   monologue   - free self-introduction parsed into fields, gaps asked for (Version3.2)
+#
+# Environment:
+#   BLINDCV_STT, BLINDCV_VOSK_MODEL, BLINDCV_REPLAY_*   recognizer, see stt.py
+#   BLINDCV_TTS         null runs without speech output, see tts.py
+#   BLINDCV_CONFIRM     each (default) | batch, see dialog.py
+#   BLINDCV_VAD         0 listens with the fixed listen_options instead of per-question profiles, see vad.py
+#   BLINDCV_STREAMING   0 recognizes the monologue in one request after it ends
+#   BLINDCV_SMTP_*, BLINDCV_OUTBOX   email delivery, see mail.py
+#   BLINDCV_MAIL_WAIT   seconds to wait for the email before finishing (30)
+#   BLINDCV_STORE       profile store for finished CVs (profiles.db next to the JSON)
+#   BLINDCV_TRACE, BLINDCV_METRICS_PORT   per-stage spans and metrics, see trace.py
+
+QUESTIONS = {
+    "name": "What is your full name?",
+    "date_of_birth": "What is your date of birth? (Please provide in DD/MM/YYYY format)",
+    "country": "Which country do you currently live in?",
+    "city": "Which city do you currently live in?",
+    "phone": "What is your phone number, including the country code?",
+    "email": "What is your email address?",
+    "github": "Do you have a GitHub profile or portfolio link you’d like to include?",
+    "tag": "What do you do for a living?",
+    "linkedin": "Do you have a LinkedIn profile you’d like to share?",
+    "education": "What is your highest degree and the name of your university/college?",
+    "school": "Which school did you attend for your XII (12th grade)?",
+    "experience": "Have you had any internships or job experiences? If yes, mention your position, company, and duration.",
+    "responsibilities": "Have you held any leadership positions in college, clubs, or organizations? Please describe.",
+    "projects": "Have you worked on any academic or personal projects? Provide the title and a brief description.",
+    "achievements": "Have you received any certifications or participated in any competitions? If yes, please specify.",
+    "qr_code": "Would you like to include a QR code linking to your LinkedIn profile? (Yes/No)",
+    "style": "Which CV style do you prefer? Say 'Basic' or 'Highlight'."
+}
+
+# Test mode asks only these two; everything else is mock data
+TEST_QUESTIONS = {
+    "name": "What is your full name?",
+    "tag": "What do you do for a living?"
+}
+
+MOCK_ANSWERS = {
+    "date_of_birth": "01/01/2000",
+    "country": "India",
+    "city": "Kochi",
+    "phone": "+91XXXXXXXXXX",
+    "email": "test@example.com",
+    "github": "https://github.com/testuser",
+    "linkedin": "https://linkedin.com/in/testuser",
+    "education": "B.Tech in Computer Science from XYZ University",
+    "school": "ABC School",
+    "experience": "Software Intern at TestCorp for 6 months",
+    "responsibilities": "Class Representative and Media Club Head",
+    "projects": "Voice Controlled CV Builder using Python",
+    "achievements": "Winner at Inter-College Coding Contest",
+    "qr_code": "yes",
+    "style": "basic"
+}
+
+RESUME_PROMPT = "Welcome back. Let's continue from your last answer."
+
+MAIL_WAIT_SECONDS = float(os.environ.get("BLINDCV_MAIL_WAIT", 30))
+
+STATUS_PROMPTS = [
+    "All responses recorded. Generating your CV.",
+    "Your CV has been created successfully.",
+    "Your CV has been emailed successfully.",
+    "I was unable to send the email.",
+    "Your email is still on its way. I will finish sending it next time.",
+]
+
+# listen_options apply with BLINDCV_VAD=0; otherwise the question's vad profile decides
+INTERVIEWS = {
+    "full": dict(questions=QUESTIONS, mock_answers={}, rate=150, calibration_duration=1,
+                 listen_options=dict(timeout=5), email=True),
+    "test": dict(questions=TEST_QUESTIONS, mock_answers=MOCK_ANSWERS, rate=180, calibration_duration=0.5,
+                 listen_options=dict(timeout=3, phrase_time_limit=4), email=False),
+}
+
+
+class VoiceSession:
+    """Voice, recognizer and microphone shared by every question of one interview."""
+
+    def __init__(self, rate=150, calibration_duration=0.5, stt_config=None):
+        self.speaker = Speaker(rate=rate)
+        self.stt = load_backend(stt_config)
+        # Opened on the first listen and kept for the whole interview
+        self.mic = AudioInputSession(microphone_factory=self.stt.source_factory,
+                                     calibration_duration=calibration_duration)
+        self.vad = os.environ.get("BLINDCV_VAD", "1") != "0"
+
+    def text_to_speech(self, text):
+        self.speaker.text_to_speech(text)
+
+    def dialog(self, listen_options=None, confirm="each"):
+        # Plays each question while the microphone is armed in the background
+        return DialogEngine(self.speaker.speak_prompt, self.mic, self.stt, interrupt=self.speaker.stop,
+                            listen_options=listen_options, confirm=confirm, vad=self.vad)
+
+    def profile(self, key):
+        return profile_for(key) if self.vad else None
+
+    def close(self):
+        self.mic.close()
+        print("STT latency:", self.stt.report())
+        print("TTS queue:", self.speaker.stats())
+        if self.vad:
+            print("VAD:", self.mic.vad.stats())
+
+
+# ================== GUIDED INTERVIEW ===================
+def email_cv(voice, receiver_email, pdf_bytes, filename="cv.pdf"):
+    # Queued for background delivery (mail.py); returns its Future right away
+    from . import mail
+    try:
+        return mail.get_queue().send(receiver_email, pdf_bytes, filename)
+    except Exception as e:
+        print(f"Email failed: {e}")
+        voice.text_to_speech("I was unable to send the email.")
+        return None
+
+
+def announce_delivery(voice, delivery, timeout=MAIL_WAIT_SECONDS):
+    try:
+        delivery.result(timeout)
+    except futures.TimeoutError:
+        # Still in the outbox; the next run sends it
+        voice.text_to_speech("Your email is still on its way. I will finish sending it next time.")
+    except Exception as e:
+        print(f"Email failed: {e}")
+        voice.text_to_speech("I was unable to send the email.")
+    else:
+        voice.text_to_speech("Your CV has been emailed successfully.")
+
+
+def save_version(profile, source, template, pdf_bytes, pdf_path):
+    # Keeps every finished CV as a version in the profile store (store.py)
+    from .store import ProfileStore
+    try:
+        store = ProfileStore(os.environ.get("BLINDCV_STORE") or
+                             os.path.join(os.path.dirname(os.path.abspath(source)), "profiles.db"))
+        try:
+            user, version = store.save(profile, source=source)
+            store.record_render(user, version, template, pdf_bytes, pdf_path)
+        finally:
+            store.close()
+        print(f"Saved as version {version} for {user}")
+    except Exception as e:
+        print(f"Profile store unavailable: {e}")
+
+
+def create_cv(voice, json_file, output_pdf, email=True):
+    # Rendered once in memory: the same bytes are saved and attached.
+    # output_pdf=None skips the file (read-only disks). Returns the email's
+    # delivery Future, or None when nothing was sent
+    context = RenderContext.from_json(json_file)
+    pdf_bytes = render_cv(context, None)
+    if output_pdf:
+        write_output(pdf_bytes, output_pdf)
+    save_version(context.profile, json_file, "classic", pdf_bytes, output_pdf)
+
+    delivery = None
+    recipient_email = context.profile.get("email")
+    if email and recipient_email and "@" in recipient_email:
+        filename = os.path.basename(output_pdf) if output_pdf else "cv.pdf"
+        delivery = email_cv(voice, recipient_email, pdf_bytes, filename)
+    # Spoken while the email goes out
+    voice.text_to_speech("Your CV has been created successfully.")
+    return delivery
+
+
+@traced("interview")
+def run_interview(mode="full", confirm=None, output_dir="."):
+    config = INTERVIEWS[mode]
+    questions = config["questions"]
+    voice = VoiceSession(rate=config["rate"], calibration_duration=config["calibration_duration"])
+    dialog = voice.dialog(config["listen_options"], confirm or os.environ.get("BLINDCV_CONFIRM", "each"))
+
+    status_prompts = STATUS_PROMPTS if config["email"] else STATUS_PROMPTS[:2]
+    voice.speaker.warm(list(questions.values()) + status_prompts + DIALOG_PROMPTS + [RESUME_PROMPT])
+
+    # Each answer is journaled as it is accepted; an interrupted run picks up here
+    journal = SessionJournal(os.path.join(output_dir, f"interview_{mode}.journal"))
+    if journal.resumed:
+        voice.text_to_speech(RESUME_PROMPT)
+    dialog.interview(questions, answers=journal.data, on_answer=journal.set)
+
+    voice.close()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    json_file = os.path.join(output_dir, f"responses_{timestamp}.json")
+    pdf_file = os.path.join(output_dir, f"cv_{timestamp}.pdf")
+    journal.compact(json_file, extra=config["mock_answers"])
+
+    # Spoken on the speech thread while the CV renders
+    voice.speaker.speak("All responses recorded. Generating your CV.")
+    delivery = create_cv(voice, json_file, pdf_file, email=config["email"])
+    if delivery is not None:
+        announce_delivery(voice, delivery)
+    return json_file, pdf_file
+
+
+# ================== MONOLOGUE ===================
+REQUIRED_FIELDS = ["name", "tag", "location", "education", "experience", "projects", "email"]
+QUESTION_BANK = {
+    "name": "What is your full name?",
+    "tag": "What is your profession or role?",
+    "location": "Where are you currently based?",
+    "education": "What is your latest qualification and where did you study?",
+    "experience": "Can you briefly describe your work or internship experience?",
+    "projects": "Tell me about a project you've worked on.",
+    "email": "What is your email address?"
+}
+
+MONOLOGUE_PROMPTS = [
+    "Please introduce yourself. Start speaking now.",
+    "Sorry, I didn't catch that.",
+    "Thanks! I've added your responses.",
+    "Your resume has been created and saved successfully.",
+]
+
+
+def speech_to_text_continuous(voice, key="introduction"):
+    print("Listening... Speak freely, it will stop once you pause.")
+    try:
+        audio = voice.mic.listen(timeout=None, profile=voice.profile(key))
+        response = voice.stt.recognize(audio)
+        print("Captured:", response)
+        return response
+    except Exception as e:
+        print("STT Error:", e)
+        return None
+
+
+def speech_to_text_streaming(voice, on_partial=None):
+    print("Listening... Speak freely, it will stop once you pause.")
+    try:
+        response = transcribe_streaming(voice.mic, voice.stt, on_partial=on_partial)
+    except Exception as e:
+        print("STT Error:", e)
+        return None
+    print("Captured:", response)
+    return response or None
+
+
+def record_gap_answer(journal, field, answer):
+    if field in ["experience", "projects"] and isinstance(journal.data.get(field), list):
+        if field == "experience":
+            journal.append(field, {
+                "company": "User Provided",
+                "role": "Not specified",
+                "duration": "Not specified",
+                "bullets": [answer]
+            })
+        else:
+            journal.append(field, {
+                "title": "User Project",
+                "description": answer
+            })
+    else:
+        journal.set(field, answer)
+
+
+def gap_fill_steps(journal):
+    """Ask for whatever the monologue left out, as dialog.ask_steps-style steps.
+
+    Shared by ai_prompt_filler and the interview server; each answer is
+    journaled at once. Returns True if anything was added.
+    """
+    data = journal.data
+    updated = False
+    for field in REQUIRED_FIELDS:
+        question = QUESTION_BANK.get(field)
+        if question and not data.get(field):
+            answer, _ = yield ("listen", question, field)
+            if answer:
+                yield ("do", record_gap_answer, (journal, field, answer))
+                updated = True
+    if updated:
+        yield ("say", "Thanks! I've added your responses.")
+    return updated
+
+
+@traced("ai_prompt_filler")
+def ai_prompt_filler(voice, journal):
+    def listen(question, field):
+        voice.text_to_speech(question)
+        return speech_to_text_continuous(voice, field), None
+
+    if run_steps(gap_fill_steps(journal), listen, voice.text_to_speech, None):
+        print("✅ Updated JSON with new responses.")
+
+
+@traced("monologue")
+def run_monologue(streaming=None, output_dir="."):
+    if streaming is None:
+        streaming = os.environ.get("BLINDCV_STREAMING", "1") != "0"
+    voice = VoiceSession(rate=175, calibration_duration=0.5)
+    voice.speaker.warm(list(QUESTION_BANK.values()) + MONOLOGUE_PROMPTS + [RESUME_PROMPT])
+
+    json_file = os.path.join(output_dir, "parsed_monologue_cv.json")
+    journal = SessionJournal(json_file + ".journal")
+    if journal.resumed:
+        # The introduction was parsed before the interruption; go straight to the gaps
+        voice.text_to_speech(RESUME_PROMPT)
+    else:
+        voice.text_to_speech("Please introduce yourself. Start speaking now.")
+        parser = IncrementalParser()
+        if streaming:
+            monologue = speech_to_text_streaming(voice, on_partial=parser.feed)
+        else:
+            monologue = speech_to_text_continuous(voice)
+        if not monologue:
+            voice.mic.close()
+            journal.discard()
+            voice.text_to_speech("Sorry, I didn't catch that.")
+            return None
+        journal.update(parser.result(monologue))
+
+    ai_prompt_filler(voice, journal)
+    voice.close()
+    journal.compact(json_file)
+
+    final_pdf = os.path.join(output_dir, "AI_Resume_Final_Auto.pdf")
+    context = RenderContext.from_json(json_file)
+    pdf_bytes = render_resume(context, None)
+    write_output(pdf_bytes, final_pdf)
+    save_version(context.profile, json_file, "minimalist", pdf_bytes, final_pdf)
+    voice.text_to_speech("Your resume has been created and saved successfully.")
+    return json_file, final_pdf
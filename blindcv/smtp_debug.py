@@ -0,0 +1,115 @@
+import os
+import time
+import threading
+import socketserver
+
+# Local SMTP stand-in for development and tests: accepts any login, keeps
+# every message in memory (and optionally as .eml files) and never relays.
+# fail_next makes the next N messages get a temporary 451 so retries can be
+# exercised. No STARTTLS, so point the mailer at it with BLINDCV_SMTP_TLS=0:
+#   python -m blindcv smtp-debug --port 8025 --dir sent/
+#   BLINDCV_SMTP_HOST=127.0.0.1 BLINDCV_SMTP_PORT=8025 BLINDCV_SMTP_TLS=0 python -m blindcv interview --mode full
+
+
+class SMTPDebugHandler(socketserver.StreamRequestHandler):
+    def reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        server = self.server
+        mail_from, recipients = None, []
+        self.reply("220 localhost BlindCV debug SMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command, _, arg = line.decode("latin-1").strip().partition(" ")
+            command = command.upper()
+            if command in ("EHLO", "HELO"):
+                if command == "EHLO":
+                    self.reply("250-localhost")
+                    self.reply("250 AUTH PLAIN LOGIN")
+                else:
+                    self.reply("250 localhost")
+            elif command == "AUTH":
+                if arg.upper().startswith("LOGIN"):
+                    for prompt in ("334 VXNlcm5hbWU6", "334 UGFzc3dvcmQ6"):
+                        self.reply(prompt)
+                        self.rfile.readline()
+                elif arg.upper() == "PLAIN":
+                    self.reply("334 ")
+                    self.rfile.readline()
+                self.reply("235 2.7.0 Authentication successful")
+            elif command == "MAIL":
+                mail_from, recipients = arg.partition(":")[2].strip(), []
+                self.reply("250 OK")
+            elif command == "RCPT":
+                recipients.append(arg.partition(":")[2].strip())
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = []
+                while True:
+                    line = self.rfile.readline()
+                    if not line or line in (b".\r\n", b".\n"):
+                        break
+                    data.append(line[1:] if line.startswith(b"..") else line)
+                self.reply(server.accept(mail_from, recipients, b"".join(data)))
+                mail_from, recipients = None, []
+            elif command == "RSET":
+                mail_from, recipients = None, []
+                self.reply("250 OK")
+            elif command == "NOOP":
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class SMTPDebugServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=8025, directory=None, fail_next=0, verbose=False):
+        super().__init__((host, port), SMTPDebugHandler)
+        self.directory = directory
+        self.fail_next = fail_next
+        self.verbose = verbose
+        self.messages = []  # (mail_from, recipients, raw bytes)
+        self._lock = threading.Lock()
+
+    def accept(self, mail_from, recipients, data):
+        with self._lock:
+            if self.fail_next:
+                self.fail_next -= 1
+                return "451 4.3.0 Debug server: try again later"
+            self.messages.append((mail_from, recipients, data))
+            count = len(self.messages)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, f"{time.strftime('%Y%m%d_%H%M%S')}_{count:04d}.eml"), "wb") as f:
+                f.write(data)
+        if self.verbose:
+            print(f"Mail from {mail_from} to {', '.join(recipients)} ({len(data)} bytes)")
+        return "250 OK"
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+def serve(host="127.0.0.1", port=8025, directory=None):
+    server = SMTPDebugServer(host, port, directory, verbose=True)
+    print(f"Debug SMTP on {host}:{server.server_address[1]}" + (f", saving to {directory}" if directory else ""))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
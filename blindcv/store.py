@@ -0,0 +1,287 @@
+import os
+import re
+import json
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+
+# Saved CVs and their versions in one SQLite file, instead of loose
+# responses_*.json / cv_*.pdf files that have to be listed and parsed to
+# find anything. A user is keyed by email (lower-cased) or, without one, by
+# name; every save of a changed profile becomes that user's next version,
+# and rendered PDFs are recorded by SHA-256 against the version they came
+# from. Indexed by user key, email, timestamp and PDF hash, so latest() and
+# diff() stay at index-lookup cost however many profiles are stored.
+#
+#   python -m blindcv store import Files/            (or a .jsonl file)
+#   python -m blindcv store latest test@example.com
+#   python -m blindcv store diff test@example.com 1 2
+#
+# BLINDCV_STORE   database path (profiles.db in the interview's output directory)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    user_key TEXT NOT NULL UNIQUE,
+    name TEXT,
+    email TEXT
+);
+CREATE INDEX IF NOT EXISTS users_email ON users(email);
+CREATE TABLE IF NOT EXISTS versions (
+    id INTEGER PRIMARY KEY,
+    user_id INTEGER NOT NULL REFERENCES users(id),
+    version INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    source TEXT,
+    profile_hash TEXT NOT NULL,
+    profile TEXT NOT NULL,
+    UNIQUE (user_id, version)
+);
+CREATE INDEX IF NOT EXISTS versions_created ON versions(created_at);
+CREATE INDEX IF NOT EXISTS versions_source ON versions(source);
+CREATE TABLE IF NOT EXISTS renders (
+    version_id INTEGER NOT NULL REFERENCES versions(id),
+    template TEXT NOT NULL,
+    pdf_sha256 TEXT NOT NULL,
+    pdf_path TEXT,
+    rendered_at TEXT NOT NULL,
+    PRIMARY KEY (version_id, template)
+);
+CREATE INDEX IF NOT EXISTS renders_hash ON renders(pdf_sha256);
+"""
+
+# responses_20250406_201204.json -> 2025-04-06T20:12:04
+STAMP = re.compile(r"(\d{8})_(\d{6})")
+
+
+def user_key(profile_or_user):
+    """Email if there is one, else the normalised name: 'test@example.com' or 'name:alen alex'."""
+    if isinstance(profile_or_user, dict):
+        email = str(profile_or_user.get("email") or "")
+        if "@" in email:
+            return email.strip().lower()
+        return "name:" + " ".join(str(profile_or_user.get("name") or "").lower().split())
+    user = str(profile_or_user).strip()
+    if "@" in user or user.startswith("name:"):
+        return user.lower()
+    return "name:" + " ".join(user.lower().split())
+
+
+def profile_hash(profile):
+    return hashlib.sha256(json.dumps(profile, sort_keys=True).encode()).hexdigest()
+
+
+def now():
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def file_timestamp(path):
+    m = STAMP.search(os.path.basename(path))
+    if m:
+        try:
+            return datetime.strptime(m.group(1) + m.group(2), "%Y%m%d%H%M%S").isoformat()
+        except ValueError:
+            pass  # digits that are not a date; fall back to the file time
+    return datetime.fromtimestamp(os.path.getmtime(path)).isoformat(timespec="seconds")
+
+
+def diff_profiles(old, new):
+    """Top-level field changes between two profile dicts."""
+    return {
+        "added": {k: new[k] for k in new if k not in old},
+        "removed": {k: old[k] for k in old if k not in new},
+        "changed": {k: [old[k], new[k]] for k in new if k in old and old[k] != new[k]},
+    }
+
+
+class ProfileStore:
+    def __init__(self, path=None):
+        self.path = path or os.environ.get("BLINDCV_STORE") or "profiles.db"
+        self.db = sqlite3.connect(self.path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self):
+        self.db.close()
+
+    # ---- writing
+    def _save(self, profile, created_at, source):
+        key = user_key(profile)
+        digest = profile_hash(profile)
+        if source:
+            # Importing the same file twice is a no-op
+            known = self.db.execute("SELECT v.version FROM versions v JOIN users u ON u.id = v.user_id "
+                                    "WHERE v.source = ? AND u.user_key = ? AND v.profile_hash = ?",
+                                    (source, key, digest)).fetchone()
+            if known:
+                return key, known[0], False
+        cur = self.db.execute("SELECT id FROM users WHERE user_key = ?", (key,))
+        row = cur.fetchone()
+        email = key if "@" in key else None
+        if row is None:
+            user_id = self.db.execute("INSERT INTO users (user_key, name, email) VALUES (?, ?, ?)",
+                                      (key, profile.get("name"), email)).lastrowid
+            last = None
+        else:
+            user_id = row[0]
+            self.db.execute("UPDATE users SET name = ? WHERE id = ?", (profile.get("name"), user_id))
+            last = self.db.execute("SELECT version, profile_hash FROM versions WHERE user_id = ? "
+                                   "ORDER BY version DESC LIMIT 1", (user_id,)).fetchone()
+        if last is not None and last[1] == digest:
+            return key, last[0], False  # unchanged since the last save
+        version = last[0] + 1 if last else 1
+        self.db.execute("INSERT INTO versions (user_id, version, created_at, source, profile_hash, profile) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (user_id, version, created_at or now(), source, digest, json.dumps(profile)))
+        return key, version, True
+
+    def save(self, profile, created_at=None, source=None):
+        """Store profile as its user's next version; returns (user_key, version)."""
+        with self._lock, self.db:
+            key, version, _ = self._save(profile, created_at, source)
+        return key, version
+
+    def save_many(self, items):
+        """Bulk save of (profile, created_at, source) in one transaction.
+
+        Returns (user_key, version, is_new) per item.
+        """
+        with self._lock, self.db:
+            return [self._save(profile, created_at, source) for profile, created_at, source in items]
+
+    def record_render(self, user, version, template, pdf_bytes, pdf_path=None):
+        """Remember the PDF rendered from a version; returns its SHA-256."""
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        with self._lock, self.db:
+            version_id = self._version_id(user, version)
+            if version_id is None:
+                raise KeyError(f"no version {version} for {user}")
+            self.db.execute("INSERT OR REPLACE INTO renders VALUES (?, ?, ?, ?, ?)",
+                            (version_id, template, digest, pdf_path, now()))
+        return digest
+
+    # ---- reading
+    def _version_id(self, user, version):
+        row = self.db.execute("SELECT v.id FROM versions v JOIN users u ON u.id = v.user_id "
+                              "WHERE u.user_key = ? AND v.version = ?", (user_key(user), version)).fetchone()
+        return row[0] if row else None
+
+    def _version(self, row):
+        if row is None:
+            return None
+        version, created_at, source, profile = row
+        return {"version": version, "created_at": created_at, "source": source, "profile": json.loads(profile)}
+
+    def latest(self, user):
+        with self._lock:
+            row = self.db.execute("SELECT v.version, v.created_at, v.source, v.profile FROM versions v "
+                                  "JOIN users u ON u.id = v.user_id WHERE u.user_key = ? "
+                                  "ORDER BY v.version DESC LIMIT 1", (user_key(user),)).fetchone()
+        return self._version(row)
+
+    def get(self, user, version):
+        with self._lock:
+            row = self.db.execute("SELECT v.version, v.created_at, v.source, v.profile FROM versions v "
+                                  "JOIN users u ON u.id = v.user_id WHERE u.user_key = ? AND v.version = ?",
+                                  (user_key(user), version)).fetchone()
+        return self._version(row)
+
+    def versions(self, user):
+        """[(version, created_at, profile_hash, [(template, pdf_sha256), ...]), ...] oldest first."""
+        with self._lock:
+            rows = self.db.execute("SELECT v.id, v.version, v.created_at, v.profile_hash FROM versions v "
+                                   "JOIN users u ON u.id = v.user_id WHERE u.user_key = ? ORDER BY v.version",
+                                   (user_key(user),)).fetchall()
+            renders = {}
+            for version_id, template, digest in self.db.execute(
+                    "SELECT r.version_id, r.template, r.pdf_sha256 FROM renders r JOIN versions v ON v.id = r.version_id "
+                    "JOIN users u ON u.id = v.user_id WHERE u.user_key = ?", (user_key(user),)):
+                renders.setdefault(version_id, []).append((template, digest))
+        return [(version, created_at, digest, renders.get(version_id, []))
+                for version_id, version, created_at, digest in rows]
+
+    def diff(self, user, old_version, new_version):
+        old, new = self.get(user, old_version), self.get(user, new_version)
+        if old is None or new is None:
+            missing = old_version if old is None else new_version
+            raise KeyError(f"no version {missing} for {user}")
+        return diff_profiles(old["profile"], new["profile"])
+
+    def changed_since(self, created_at, limit=100):
+        """(user_key, version, created_at) saved at or after created_at, oldest first."""
+        with self._lock:
+            return self.db.execute("SELECT u.user_key, v.version, v.created_at FROM versions v "
+                                   "JOIN users u ON u.id = v.user_id WHERE v.created_at >= ? "
+                                   "ORDER BY v.created_at LIMIT ?", (created_at, limit)).fetchall()
+
+    def find_pdf(self, pdf_bytes):
+        """Which (user_key, version, template) a PDF was rendered from, if known."""
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        with self._lock:
+            return self.db.execute("SELECT u.user_key, v.version, r.template FROM renders r "
+                                   "JOIN versions v ON v.id = r.version_id JOIN users u ON u.id = v.user_id "
+                                   "WHERE r.pdf_sha256 = ?", (digest,)).fetchall()
+
+    def stats(self):
+        with self._lock:
+            count = lambda table: self.db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            return {"users": count("users"), "versions": count("versions"), "renders": count("renders")}
+
+
+# ================== IMPORT ===================
+def iter_profile_files(source):
+    """(profile, created_at, source, pdf_path or None) from a directory of JSON files or a JSONL file."""
+    if os.path.isdir(source):
+        # Oldest first, so version numbers follow the order the sessions happened in
+        paths = [os.path.join(source, n) for n in os.listdir(source) if n.endswith(".json")]
+        for path in sorted(paths, key=lambda p: (file_timestamp(p), p)):
+            name = os.path.basename(path)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    profile = json.load(f)
+            except UnicodeDecodeError:
+                with open(path, encoding="latin-1") as f:  # older sessions saved in the locale encoding
+                    profile = json.load(f)
+            if not isinstance(profile, dict):
+                continue
+            pdf = None
+            if name.startswith("responses_"):
+                pdf = os.path.join(source, "cv_" + name[len("responses_"):-5] + ".pdf")
+            yield profile, file_timestamp(path), path, pdf if pdf and os.path.exists(pdf) else None
+    else:
+        created_at = file_timestamp(source)
+        with open(source) as f:
+            for lineno, line in enumerate(f, 1):
+                if line.strip():
+                    yield json.loads(line), created_at, f"{source}:{lineno}", None
+
+
+def import_profiles(store, source, batch_size=5000):
+    """Import every profile under source; returns the number of new versions.
+
+    A cv_<stamp>.pdf next to responses_<stamp>.json is recorded as that version's render.
+    """
+    added = 0
+    batch, pdfs = [], []
+
+    def flush():
+        nonlocal added
+        saved = store.save_many(batch)
+        added += sum(is_new for _, _, is_new in saved)
+        for (key, version, _), pdf in zip(saved, pdfs):
+            if pdf:
+                with open(pdf, "rb") as f:
+                    store.record_render(key, version, "classic", f.read(), pdf)
+        batch.clear()
+        pdfs.clear()
+
+    for profile, created_at, path, pdf in iter_profile_files(source):
+        batch.append((profile, created_at, path))
+        pdfs.append(pdf)
+        if len(batch) >= batch_size:
+            flush()
+    flush()
+    return added
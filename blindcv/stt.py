@@ -0,0 +1,243 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import speech_recognition as sr
+from .trace import span, traced
+
+# Speech recognition backends used by the interviews. Every backend takes an
+# sr.AudioData, returns the transcript, raises sr.UnknownValueError when
+# nothing was understood (same as recognize_google), and records how long
+# each utterance took so backends can be compared. transcribe() also returns
+# the engine's confidence (0-1) where it reports one, otherwise None.
+#
+# Selection comes from a config dict or, by default, the environment:
+#   BLINDCV_STT          google (default) | vosk | replay
+#   BLINDCV_VOSK_MODEL   path to an unpacked Vosk model        (vosk)
+#   BLINDCV_REPLAY_DIR   folder of NNN.wav + NNN.txt answers   (replay)
+#   BLINDCV_REPLAY_SCRIPT  text file, one transcript per line  (replay)
+#   BLINDCV_REPLAY_LATENCY seconds each replayed utterance takes, to stand in
+#                          for a network recognizer in load tests (replay)
+# Replay transcripts may end in "<TAB>0.42" to script a confidence.
+
+
+class RecognizerBackend:
+    name = "base"
+    # Callable returning an sr.AudioSource to listen on; None means the real microphone
+    source_factory = None
+
+    def __init__(self):
+        self.latencies = []
+        self._lock = threading.Lock()
+
+    def _transcribe(self, audio):
+        """Return (text, confidence)."""
+        raise NotImplementedError
+
+    def recognize(self, audio):
+        return self.transcribe(audio)[0]
+
+    def transcribe(self, audio):
+        start = time.perf_counter()
+        try:
+            with span("recognize", backend=self.name):
+                return self._transcribe(audio)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.latencies.append(elapsed)
+
+    def report(self):
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return {"backend": self.name, "utterances": 0}
+        pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]
+        return {
+            "backend": self.name,
+            "utterances": len(samples),
+            "mean_ms": round(sum(samples) / len(samples) * 1000, 1),
+            "p50_ms": round(pick(0.50) * 1000, 1),
+            "p95_ms": round(pick(0.95) * 1000, 1),
+            "max_ms": round(samples[-1] * 1000, 1),
+        }
+
+
+class GoogleBackend(RecognizerBackend):
+    name = "google"
+
+    def __init__(self, recognizer=None, language="en-US"):
+        super().__init__()
+        self.recognizer = recognizer or sr.Recognizer()
+        self.language = language
+
+    def _transcribe(self, audio):
+        result = self.recognizer.recognize_google(audio, language=self.language, show_all=True)
+        if not result or not result.get("alternative"):
+            raise sr.UnknownValueError()
+        best = result["alternative"][0]
+        return best["transcript"], best.get("confidence")
+
+
+_vosk_models = {}
+_vosk_lock = threading.Lock()
+
+
+def load_vosk_model(model_path):
+    # Loading a model takes seconds and hundreds of MB, so once per process.
+    with _vosk_lock:
+        if model_path not in _vosk_models:
+            from vosk import Model, SetLogLevel
+            SetLogLevel(-1)
+            _vosk_models[model_path] = Model(model_path)
+        return _vosk_models[model_path]
+
+
+class VoskBackend(RecognizerBackend):
+    """Offline recognition with a locally stored Vosk (Kaldi) model."""
+    name = "vosk"
+
+    def __init__(self, model_path, sample_rate=16000):
+        super().__init__()
+        self.model = load_vosk_model(model_path)
+        self.sample_rate = sample_rate
+
+    def _transcribe(self, audio):
+        from vosk import KaldiRecognizer
+        recognizer = KaldiRecognizer(self.model, self.sample_rate)
+        recognizer.SetWords(True)
+        recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=self.sample_rate, convert_width=2))
+        result = json.loads(recognizer.FinalResult())
+        text = result.get("text", "")
+        if not text:
+            raise sr.UnknownValueError()
+        words = result.get("result", [])
+        confidence = sum(w["conf"] for w in words) / len(words) if words else None
+        return text, confidence
+
+
+class ReplayBackend(RecognizerBackend):
+    """Deterministic stand-in: returns scripted transcripts in order, ignoring the audio.
+
+    With a replay folder the recorded NNN.wav answers are also what the
+    microphone "hears", so the listen path runs on real audio.
+    """
+    name = "replay"
+
+    def __init__(self, transcripts, wav_files=None, latency=0.0):
+        super().__init__()
+        self.transcripts = list(transcripts)
+        self.position = 0
+        self.latency = latency
+        if wav_files:
+            from .audio_input import WavReplaySource
+            self.source_factory = lambda: WavReplaySource(wav_files)
+
+    @classmethod
+    def from_dir(cls, replay_dir, latency=0.0):
+        wavs = sorted(os.path.join(replay_dir, n) for n in os.listdir(replay_dir) if n.endswith(".wav"))
+        transcripts = []
+        for wav in wavs:
+            with open(os.path.splitext(wav)[0] + ".txt", encoding="utf-8") as f:
+                transcripts.append(f.read().strip())
+        return cls(transcripts, wavs, latency)
+
+    @classmethod
+    def from_script(cls, script_file, latency=0.0):
+        with open(script_file, encoding="utf-8") as f:
+            return cls((line.rstrip("\n") for line in f), latency=latency)
+
+    def _transcribe(self, audio):
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            if self.position >= len(self.transcripts):
+                raise sr.UnknownValueError()
+            line = self.transcripts[self.position]
+            self.position += 1
+        text, _, confidence = line.partition("\t")
+        if not text:
+            raise sr.UnknownValueError()
+        return text, float(confidence) if confidence else None
+
+
+def load_backend(config=None):
+    config = config if config is not None else {
+        "backend": os.environ.get("BLINDCV_STT", "google"),
+        "vosk_model": os.environ.get("BLINDCV_VOSK_MODEL", "model"),
+        "replay_dir": os.environ.get("BLINDCV_REPLAY_DIR"),
+        "replay_script": os.environ.get("BLINDCV_REPLAY_SCRIPT"),
+        "replay_latency": float(os.environ.get("BLINDCV_REPLAY_LATENCY", 0)),
+    }
+    name = config.get("backend", "google").lower()
+    if name == "google":
+        return GoogleBackend(language=config.get("language", "en-US"))
+    if name == "vosk":
+        return VoskBackend(config.get("vosk_model", "model"))
+    if name == "replay":
+        latency = config.get("replay_latency", 0.0)
+        if config.get("replay_dir"):
+            return ReplayBackend.from_dir(config["replay_dir"], latency)
+        if config.get("replay_script"):
+            return ReplayBackend.from_script(config["replay_script"], latency)
+        raise ValueError("replay backend needs replay_dir or replay_script")
+    raise ValueError(f"Unknown STT backend: {name}")
+
+
+# ================== STREAMING ===================
+# Streaming recognition for long answers such as the self-introduction.
+# AudioInputSession.stream_phrases cuts the audio at short pauses while the
+# user is still talking; each chunk is recognized on a worker thread right
+# away, and the transcript is stitched back together in order. on_partial is
+# called with the transcript so far every time it grows, so whatever consumes
+# it (the parser) is up to date the moment the last chunk comes back.
+
+
+class ChunkStitcher:
+    def __init__(self, on_partial=None):
+        self.on_partial = on_partial
+        self.results = {}
+        self.texts = []
+        self._lock = threading.Lock()
+
+    def add(self, index, text):
+        with self._lock:
+            self.results[index] = text
+            grew = False
+            while len(self.texts) in self.results:
+                self.texts.append(self.results.pop(len(self.texts)))
+                grew = True
+            transcript = self.transcript()
+            # Called under the lock so partial transcripts arrive in order
+            if grew and self.on_partial:
+                self.on_partial(transcript)
+
+    def transcript(self):
+        return " ".join(t for t in self.texts if t)
+
+
+def recognize_chunk(backend, audio):
+    try:
+        return backend.recognize(audio)
+    except sr.UnknownValueError:
+        return ""  # a cough or breath between sentences
+
+
+@traced("listen_streaming")
+def transcribe_streaming(session, backend, on_partial=None, workers=3, **vad):
+    """Listen on session until the user stops and return the stitched transcript."""
+    stitcher = ChunkStitcher(on_partial)
+    chunks = 0
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for index, audio in enumerate(session.stream_phrases(**vad)):
+            future = pool.submit(recognize_chunk, backend, audio)
+            future.add_done_callback(lambda f, i=index: stitcher.add(i, f.result() if not f.exception() else ""))
+            futures.append(future)
+            chunks += 1
+        # RequestError and friends are surfaced here rather than swallowed
+        for future in futures:
+            future.result()
+    print(f"Recognized {chunks} chunk(s) while listening.")
+    return stitcher.transcript()
@@ -0,0 +1,311 @@
+import os
+import json
+import string
+import hashlib
+from .qr_cache import add_qr_image
+
+# Declarative CV templates. A template (templates/*.json) names its text
+# styles (font, line height, alignment, colours), the header lines and the
+# sections in order. compile_template turns it into a RenderPlan: flat lists
+# of draw operations, each a closure op(pdf, data) with fonts, colours and
+# text lookups already resolved, so a render only walks the list. Plans are
+# compiled once per template and cached until one of its files changes.
+#
+# Section kinds:
+#   sentences  text field split at ". ", one "- " line per sentence (classic)
+#   text       one wrapped paragraph
+#   links      clickable "Label: url" lines, skipping empty / "Not provided";
+#              optional QR code for one of them
+#   entries    list of dicts, each drawn with the "lines" specs
+#   columns    list of strings in two columns, the second "gap" mm after the
+#              widest entry of the first
+# A text spec is {"field", "default"} or {"format": "{a} | {b}"} (missing keys
+# print as ""), plus "style", optional "prefix", "wrap" (multi_cell) and
+# "each" (repeat for every item of a list field).
+#
+# The plan also keeps the body grouped by section, each with the profile
+# fields it reads, so an edit can re-lay out just the sections it touches
+# (incremental.py).
+
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+
+class _Blank:
+    # format_map view of a profile where missing keys read as ""
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __getitem__(self, key):
+        return self.data.get(key, "")
+
+
+class RenderPlan:
+    def __init__(self, name, page, header, body, fingerprint=None, sections=(), header_fields=frozenset()):
+        self.name = name
+        self.page = page
+        self.header = header
+        self.body = body
+        # Hash of the template files the plan was compiled from (render cache key)
+        self.fingerprint = fingerprint
+        # [(fields, ops)] per section, body in order; fields are the profile keys it reads
+        self.sections = sections
+        self.header_fields = header_fields
+
+
+def item_fields(item):
+    # Profile keys a text spec reads: its field, its list, or the names in its format string
+    if "format" in item:
+        return {name.split(".")[0].split("[")[0] for _, name, _, _ in string.Formatter().parse(item["format"]) if name}
+    return {item[key] for key in ("field", "each") if key in item}
+
+
+def section_fields(section):
+    fields = {section["field"]} if "field" in section else set()
+    fields.update(field for field, _ in section.get("links", ()))
+    if "qr" in section:
+        fields.update((section["qr"]["field"], section["qr"]["when"]))
+    return frozenset(fields)
+
+
+def load_template(name, template_dir=None, files=None):
+    """Read templates/<name>.json, merging in the template it extends.
+
+    Every file read is appended to files, if given.
+    """
+    template_dir = template_dir or TEMPLATE_DIR
+    path = os.path.join(template_dir, name + ".json")
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    if files is not None:
+        files.append(path)
+    parent = spec.pop("extends", None)
+    if parent:
+        base = load_template(parent, template_dir, files)
+        styles = dict(base.get("styles", {}), **spec.get("styles", {}))
+        spec = dict(base, **spec)
+        spec["styles"] = styles
+    return spec
+
+
+# ================== COMPILER ===================
+def compile_template(spec, name=None):
+    styles = spec.get("styles", {})
+    rule = spec.get("rule", {})
+
+    def style_of(key):
+        try:
+            return styles[key]
+        except KeyError:
+            raise ValueError(f"template {name or '?'} has no style {key!r}")
+
+    def text_getter(item, style):
+        upper = style.get("case") == "upper"
+        prefix = item.get("prefix", "")
+        if "format" in item:
+            fmt = item["format"]
+            get = lambda data: fmt.format_map(_Blank(data))
+        else:
+            field, default = item["field"], item.get("default", "")
+            get = lambda data: f"{data.get(field, default)}"
+        if upper:
+            plain = get
+            get = lambda data: plain(data).upper()
+        if prefix:
+            bare = get
+            get = lambda data: prefix + bare(data)
+        return get
+
+    def pen(style, wrap=False, link=False):
+        # draw(pdf, lines) sets the style's font and colours once and writes
+        # every line: plain text, or (text, url) pairs for links
+        font = tuple(style["font"])
+        fill = tuple(style["fill"]) if "fill" in style else None
+        color = tuple(style["color"]) if "color" in style else None
+        h = style.get("height", 6)
+        align = style.get("align", "")
+        fill_flag = 1 if fill else 0
+
+        def draw(pdf, lines):
+            pdf.set_font(*font)
+            if fill:
+                pdf.set_fill_color(*fill)
+            if color:
+                pdf.set_text_color(*color)
+            if wrap:
+                for text in lines:
+                    pdf.multi_cell(0, h, text, 0, align or "J", fill_flag)
+            elif link:
+                for text, url in lines:
+                    pdf.cell(0, h, text, 0, 1, align, fill_flag, url)
+            else:
+                for text in lines:
+                    pdf.cell(0, h, text, 0, 1, align, fill_flag)
+            if color:
+                pdf.set_text_color(0, 0, 0)
+        return draw
+
+    def rule_op():
+        x1, x2 = rule.get("x1", 10), rule.get("x2", 200)
+        draw, width = rule.get("draw"), rule.get("width")
+
+        def op(pdf, data):
+            if draw is not None:
+                pdf.set_draw_color(draw)
+            if width is not None:
+                pdf.set_line_width(width)
+            y = pdf.get_y()
+            pdf.line(x1, y, x2, y)
+        return op
+
+    def space_op(h):
+        return lambda pdf, data: pdf.ln(h)
+
+    def line_ops(item):
+        if item.get("rule"):
+            return [rule_op()]
+        if "space" in item:
+            return [space_op(item["space"])]
+        style = style_of(item["style"])
+        draw = pen(style, wrap=item.get("wrap", False))
+        if "each" in item:
+            each = item["each"]
+            prefix = item.get("prefix", "")
+            return [lambda pdf, data: draw(pdf, [f"{prefix}{value}" for value in data.get(each, ())])]
+        get = text_getter(item, style)
+        return [lambda pdf, data: draw(pdf, (get(data),))]
+
+    title_spec = spec.get("section_title", {})
+    title_style = style_of(title_spec.get("style", "section_title"))
+    title_draw = pen(title_style)
+    title_upper = title_style.get("case") == "upper"
+    title_rule = rule_op() if title_spec.get("rule") else None
+    title_space = title_spec.get("space_after", 0)
+
+    def title_ops(title):
+        lines = (title.upper() if title_upper else title,)
+        ops = [lambda pdf, data: title_draw(pdf, lines)]
+        if title_rule:
+            ops.append(title_rule)
+        if title_space:
+            ops.append(space_op(title_space))
+        return ops
+
+    def section_ops(section):
+        kind = section["kind"]
+        field = section.get("field")
+        space = section.get("space_after", 0)
+        ops = title_ops(section["title"])
+
+        if kind == "sentences":
+            draw = pen(style_of(section["style"]), wrap=True)
+            prefix, default = section.get("prefix", ""), section.get("default", "")
+
+            def sentences_op(pdf, data):
+                draw(pdf, [f"{prefix}{line.strip()}" for line in data.get(field, default).split(". ")])
+            ops += [sentences_op, space_op(space)]
+        elif kind == "text":
+            ops += line_ops({"field": field, "default": section.get("default", ""),
+                             "style": section["style"], "wrap": True})
+            ops.append(space_op(space))
+        elif kind == "links":
+            ops.append(links_op(section))
+        elif kind == "entries":
+            item_ops = [op for line in section["lines"] for op in line_ops(line)] + [space_op(space)]
+
+            def entries_op(pdf, data):
+                for item in data[field]:
+                    for op in item_ops:
+                        op(pdf, item)
+            ops.append(entries_op)
+        elif kind == "columns":
+            ops.append(columns_op(section))
+        else:
+            raise ValueError(f"unknown section kind {kind!r} in template {name or '?'}")
+
+        if section.get("skip_empty"):
+            body = ops
+
+            def when_present(pdf, data):
+                if data.get(field):
+                    for op in body:
+                        op(pdf, data)
+            return [when_present]
+        return ops
+
+    def links_op(section):
+        draw = pen(style_of(section["style"]), link=True)
+        links = [tuple(pair) for pair in section["links"]]
+        qr = section.get("qr")
+
+        def op(pdf, data):
+            for field, label in links:
+                val = data.get(field)
+                if val and val.lower() != "not provided":
+                    draw(pdf, ((f"{label}: {val}", val),))
+                    if qr and field == qr["field"] and data.get(qr["when"], "").lower() == "yes":
+                        add_qr_image(pdf, val, x=qr["x"], y=pdf.get_y() + qr["dy"], w=qr["w"])
+        return op
+
+    def columns_op(section):
+        # Column two starts after the widest column-one item plus "gap" mm,
+        # measured in the row font rather than padded with spaces
+        label_draw = pen(style_of(section["label_style"]))
+        row_style = style_of(section["style"])
+        row_font, h = tuple(row_style["font"]), row_style.get("height", 6)
+        label = (section["label"] + ":",)
+        field, gap, space = section["field"], section.get("gap", 10), section.get("space_after", 0)
+
+        def op(pdf, data):
+            items = data[field]
+            label_draw(pdf, label)
+            half = (len(items) + 1) // 2
+            col1, col2 = items[:half], items[half:]
+            pdf.set_font(*row_font)
+            col_w = max(pdf.get_string_width(f"{item}") for item in col1) + gap + 2 * pdf.c_margin
+            for i, left in enumerate(col1):
+                pdf.cell(col_w, h, f"{left}", 0, 0)
+                pdf.cell(0, h, f"{col2[i]}" if i < len(col2) else "", 0, 1)
+            pdf.ln(space)
+        return op
+
+    header_items = spec.get("header", [])
+    header = [op for item in header_items for op in line_ops(item)]
+    sections = [(section_fields(section), section_ops(section)) for section in spec.get("sections", [])]
+    body = [op for _, ops in sections for op in ops]
+    header_fields = frozenset(field for item in header_items for field in item_fields(item))
+    return RenderPlan(name, spec.get("page"), header, body, sections=sections, header_fields=header_fields)
+
+
+# (directory, name) -> (file signatures, plan); a plan is recompiled when any of its files changes
+_plans = {}
+
+
+def file_signatures(paths):
+    signatures = []
+    for path in paths:
+        st = os.stat(path)
+        signatures.append((path, st.st_mtime_ns, st.st_size))
+    return tuple(signatures)
+
+
+def get_plan(name):
+    cached = _plans.get((TEMPLATE_DIR, name))
+    if cached is not None:
+        signatures, plan = cached
+        try:
+            if file_signatures(path for path, _, _ in signatures) == signatures:
+                return plan
+        except OSError:
+            pass
+    files = []
+    spec = load_template(name, files=files)
+    digest = hashlib.sha256()
+    for path in files:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    plan = compile_template(spec, name)
+    plan.fingerprint = digest.hexdigest()
+    _plans[(TEMPLATE_DIR, name)] = (file_signatures(files), plan)
+    return plan
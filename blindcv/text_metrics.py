@@ -0,0 +1,130 @@
+import threading
+from collections import OrderedDict
+
+# String widths and multi_cell line breaks, cached per font. FPDF measures
+# text one character at a time on every call, and bulk renders keep drawing
+# the same section titles, skill lists and boilerplate. Both caches are
+# bounded LRUs shared by every render in the process (so by every job a
+# batch or service worker handles).
+#
+# Widths are stored in font units (1/1000 em), so one entry serves every
+# size of the font. A line-break entry records exactly what FPDF's own
+# multi_cell would emit for that text, font, size and width: per line, the
+# word spacing, the "Tw" operator written before it (if any) and the text.
+# render.PlanPDF replays it, so cached renders are byte-identical.
+
+
+class LRUCache:
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, compute):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = compute()
+        with self._lock:
+            self._items[key] = value
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+        return value
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._items),
+                    "hit_ratio": round(self.hits / lookups, 3) if lookups else None}
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+
+def string_units(cw, text):
+    return sum(cw.get(c, 0) for c in text)
+
+
+def break_lines(cw, text, wmax, font_size, justify, k):
+    """FPDF 1.7.2's multi_cell line breaking (core fonts, no border), recorded.
+
+    Returns a tuple of (ws, tw_operator or None, line) in output order.
+    """
+    s = text.replace("\r", "")
+    nb = len(s)
+    if nb > 0 and s[nb - 1] == "\n":
+        nb -= 1
+    lines = []
+    ws = 0
+    sep = -1
+    i = j = l = ls = ns = 0
+    while i < nb:
+        c = s[i]
+        if c == "\n":
+            # Explicit line break
+            tw = None
+            if ws > 0:
+                ws, tw = 0, "0 Tw"
+            lines.append((ws, tw, s[j:i]))
+            i += 1
+            sep, j, l, ns = -1, i, 0, 0
+            continue
+        if c == " ":
+            sep, ls = i, l
+            ns += 1
+        l += cw.get(c, 0)
+        if l > wmax:
+            # Automatic line break
+            tw = None
+            if sep == -1:
+                if i == j:
+                    i += 1
+                if ws > 0:
+                    ws, tw = 0, "0 Tw"
+                lines.append((ws, tw, s[j:i]))
+            else:
+                if justify:
+                    ws = (wmax - ls) / 1000.0 * font_size / (ns - 1) if ns > 1 else 0
+                    tw = "%.3f Tw" % (ws * k)
+                lines.append((ws, tw, s[j:sep]))
+                i = sep + 1
+            sep, j, l, ns = -1, i, 0, 0
+        else:
+            i += 1
+    tw = None
+    if ws > 0:
+        ws, tw = 0, "0 Tw"
+    lines.append((ws, tw, s[j:i]))
+    return tuple(lines)
+
+
+class TextMeasureCache:
+    def __init__(self, max_widths=4096, max_breaks=2048):
+        self.widths = LRUCache(max_widths)
+        self.breaks = LRUCache(max_breaks)
+
+    def width(self, fontkey, cw, text):
+        """Width of text in font units."""
+        return self.widths.get((fontkey, text), lambda: string_units(cw, text))
+
+    def line_breaks(self, fontkey, cw, text, wmax, font_size, justify, k):
+        key = (fontkey, font_size, wmax, justify, k, text)
+        return self.breaks.get(key, lambda: break_lines(cw, text, wmax, font_size, justify, k))
+
+    def stats(self):
+        return {"widths": self.widths.stats(), "breaks": self.breaks.stats()}
+
+    def clear(self):
+        self.widths.clear()
+        self.breaks.clear()
+
+
+TEXT_CACHE = TextMeasureCache()
@@ -0,0 +1,239 @@
+import os
+import json
+import time
+import atexit
+import threading
+import functools
+
+# Where the seconds go in a real session: spans around the pipeline stages
+# (tts, calibration, listen, recognize, parse, ai_prompt_filler, render,
+# send_email, and the whole session). Each finished span is added to a
+# per-name latency histogram and, if a trace file is set, written to it as
+# one JSON line: {"span", "start", "ms", "parent", "thread", "error", ...attrs}.
+# The histograms are served as Prometheus text on /metrics.
+#
+# Off by default. Disabled, a @traced function costs one global lookup and
+# span() hands back a shared no-op context manager, so the calls can stay in
+# the hot paths (python -m benchmarks.bench_trace).
+#
+# BLINDCV_TRACE          JSON-lines file spans are appended to
+# BLINDCV_METRICS_PORT   serve http://127.0.0.1:<port>/metrics (also turns tracing on)
+
+# Histogram bucket bounds in seconds: from a parse (ms) to a long answer (tens of s)
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class Metrics:
+    """Latency histogram and error count per span name."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self._series = {}  # name -> [bucket counts..., count, sum, errors]
+        self._lock = threading.Lock()
+
+    def observe(self, name, seconds, error=False):
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = [0] * (len(self.buckets) + 2) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    series[i] += 1
+                    break
+            else:
+                series[len(self.buckets)] += 1  # +Inf only
+            series[-3] += 1
+            series[-2] += seconds
+            series[-1] += error
+
+    def snapshot(self):
+        with self._lock:
+            return {name: {"count": s[-3], "sum_seconds": round(s[-2], 6), "errors": s[-1]}
+                    for name, s in sorted(self._series.items())}
+
+    def prometheus(self):
+        with self._lock:
+            series = {name: list(s) for name, s in sorted(self._series.items())}
+        lines = ["# HELP blindcv_span_seconds Time spent in each pipeline stage.",
+                 "# TYPE blindcv_span_seconds histogram"]
+        for name, s in series.items():
+            cumulative = 0
+            for i, bound in enumerate(self.buckets):
+                cumulative += s[i]
+                lines.append(f'blindcv_span_seconds_bucket{{span="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'blindcv_span_seconds_bucket{{span="{name}",le="+Inf"}} {s[-3]}')
+            lines.append(f'blindcv_span_seconds_sum{{span="{name}"}} {s[-2]:.6f}')
+            lines.append(f'blindcv_span_seconds_count{{span="{name}"}} {s[-3]}')
+        lines += ["# HELP blindcv_span_errors_total Spans that ended in an exception.",
+                  "# TYPE blindcv_span_errors_total counter"]
+        lines += [f'blindcv_span_errors_total{{span="{name}"}} {s[-1]}' for name, s in series.items()]
+        return "\n".join(lines) + "\n"
+
+
+class Tracer:
+    def __init__(self, path=None):
+        self.path = path
+        self.metrics = Metrics()
+        self.server = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Line-buffered: a span is on disk as soon as it ends, even if the process dies
+        self._file = open(path, "a", buffering=1, encoding="utf-8") if path else None
+
+    def stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def record(self, name, start, seconds, parent, error, attrs):
+        self.metrics.observe(name, seconds, error is not None)
+        if self._file is None:
+            return
+        line = {"span": name, "start": round(start, 6), "ms": round(seconds * 1000, 3), "parent": parent,
+                "thread": threading.current_thread().name, "error": error}
+        line.update(attrs)
+        text = json.dumps(line, default=str) + "\n"
+        with self._lock:
+            if self._file is not None:
+                self._file.write(text)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class Span:
+    __slots__ = ("tracer", "name", "attrs", "start", "clock")
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+
+    def set(self, **attrs):
+        """Attach attributes found out while the span runs (e.g. a cache hit)."""
+        self.attrs.update(attrs)
+
+    def __enter__(self):
+        self.tracer.stack().append(self.name)
+        self.start = time.time()
+        self.clock = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self.clock
+        stack = self.tracer.stack()
+        stack.pop()
+        error = f"{exc_type.__name__}: {exc_value}" if exc_type is not None else None
+        self.tracer.record(self.name, self.start, seconds, stack[-1] if stack else None, error, self.attrs)
+        return False
+
+
+class NoSpan:
+    __slots__ = ()
+
+    def set(self, **attrs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+NO_SPAN = NoSpan()
+
+# The active tracer; None when tracing is off
+_tracer = None
+
+
+def span(name, **attrs):
+    tracer = _tracer
+    if tracer is None:
+        return NO_SPAN
+    return Span(tracer, name, attrs)
+
+
+def traced(name):
+    """Decorator: run the function inside span(name)."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return fn(*args, **kwargs)
+            with Span(tracer, name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def enabled():
+    return _tracer is not None
+
+
+def enable(path=None, port=None, host="127.0.0.1"):
+    """Start tracing: spans to path (JSON lines) if given, /metrics on port if given."""
+    global _tracer
+    disable()
+    tracer = Tracer(path)
+    if port is not None:
+        tracer.server = serve_metrics(tracer, host, port)
+    _tracer = tracer
+    return tracer
+
+
+def disable():
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is not None:
+        tracer.close()
+
+
+def metrics():
+    return _tracer.metrics if _tracer is not None else None
+
+
+# ================== /metrics ===================
+def serve_metrics(tracer, host="127.0.0.1", port=9464):
+    # http.server is only imported when the endpoint is wanted
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = tracer.metrics.prometheus().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
+
+
+def enable_from_env():
+    path = os.environ.get("BLINDCV_TRACE") or None
+    port = os.environ.get("BLINDCV_METRICS_PORT")
+    if path or port:
+        enable(path, int(port) if port else None)
+        atexit.register(disable)
+
+
+enable_from_env()
@@ -0,0 +1,262 @@
+import os
+import time
+import queue
+import tempfile
+import itertools
+import threading
+from concurrent.futures import Future
+from .prompt_audio import PromptAudioCache, wav_bytes
+from .trace import span
+
+# Spoken output. Fixed prompts are played from the pre-synthesized cache
+# (prompt_audio.py); anything else goes through pyttsx3. The driver is only
+# imported and started on the first line that is not cached, so code paths
+# that never speak (rendering, parsing) don't pay for it.
+#
+# All speech runs on one dedicated thread per Speaker (pyttsx3 wants every
+# call from the thread that made the engine). speak() queues a line by
+# priority and returns a Future at once (True once spoken, False if it was
+# cut short), so a session can talk in the background while it renders or
+# sends mail; cancel it before it starts with future.cancel(), and
+# interrupt() stops the line being spoken (barge-in). text_to_speech() and
+# speak_prompt() still block until their line has been spoken.
+#
+# BLINDCV_TTS   pyttsx3 (default) | null: discard speech (headless runs, benchmarks)
+
+
+class NullEngine:
+    """pyttsx3 stand-in with no audio device: every line is accepted and dropped."""
+
+    def __init__(self):
+        self.properties = {"rate": 200, "volume": 1.0, "voice": "null"}
+        self.spoken = 0
+
+    def setProperty(self, name, value):
+        self.properties[name] = value
+
+    def getProperty(self, name):
+        return self.properties.get(name)
+
+    def say(self, text):
+        self.spoken += 1
+
+    def save_to_file(self, text, path):
+        pass  # nothing cached, so every prompt is "spoken" live
+
+    def runAndWait(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+# Utterance priorities: lower goes first; equal priorities keep their order
+URGENT, NORMAL, BACKGROUND = 0, 5, 9
+
+
+class Utterance:
+    __slots__ = ("text", "stop_event", "future", "queued_at", "action")
+
+    def __init__(self, text, stop_event=None, action=None):
+        self.text = text
+        self.stop_event = stop_event or threading.Event()
+        self.future = Future()
+        self.queued_at = time.perf_counter()
+        self.action = action  # a callable run on the speech thread instead of text
+
+
+class Speaker:
+    def __init__(self, rate=150, volume=1.0, prompt_audio=None):
+        self.rate = rate
+        self.volume = volume
+        self.prompt_audio = prompt_audio or PromptAudioCache()
+        self.engine = None
+        self._queue = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._current = None
+        self.spoken = 0
+        self.interrupted = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.wait_seconds = 0.0
+
+    def get_engine(self):
+        # Only called on the speech thread
+        if self.engine is None:
+            if os.environ.get("BLINDCV_TTS", "pyttsx3").lower() == "null":
+                engine = NullEngine()
+            else:
+                import pyttsx3
+                engine = pyttsx3.init()
+            engine.setProperty('rate', self.rate)
+            engine.setProperty('volume', self.volume)
+            self.engine = engine
+        return self.engine
+
+    # ---------- queue ----------
+    def _submit(self, utterance, priority):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="tts", daemon=True)
+                self._thread.start()
+            self._queue.put((priority, next(self._order), utterance))
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+        return utterance.future
+
+    def speak(self, text, priority=NORMAL, stop_event=None):
+        """Queue text and return a Future: True once spoken, False if interrupted."""
+        return self._submit(Utterance(text, stop_event), priority)
+
+    def call(self, fn, priority=NORMAL):
+        """Run fn(engine) on the speech thread; returns a Future of its result."""
+        return self._submit(Utterance(None, action=fn), priority)
+
+    def synthesize(self, text, priority=NORMAL):
+        """Future of WAV bytes for text, for clients that play audio themselves.
+
+        Cached prompts come back at once; anything else is rendered on the
+        speech thread. None if the engine writes no WAV (e.g. the null engine).
+        """
+        clip = self.prompt_audio.get(text)
+        if clip is not None:
+            future = Future()
+            future.set_result(wav_bytes(clip))
+            return future
+
+        def render(engine):
+            fd, path = tempfile.mkstemp(suffix=".wav")
+            os.close(fd)
+            try:
+                engine.save_to_file(text, path)
+                engine.runAndWait()
+                with open(path, "rb") as f:
+                    return f.read() or None
+            finally:
+                os.remove(path)
+        return self.call(render, priority)
+
+    def _run(self):
+        while True:
+            _, _, utterance = self._queue.get()
+            if utterance is None:
+                return
+            if not utterance.future.set_running_or_notify_cancel():
+                with self._lock:
+                    self.cancelled += 1
+                continue
+            waited = time.perf_counter() - utterance.queued_at
+            with self._lock:
+                self._current = utterance
+            try:
+                if utterance.action is not None:
+                    result = utterance.action(self.get_engine())
+                else:
+                    result = self._say(utterance, waited)
+            except BaseException as e:
+                utterance.future.set_exception(e)
+            else:
+                utterance.future.set_result(result)
+            finally:
+                with self._lock:
+                    self._current = None
+
+    def _say(self, utterance, waited):
+        text, stop_event = utterance.text, utterance.stop_event
+        with span("tts", chars=len(text), waited_ms=round(waited * 1000, 3)) as s:
+            if stop_event.is_set():
+                finished = False  # barged in before it started
+            else:
+                try:
+                    if self.prompt_audio.play(text, stop_event):
+                        s.set(cached=True)
+                    else:
+                        tts = self.get_engine()
+                        tts.say(text)
+                        tts.runAndWait()
+                    finished = not stop_event.is_set()
+                except Exception as e:
+                    s.set(failed=str(e))
+                    print(f"TTS Error: {e}")
+                    with self._lock:
+                        self.failed += 1
+                        self.wait_seconds += waited
+                    return False
+        with self._lock:
+            self.wait_seconds += waited
+            if finished:
+                self.spoken += 1
+            else:
+                self.interrupted += 1
+        return finished
+
+    # ---------- blocking API used by the interviews ----------
+    def speak_prompt(self, text, stop_event=None):
+        return self.speak(text, stop_event=stop_event).result()
+
+    def text_to_speech(self, text):
+        self.speak_prompt(text)
+
+    def interrupt(self):
+        """Cut the line being spoken short (barge-in); queued lines still play."""
+        with self._lock:
+            current = self._current
+        if current is None or current.action is not None:
+            return
+        current.stop_event.set()  # cached clips poll it
+        if self.engine is not None:
+            self.engine.stop()
+
+    def stop(self):
+        self.interrupt()
+
+    def clear(self):
+        """Cancel every line still waiting in the queue; returns how many."""
+        dropped = 0
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            utterance = item[2]
+            if utterance is None:
+                self._queue.put(item)  # keep a pending close()
+                break
+            if utterance.future.cancel():
+                dropped += 1
+        with self._lock:
+            self.cancelled += dropped
+        return dropped
+
+    def warm(self, prompts):
+        def synthesize(engine):
+            self.prompt_audio.warm(engine, prompts)
+        try:
+            self.call(synthesize, URGENT).result()
+        except Exception as e:
+            print(f"Prompt audio cache unavailable: {e}")
+
+    def close(self, timeout=None):
+        """Finish what is queued, then stop the speech thread (the next speak() starts it again)."""
+        with self._lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put((float("inf"), next(self._order), None))
+        thread.join(timeout)
+
+    def stats(self):
+        with self._lock:
+            started = self.spoken + self.interrupted + self.failed
+            return {
+                "queue_depth": self._queue.qsize(),
+                "max_depth": self.max_depth,
+                "speaking": self._current is not None,
+                "spoken": self.spoken,
+                "interrupted": self.interrupted,
+                "cancelled": self.cancelled,
+                "failed": self.failed,
+                "mean_wait_ms": round(self.wait_seconds / started * 1000, 3) if started else None,
+            }
@@ -0,0 +1,182 @@
+import math
+import audioop
+import threading
+from collections import deque
+import speech_recognition as sr
+
+# Voice activity detection for capturing answers. Recognizer.listen waits a
+# fixed pause_threshold after every answer and the interviews capped each one
+# with a fixed phrase_time_limit, so a "yes" still waited out the full pause
+# while a description of past work was cut off after four seconds. Here each
+# question has a capture profile (short for yes/no, long for experience and
+# projects), and only the speech plus a little padding goes to the
+# recognizer, with the leading and trailing silence trimmed off.
+#
+# A buffer is speech when it is louder than the energy threshold and its
+# zero-crossing rate is above mains hum and rumble. Right after voiced
+# speech, quieter buffers with a high crossing rate (the s, f and sh at the
+# end of a word) still count as speech. Capture ends after end_pause of
+# silence. If the user has already paused longer than that mid-answer, the
+# pause allowed grows to pause_factor times their longest pause, up to
+# max_pause, so people who think between sentences are not cut off.
+#
+# BLINDCV_VAD=0 goes back to Recognizer.listen with the fixed limits.
+
+PROFILES = {
+    # a word or two: yes/no, a style name, a confirmation
+    "short": dict(timeout=3, end_pause=0.4, max_pause=0.6, max_seconds=4),
+    "normal": dict(timeout=5, end_pause=0.7, max_pause=1.2, max_seconds=15),
+    # sentences with thinking pauses: experience, projects
+    "long": dict(timeout=6, end_pause=1.3, max_pause=2.5, max_seconds=60),
+    # the free self-introduction
+    "monologue": dict(timeout=None, end_pause=1.5, max_pause=3.0, max_seconds=120),
+}
+
+# Question key -> profile; anything else is "normal"
+QUESTION_PROFILES = {
+    "confirm": "short",
+    "qr_code": "short",
+    "style": "short",
+    "experience": "long",
+    "projects": "long",
+    "responsibilities": "long",
+    "achievements": "long",
+    "introduction": "monologue",
+}
+
+
+def profile_for(key):
+    return PROFILES[QUESTION_PROFILES.get(key, "normal")]
+
+
+class VoiceActivityDetector:
+    def __init__(self, min_speech=0.1, padding=0.2, min_zcr=150, fricative_zcr=2500, fricative_ratio=0.5,
+                 fricative_window=0.3, pause_factor=1.5):
+        self.min_speech = min_speech            # seconds of speech before capture starts (clicks are shorter)
+        self.padding = padding                  # seconds kept on each side of the speech
+        self.min_zcr = min_zcr                  # crossings/s; 50/60 Hz hum has 100-120
+        self.fricative_zcr = fricative_zcr
+        self.fricative_ratio = fricative_ratio  # of the threshold, for fricatives
+        self.fricative_window = fricative_window
+        self.pause_factor = pause_factor
+        self._lock = threading.Lock()
+        self.captures = self.timeouts = self.trims = 0
+        self.kept_seconds = self.trimmed_seconds = 0.0
+        self.ended = {"pause": 0, "max_seconds": 0, "stream": 0}
+
+    def classify(self, buffer, width, rate, threshold):
+        """"voiced", "unvoiced" or None for one buffer of audio."""
+        energy = audioop.rms(buffer, width)
+        if energy <= threshold * self.fricative_ratio:
+            return None
+        zcr = audioop.cross(buffer, width) * rate / (len(buffer) // width)
+        if energy > threshold:
+            return "voiced" if zcr >= self.min_zcr else None
+        return "unvoiced" if zcr >= self.fricative_zcr else None
+
+    def capture(self, source, threshold, profile):
+        """Read one answer from source.stream; AudioData of the speech with padding.
+
+        Raises sr.WaitTimeoutError if nobody starts speaking within the
+        profile's timeout, like Recognizer.listen.
+        """
+        rate, width = source.SAMPLE_RATE, source.SAMPLE_WIDTH
+        seconds_per_buffer = source.CHUNK / rate
+        pad = math.ceil(self.padding / seconds_per_buffer)
+        onset = max(1, math.ceil(self.min_speech / seconds_per_buffer))
+        timeout = profile["timeout"]
+        max_buffers = math.ceil(profile["max_seconds"] / seconds_per_buffer)
+
+        preroll = deque(maxlen=pad + onset)
+        frames = []
+        started = False
+        run = 0
+        waited = silence = since_voiced = longest_pause = 0.0
+        end = "stream"
+        while True:
+            buffer = source.stream.read(source.CHUNK)
+            if not buffer:
+                break
+            kind = self.classify(buffer, width, rate, threshold)
+            if not started:
+                preroll.append(buffer)
+                run = run + 1 if kind == "voiced" else 0
+                if run >= onset:
+                    started = True
+                    frames = list(preroll)
+                    last_speech = len(frames)
+                    continue
+                waited += seconds_per_buffer
+                if timeout and waited > timeout:
+                    with self._lock:
+                        self.timeouts += 1
+                    raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                continue
+
+            frames.append(buffer)
+            if kind == "voiced" or (kind == "unvoiced" and since_voiced < self.fricative_window):
+                longest_pause = max(longest_pause, silence)
+                silence = 0.0
+                last_speech = len(frames)
+            else:
+                silence += seconds_per_buffer
+            since_voiced = 0.0 if kind == "voiced" else since_voiced + seconds_per_buffer
+            end_pause = min(max(profile["end_pause"], self.pause_factor * longest_pause), profile["max_pause"])
+            if silence >= end_pause:
+                end = "pause"
+                break
+            if len(frames) >= max_buffers:
+                end = "max_seconds"
+                break
+
+        kept = frames[:last_speech + pad] if started else []
+        with self._lock:
+            self.captures += 1
+            self.ended[end] += 1
+            self.kept_seconds += len(kept) * seconds_per_buffer
+            self.trimmed_seconds += (len(frames) - len(kept)) * seconds_per_buffer
+        return sr.AudioData(b"".join(kept), rate, width)
+
+    def trim(self, audio, threshold=None, threshold_ratio=2.0, frame_seconds=0.02):
+        """Cut the silence before and after the speech in a finished recording.
+
+        Without a threshold the noise floor is taken from the quietest
+        frames. Audio with no speech found is returned unchanged.
+        """
+        width, rate = audio.sample_width, audio.sample_rate
+        raw = audio.frame_data
+        step = max(1, int(rate * frame_seconds)) * width
+        buffers = [raw[i:i + step] for i in range(0, len(raw) - width + 1, step)]
+        if not buffers:
+            return audio
+        if threshold is None:
+            energies = sorted(audioop.rms(b, width) for b in buffers)
+            threshold = max(energies[len(energies) // 5] * threshold_ratio, 50)
+        kinds = [self.classify(b, width, rate, threshold) for b in buffers]
+        onset = max(1, math.ceil(self.min_speech / frame_seconds))
+        first = next((i for i in range(len(kinds) - onset + 1)
+                      if all(k == "voiced" for k in kinds[i:i + onset])), None)
+        if first is None:
+            return audio
+        last = max(i for i, k in enumerate(kinds) if k == "voiced")
+        window = math.ceil(self.fricative_window / frame_seconds)
+        while last + 1 < len(kinds) and kinds[last + 1] == "unvoiced" and window:
+            last += 1
+            window -= 1
+        pad = math.ceil(self.padding / frame_seconds)
+        start, stop = max(0, first - pad) * step, min(len(buffers), last + 1 + pad) * step
+        with self._lock:
+            self.trims += 1
+            self.trimmed_seconds += (len(raw) - (min(stop, len(raw)) - start)) / width / rate
+        return sr.AudioData(raw[start:stop], rate, width)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "captures": self.captures,
+                "timeouts": self.timeouts,
+                "trims": self.trims,
+                "ended": dict(self.ended),
+                "mean_kept_seconds": round(self.kept_seconds / self.captures, 3) if self.captures else None,
+                "trimmed_seconds": round(self.trimmed_seconds, 3),
+            }
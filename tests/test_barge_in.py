@@ -0,0 +1,75 @@
+import math
+import struct
+import threading
+from blindcv.audio_input import AudioInputSession
+from blindcv.dialog import DialogEngine
+
+# Talking over a live prompt cuts it at once, before the answer is captured,
+# so the prompt does not end up in the recording.
+
+RATE = 16000
+CHUNK = 1024
+
+
+def loud_chunk():
+    return struct.pack(f"<{CHUNK}h", *(int(8000 * math.sin(2 * math.pi * 200 * n / RATE)) for n in range(CHUNK)))
+
+
+class Stream:
+    """The user talks from the start: loud for two seconds, then quiet."""
+
+    def __init__(self, interrupted):
+        self.interrupted = interrupted
+        self.reads = 0
+        self.reads_at_interrupt = None
+
+    def read(self, size):
+        self.reads += 1
+        if self.interrupted.is_set() and self.reads_at_interrupt is None:
+            self.reads_at_interrupt = self.reads
+        if self.reads * CHUNK > RATE * 6:
+            return b""
+        return loud_chunk() if self.reads * CHUNK < RATE * 2 else b"\0" * CHUNK * 2
+
+
+class Source:
+    SAMPLE_RATE = RATE
+    SAMPLE_WIDTH = 2
+    CHUNK = CHUNK
+
+    def __init__(self, stream):
+        self.stream = stream
+
+
+class Microphone:
+    def __init__(self, source):
+        self.source = source
+
+    def __enter__(self):
+        return self.source
+
+    def __exit__(self, *exc):
+        pass
+
+
+class STT:
+    def transcribe(self, audio):
+        return "yes", None
+
+
+def test_live_prompt_is_cut_on_barge_in():
+    interrupted = threading.Event()
+    stream = Stream(interrupted)
+    mic = AudioInputSession(microphone_factory=lambda: Microphone(Source(stream)))
+    mic.open(calibrate=False)
+    mic.calibrations = 1
+    mic.recognizer.energy_threshold = 300
+
+    def speak(text, stop_event):
+        # a pyttsx3 prompt: ignores the event, only interrupt() ends it
+        assert interrupted.wait(5), "prompt was never interrupted"
+
+    dialog = DialogEngine(speak, mic, STT(), interrupt=interrupted.set)
+    assert dialog.prompt_and_listen("You said: Alen. Should I save this?", "confirm") == "yes"
+    # interrupted after the few loud buffers that detect barge-in, long before two seconds of answer
+    assert stream.reads_at_interrupt is not None and stream.reads_at_interrupt < 10
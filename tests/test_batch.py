@@ -0,0 +1,26 @@
+import json
+from blindcv.batch import run_batch
+
+# A malformed profile is reported in the summary; the rest of the batch still renders.
+
+
+def test_bad_json_is_a_failure_not_a_crash(tmp_path):
+    source = tmp_path / "in"
+    source.mkdir()
+    (source / "responses_1.json").write_text(json.dumps({"name": "Alen", "tag": "Engineer"}))
+    (source / "broken.json").write_text("{bad")
+    (source / "latin1.json").write_bytes(b'{"name": "Jos\xe9"}')
+    summary = run_batch(str(source), str(tmp_path / "out"), workers=1)
+    assert summary["rendered"] == 1 and summary["failed"] == 2
+    errors = {f["source"].rsplit("/", 1)[-1]: f["error"] for f in summary["failures"]}
+    assert errors["broken.json"].startswith("JSONDecodeError")
+    assert errors["latin1.json"].startswith("UnicodeDecodeError")
+    assert (tmp_path / "out" / "cv_1.pdf").exists()
+
+
+def test_bad_jsonl_line(tmp_path):
+    source = tmp_path / "profiles.jsonl"
+    source.write_bytes(b'{"name": "A", "tag": "B"}\n{bad\n\xff\n{"name": "C", "tag": "D"}\n')
+    summary = run_batch(str(source), str(tmp_path / "out"), workers=1)
+    assert summary["rendered"] == 2 and summary["failed"] == 2
+    assert [f["source"] for f in summary["failures"]] == [f"{source}:2", f"{source}:3"]
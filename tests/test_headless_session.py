@@ -0,0 +1,21 @@
+from blindcv import render
+from benchmarks.bench_session import STAGES, run_session, summarize, synth_corpus
+
+# A whole test-mode interview runs headless (recorded answers, null TTS) and
+# every stage it goes through is timed.
+
+
+def test_test_mode_session(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLINDCV_STT", "replay")
+    monkeypatch.setenv("BLINDCV_TTS", "null")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.delenv("BLINDCV_STORE", raising=False)
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    corpus = tmp_path / "corpus"
+    synth_corpus(str(corpus))
+
+    report = summarize([run_session("test", str(corpus), str(tmp_path))])
+    stages = report["stages"]
+    assert set(stages) == set(STAGES) - {"parse"} | {"other"}
+    assert stages["recognize"]["calls_per_run"] == 4  # two answers, two confirmations
+    assert stages["render"]["calls_per_run"] == 1
@@ -0,0 +1,52 @@
+import os
+import re
+import sys
+import json
+import subprocess
+
+# Keeps `python -m blindcv render` cold start small: the audio stack must not
+# be imported at all, and the total import time (python -X importtime, summed
+# over top-level imports) must stay inside the budget. fpdf alone is ~90 ms
+# here, most of it Pillow. Loading Version2.1.py for its layout used to cost
+# ~160 ms of imports, plus pyttsx3.init() in the scripts that ran it eagerly.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+RENDER_IMPORT_BUDGET_MS = 250
+
+AUDIO_MODULES = {"pyttsx3", "speech_recognition", "pyaudio", "vosk", "qrcode", "smtplib"}
+
+IMPORT_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)")
+
+
+def import_profile(args, cwd):
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-m", "blindcv"] + args,
+                          cwd=cwd, capture_output=True, text=True, check=True,
+                          env=dict(os.environ, PYTHONPATH=ROOT, HOME=str(cwd), BLINDCV_RENDER_CACHE="off"))
+    modules = {}
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        m = IMPORT_LINE.match(line)
+        if m:
+            modules[m.group(3)] = int(m.group(1))
+            if not m.group(2):
+                total_us += int(m.group(1))
+    return modules, total_us / 1000
+
+
+def test_render_cold_start(tmp_path):
+    profile = tmp_path / "responses.json"
+    profile.write_text(json.dumps({"name": "Test User", "tag": "Engineer", "education": "B.Tech",
+                                   "email": "test@example.com", "style": "basic"}))
+    modules, total_ms = import_profile(["render", str(profile), str(tmp_path / "cv.pdf")], tmp_path)
+
+    assert (tmp_path / "cv.pdf").exists()
+    assert "blindcv.render" in modules
+    loaded = {name.split(".")[0] for name in modules} & AUDIO_MODULES
+    assert not loaded, f"render imported {sorted(loaded)}"
+    assert total_ms < RENDER_IMPORT_BUDGET_MS, f"render imports took {total_ms:.0f} ms"
+
+
+def test_cli_help_imports_nothing_heavy(tmp_path):
+    modules, _ = import_profile(["--help"], tmp_path)
+    assert not {"fpdf", "PIL"} & {name.split(".")[0] for name in modules}
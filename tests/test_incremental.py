@@ -0,0 +1,61 @@
+import re
+from blindcv import render
+from blindcv.render import RenderContext, render_cv, render_resume
+from blindcv.incremental import IncrementalRenderer
+
+# Incremental re-render: after an edit only the touched sections (and any
+# that moved) are laid out again, and the PDF matches a full render byte for
+# byte apart from the creation date.
+
+CREATION_DATE = re.compile(rb"/CreationDate \(D:\d+\)")
+
+CLASSIC = {"name": "Alen Alex", "tag": "Engineer", "style": "basic", "education": "B.Tech. Kochi",
+           "experience": "Intern at X. Built Y", "projects": "Voice CV", "responsibilities": "Lead",
+           "achievements": "Prize", "email": "alen@example.com", "linkedin": "https://linkedin.com/in/alen",
+           "qr_code": "yes"}
+
+
+def same(a, b):
+    return CREATION_DATE.sub(b"", a) == CREATION_DATE.sub(b"", b)
+
+
+def test_edits_match_full_render(monkeypatch):
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    renderer = IncrementalRenderer()
+    profile = dict(CLASSIC)
+    renderer.render(profile)
+
+    profile["email"] = "alen.alex@example.com"  # last section: the other five are replayed
+    assert same(renderer.render(profile), render_cv(RenderContext(profile), None))
+    assert renderer.stats()["replayed"] == 5
+
+    profile["education"] = "B.Tech in Computer Science. Kochi. Class of 2025"  # moves everything below
+    assert same(renderer.render(profile), render_cv(RenderContext(profile), None))
+    profile["name"] = "Alen"  # header: starts over
+    assert same(renderer.render(profile), render_cv(RenderContext(profile), None))
+    assert renderer.stats() == {"laid_out": 6 + 1 + 6 + 6, "replayed": 5, "replay_ratio": 0.208}
+
+
+def test_resume_entries(monkeypatch):
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    resume = {"name": "Alen", "email": "a@example.com", "education": "B.Tech",
+              "experience": [{"company": "X", "role": "Intern", "duration": "3 months", "bullets": ["Built Y"]}],
+              "projects": [], "skills": ["Python", "C"], "interests": ["AI"]}
+    renderer = IncrementalRenderer()
+    renderer.render(resume)
+    resume["interests"].append("Accessibility")  # edited in place
+    assert same(renderer.render(resume), render_resume(RenderContext(resume), None))
+
+
+def test_service_session_renders_incrementally(monkeypatch):
+    # The render service's ?session= path: edits from one session reuse its renderer
+    from blindcv import service
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    monkeypatch.setattr(service, "_renderers", service.OrderedDict())
+    profile = dict(CLASSIC)
+    service.render_request(profile, session="abc")
+    profile["email"] = "alen.alex@example.com"
+    data, template, _ = service.render_request(profile, session="abc")
+    assert template == "classic"
+    assert same(data, render_cv(RenderContext(profile), None))
+    assert service._renderers[("abc", "auto")].stats()["replayed"] == 5
@@ -0,0 +1,161 @@
+import os
+import json
+import asyncio
+import threading
+from blindcv import render
+from blindcv.stt import ReplayBackend
+from blindcv.journal import SessionJournal
+from blindcv.interview_server import Connection, InterviewServer
+from benchmarks.bench_session import SCRIPTS, synth_corpus
+from benchmarks.bench_interview_server import load
+
+# Concurrent interviews each get their own answers and folder, and a dropped
+# connection resumes from its journal.
+
+
+def answers(tmp_path):
+    synth_corpus(str(tmp_path / "corpus"))
+    folder = tmp_path / "corpus" / "test"
+    return [(folder / name).read_bytes() for name in sorted(os.listdir(folder)) if name.endswith(".wav")]
+
+
+def test_concurrent_sessions(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLINDCV_TTS", "null")
+    monkeypatch.delenv("BLINDCV_STORE", raising=False)
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    server = InterviewServer(str(tmp_path / "responses_out"), stt_factory=lambda: ReplayBackend(SCRIPTS["test"]))
+    try:
+        _, turns = asyncio.run(load(server, 5, "test", answers(tmp_path)))
+        assert server.stats()["completed"] == 5
+    finally:
+        server.close()
+    assert len(turns) == 20
+    # a folder named responses_* must not be rewritten into the PDF's path
+    sessions = [d for d in os.listdir(tmp_path / "responses_out") if d != "profiles.db"]
+    assert len(sessions) == 5
+    for session in sessions:
+        files = os.listdir(tmp_path / "responses_out" / session)
+        assert any(f.startswith("cv_") and f.endswith(".pdf") for f in files)
+
+
+def test_resume_after_hang_up(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLINDCV_TTS", "null")
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    wavs = answers(tmp_path)
+    # Second connection only hears the profession question
+    scripts = iter([["Alen Alex", "yes"], ["software engineer", "yes"]])
+    server = InterviewServer(str(tmp_path / "out"), stt_factory=lambda: ReplayBackend(next(scripts)))
+
+    async def run():
+        listener = await server.start("127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        conn = Connection(*await asyncio.open_connection("127.0.0.1", port))
+        await conn.send(b"H", {"mode": "test", "session": "0123456789abcdef"})
+        prompts = []
+        for wav in wavs[:2]:
+            while True:
+                kind, payload = await conn.read()
+                if kind == b"P" and json.loads(payload)["listen"]:
+                    break
+            prompts.append(json.loads(payload)["text"])
+            await conn.send(b"U", wav)
+        await conn.read()  # the name is journaled before the next question is asked
+        conn.writer.close()
+
+        conn = Connection(*await asyncio.open_connection("127.0.0.1", port))
+        await conn.send(b"H", {"mode": "test", "session": "0123456789abcdef"})
+        kind, payload = await conn.read()
+        assert kind == b"S" and json.loads(payload)["resumed"]
+        remaining = iter(wavs[2:])
+        while True:
+            kind, payload = await conn.read()
+            if kind == b"F":
+                break
+            if kind == b"P" and json.loads(payload)["listen"]:
+                prompts.append(json.loads(payload)["text"])
+                await conn.send(b"U", next(remaining))
+        conn.writer.close()
+        listener.close()
+        await listener.wait_closed()
+        return prompts, payload
+
+    try:
+        prompts, pdf = asyncio.run(run())
+    finally:
+        server.close()
+    assert pdf.startswith(b"%PDF")
+    assert prompts[1].startswith("You said: Alen Alex") and prompts[3].startswith("You said: software engineer")
+    profile_files = [f for f in os.listdir(tmp_path / "out" / "0123456789abcdef") if f.endswith(".json")]
+    with open(tmp_path / "out" / "0123456789abcdef" / profile_files[0]) as f:
+        profile = json.load(f)
+    assert profile["name"] == "Alen Alex" and profile["tag"] == "software engineer"
+
+
+def test_monologue_fills_gaps(tmp_path, monkeypatch):
+    monkeypatch.setenv("BLINDCV_TTS", "null")
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    synth_corpus(str(tmp_path / "corpus"))
+    folder = tmp_path / "corpus" / "monologue"
+    wavs = [(folder / name).read_bytes() for name in sorted(os.listdir(folder)) if name.endswith(".wav")]
+    server = InterviewServer(str(tmp_path / "out"), stt_factory=lambda: ReplayBackend(SCRIPTS["monologue"]))
+    try:
+        asyncio.run(load(server, 1, "monologue", wavs))
+    finally:
+        server.close()
+    session, = [d for d in os.listdir(tmp_path / "out") if d != "profiles.db"]
+    with open(tmp_path / "out" / session / "parsed_monologue_cv.json") as f:
+        profile = json.load(f)
+    assert profile["projects"] == [{"title": "User Project", "description": SCRIPTS["monologue"][1]}]
+
+
+def test_default_backend_is_per_session(tmp_path, monkeypatch):
+    # each session replays the whole recorded interview, none eats another's answers
+    monkeypatch.setenv("BLINDCV_TTS", "null")
+    monkeypatch.setenv("BLINDCV_STT", "replay")
+    monkeypatch.setenv("BLINDCV_REPLAY_DIR", str(tmp_path / "corpus" / "test"))
+    monkeypatch.setattr(render, "RENDER_CACHE", None)
+    wavs = answers(tmp_path)
+    server = InterviewServer(str(tmp_path / "out"))
+    try:
+        asyncio.run(load(server, 3, "test", wavs))
+        assert server.stats()["completed"] == 3
+    finally:
+        server.close()
+
+
+def test_journal_closes_off_the_event_loop(tmp_path, monkeypatch):
+    # an introduction nobody understood discards the journal, in the work pool like every journal call
+    monkeypatch.setenv("BLINDCV_TTS", "null")
+    threads = []
+    close = SessionJournal.close
+    monkeypatch.setattr(SessionJournal, "close", lambda self: (threads.append(threading.current_thread().name),
+                                                               close(self)))
+    wav = answers(tmp_path)[0]
+    server = InterviewServer(str(tmp_path / "out"), stt_factory=lambda: ReplayBackend([""]))
+
+    async def run():
+        listener = await server.start("127.0.0.1", 0)
+        conn = Connection(*await asyncio.open_connection("127.0.0.1", listener.sockets[0].getsockname()[1]))
+        await conn.send(b"H", {"mode": "monologue", "session": "0123456789abcdef"})
+        prompts = []
+        try:
+            while True:
+                kind, payload = await conn.read()
+                if kind == b"P":
+                    prompts.append(json.loads(payload)["text"])
+                    if json.loads(payload)["listen"]:
+                        await conn.send(b"U", wav)
+        except ConnectionResetError:
+            pass
+        listener.close()
+        await listener.wait_closed()
+        return prompts
+
+    try:
+        prompts = asyncio.run(run())
+        assert server.stats()["completed"] == 1
+    finally:
+        server.close()
+    assert prompts[-1] == "Sorry, I didn't catch that."
+    assert threads and all(name.startswith("work") for name in threads)
+    assert os.listdir(tmp_path / "out" / "0123456789abcdef") == []
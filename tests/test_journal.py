@@ -0,0 +1,80 @@
+import json
+from blindcv.journal import SessionJournal
+
+# The interview journal: answers survive a crash (including one that tore the
+# last line), resume picks up the saved state, and compaction leaves only
+# the final profile JSON.
+
+
+def test_resume_after_crash_and_compact(tmp_path):
+    path = str(tmp_path / "interview.journal")
+    journal = SessionJournal(path)
+    journal.update({"name": "Alen", "experience": []})
+    journal.set("tag", "engineer")
+    journal.append("experience", {"company": "Acme"})
+    journal.close()
+    with open(path, "a") as f:
+        f.write('{"op": "set", "key": "ema')  # killed mid-write
+
+    resumed = SessionJournal(path)
+    assert resumed.resumed and resumed.records == 3
+    assert resumed.data == {"name": "Alen", "experience": [{"company": "Acme"}], "tag": "engineer"}
+    resumed.set("email", "alen@example.com")
+
+    profile = str(tmp_path / "responses.json")
+    resumed.compact(profile, extra={"style": "basic"})
+    with open(profile) as f:
+        assert json.load(f) == {"name": "Alen", "experience": [{"company": "Acme"}], "tag": "engineer",
+                                "email": "alen@example.com", "style": "basic"}
+    assert not (tmp_path / "interview.journal").exists()
+    assert not SessionJournal(path).resumed
+
+
+def test_fsync_is_batched(tmp_path, monkeypatch):
+    synced = []
+    monkeypatch.setattr("blindcv.journal.os.fsync", synced.append)
+    journal = SessionJournal(str(tmp_path / "j.journal"), fsync_every=4, fsync_interval=60)
+    for i in range(10):
+        journal.set(f"q{i}", "answer")
+    assert len(synced) == 2
+    journal.close()
+    assert len(synced) == 3
+
+
+def write_journal(tmp_path, text):
+    path = tmp_path / "interview.journal"
+    path.write_text(text)
+    return str(path)
+
+
+def test_blank_lines_are_skipped(tmp_path):
+    path = write_journal(tmp_path, '{"op": "set", "key": "name", "value": "Alen"}\n\n'
+                                   '{"op": "set", "key": "tag", "value": "engineer"}\n')
+    journal = SessionJournal(path)
+    journal.close()
+    assert journal.records == 2 and journal.data == {"name": "Alen", "tag": "engineer"}
+
+
+def test_bad_record_before_the_end_is_an_error(tmp_path):
+    later = '{"op": "set", "key": "tag", "value": "engineer"}\n'
+    for bad in ['{"op": "delete", "key": "name"}', '{"key": "name", "value": "Alen"}',
+                '{"op": "update", "value": "Alen"}', '{"op": "set", "key": "na']:
+        path = write_journal(tmp_path, bad + "\n" + later)
+        try:
+            SessionJournal(path)
+        except ValueError as e:
+            assert "line 1" in str(e)
+        else:
+            raise AssertionError(f"{bad} was accepted")
+        # nothing after the bad record was truncated away
+        assert (tmp_path / "interview.journal").read_text() == bad + "\n" + later
+
+
+def test_bad_final_line_with_newline_is_an_error(tmp_path):
+    path = write_journal(tmp_path, '{"op": "set", "key": "name", "value": "Alen"}\n{"op": "set"\n')
+    try:
+        SessionJournal(path)
+    except ValueError as e:
+        assert "line 2" in str(e)
+    else:
+        raise AssertionError("a complete bad line was taken for a torn write")
@@ -0,0 +1,62 @@
+import smtplib
+import pytest
+from email import message_from_bytes
+from blindcv.mail import MailQueue, Outbox, SMTPPool, is_permanent
+from blindcv.smtp_debug import SMTPDebugServer
+
+# Background email delivery against the local debug SMTP server: retries on
+# temporary failures, reused connections, and messages left in the outbox by
+# a run that could not reach the server being sent by the next one.
+
+PDF = b"%PDF-1.3 test"
+
+
+@pytest.fixture
+def smtp_server():
+    server = SMTPDebugServer(port=0).start()
+    yield server
+    server.stop()
+
+
+def make_queue(port, outbox_dir, **options):
+    config = {"host": "127.0.0.1", "port": port, "user": "sender@example.com",
+              "password": "secret", "starttls": False}
+    return MailQueue(SMTPPool(config), Outbox(outbox_dir), backoff=0.01, **options)
+
+
+def test_delivers_with_retries_and_reuses_connections(smtp_server, tmp_path):
+    smtp_server.fail_next = 2
+    mail = make_queue(smtp_server.server_address[1], str(tmp_path))
+    deliveries = [mail.send(f"user{i}@example.com", PDF) for i in range(4)]
+    for delivery in deliveries:
+        delivery.result(5)
+    mail.close()
+
+    assert len(smtp_server.messages) == 4
+    for _, _, raw in smtp_server.messages:
+        assert message_from_bytes(raw).get_payload()[1].get_payload(decode=True) == PDF
+    stats = mail.stats()
+    assert stats["sent"] == 4 and stats["retries"] == 2
+    assert stats["connections_reused"] > 0
+    assert Outbox(str(tmp_path)).pending() == []
+
+
+def test_undelivered_mail_is_sent_by_the_next_queue(smtp_server, tmp_path):
+    down = make_queue(1, str(tmp_path), workers=1, max_attempts=2)
+    with pytest.raises(OSError):
+        down.send("user@example.com", PDF).result(5)
+    down.close()
+    assert len(Outbox(str(tmp_path)).pending()) == 1
+
+    mail = make_queue(smtp_server.server_address[1], str(tmp_path))
+    mail.close()  # drains the recovered message first
+    assert mail.recovered == 1
+    assert len(smtp_server.messages) == 1
+    assert Outbox(str(tmp_path)).pending() == []
+
+
+def test_permanent_errors_are_not_retried():
+    assert is_permanent(smtplib.SMTPDataError(550, b"mailbox unavailable"))
+    assert is_permanent(smtplib.SMTPRecipientsRefused({"x@example.com": (550, b"no such user")}))
+    assert not is_permanent(smtplib.SMTPDataError(451, b"try again later"))
+    assert not is_permanent(smtplib.SMTPServerDisconnected("gone"))
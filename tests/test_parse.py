@@ -0,0 +1,21 @@
+from blindcv.parse import KeywordExtractor
+
+# Regex rules fire even when their matches overlap, and backreferences work.
+
+
+def test_overlapping_regex_rules_both_fire():
+    extractor = KeywordExtractor([
+        {"regex": r"developer at \w+", "set": {"tag": "Developer"}},
+        {"regex": r"at tcs", "append": {"experience": "TCS"}},
+    ])
+    assert extractor.parse("I was a developer at tcs") == {"tag": "Developer", "experience": ["TCS"]}
+    assert extractor.parse("I like tea") == {}
+
+
+def test_backreference_rule():
+    extractor = KeywordExtractor([
+        {"regex": r"at (\w+)", "set": {"seen": True}},
+        {"regex": r"\b(\w+) \1\b", "set": {"stutter": True}},
+    ])
+    assert extractor.parse("I I worked at home") == {"seen": True, "stutter": True}
+    assert extractor.parse("I worked from home") == {}
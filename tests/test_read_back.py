@@ -0,0 +1,45 @@
+from blindcv.dialog import DialogEngine
+from blindcv.session import QUESTIONS
+
+# Batch read-back re-asks only the fields the user names as whole words, and
+# "done" ends it even when a field name is in the same sentence.
+
+
+class STT:
+    def __init__(self, replies):
+        self.replies = iter(replies)
+
+    def transcribe(self, audio):
+        return next(self.replies), None
+
+
+class Dialog(DialogEngine):
+    """Replies come straight from the script, no microphone."""
+
+    def prompt_and_transcribe(self, text, key=None):
+        self.prompts.append(text)
+        return self.stt.transcribe(None)
+
+
+def read_back(replies):
+    dialog = Dialog(lambda text, stop: None, None, STT(replies), confirm="batch")
+    dialog.prompts = []
+    answers = {key: f"old {key}" for key in QUESTIONS}
+    asked = []
+    dialog.read_back(QUESTIONS, answers, on_answer=lambda key, answer: asked.append(key))
+    return asked, answers
+
+
+def test_field_inside_another_word_is_not_named():
+    assert read_back(["at this stage everything is correct"])[0] == []
+    assert read_back(["change my username", "the capacity and ethnicity", "done"])[0] == []
+
+
+def test_field_followed_by_done_word_ends():
+    assert read_back(["the school is done"])[0] == []
+
+
+def test_named_fields_are_asked_again():
+    asked, answers = read_back(["change the city and the qr code", "Pune", "yes", "no", "yes", "done"])
+    assert asked == ["city", "qr_code"]
+    assert answers["city"] == "Pune" and answers["qr_code"] == "no"
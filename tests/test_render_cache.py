@@ -0,0 +1,56 @@
+import shutil
+import pytest
+from blindcv import render, template
+from blindcv.render import RenderContext, render_cv
+from blindcv.render_cache import RenderCache
+
+# Render cache: an unchanged profile comes back from memory, then from disk in
+# a fresh process, editing a template file invalidates what it produced, and
+# the disk tier stays inside its budget.
+
+PROFILE = {"name": "Alen Alex", "tag": "Engineer", "education": "B.Tech. Kochi", "style": "basic"}
+
+
+@pytest.fixture
+def templates(tmp_path, monkeypatch):
+    directory = tmp_path / "templates"
+    shutil.copytree(template.TEMPLATE_DIR, directory)
+    monkeypatch.setattr(template, "TEMPLATE_DIR", str(directory))
+    return directory
+
+
+def render_bytes(profile):
+    return render_cv(RenderContext(profile), None)
+
+
+def use_cache(monkeypatch, cache):
+    monkeypatch.setattr(render, "RENDER_CACHE", cache)
+    return cache
+
+
+def test_hits_persist_and_template_edits_invalidate(tmp_path, monkeypatch, templates):
+    cache = use_cache(monkeypatch, RenderCache(str(tmp_path / "cache")))
+    first = render_bytes(PROFILE)
+    assert render_bytes(dict(PROFILE)) is first
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+    cache.flush()
+
+    fresh = use_cache(monkeypatch, RenderCache(str(tmp_path / "cache")))
+    assert render_bytes(PROFILE) == first
+    assert fresh.stats()["disk_hits"] == 1
+
+    basic = templates / "basic.json"
+    basic.write_text(basic.read_text().replace('"Arial", "B", 16', '"Arial", "B", 18'))
+    edited = render_bytes(PROFILE)
+    assert edited != first
+    assert fresh.stats()["misses"] == 1
+
+
+def test_disk_tier_is_bounded(tmp_path, monkeypatch):
+    cache = use_cache(monkeypatch, RenderCache(str(tmp_path / "cache"), max_memory_bytes=1, max_disk_bytes=5000))
+    for i in range(10):
+        render_bytes(dict(PROFILE, name=f"User {i}"))
+    cache.flush()
+    stats = cache.stats()
+    assert stats["disk_bytes"] <= 5000 and stats["evictions"] > 0
+    assert len(list((tmp_path / "cache").iterdir())) == stats["disk_entries"]
@@ -0,0 +1,34 @@
+import json
+from blindcv.store import ProfileStore, import_profiles
+
+# Profile store: versions per user, unchanged saves and re-imports adding
+# nothing, diffs between versions and PDFs traced back to their version.
+
+
+def write(path, profile):
+    with open(path, "w") as f:
+        json.dump(profile, f)
+
+
+def test_import_versions_and_diff(tmp_path):
+    files = tmp_path / "files"
+    files.mkdir()
+    first = {"name": "Alen", "email": "Alen@Example.com", "tag": "student"}
+    write(files / "responses_20250406_201204.json", first)
+    (files / "cv_20250406_201204.pdf").write_bytes(b"%PDF first")
+    write(files / "responses_20250501_090000.json", dict(first, tag="engineer", city="Kochi"))
+    write(files / "responses_20250301_090000.json", {"name": "No Email"})
+
+    store = ProfileStore(str(tmp_path / "profiles.db"))
+    assert import_profiles(store, str(files)) == 3
+    assert import_profiles(store, str(files)) == 0
+    assert store.save(dict(first, tag="engineer", city="Kochi")) == ("alen@example.com", 2)
+
+    latest = store.latest("alen@example.com")
+    assert latest["version"] == 2 and latest["created_at"] == "2025-05-01T09:00:00"
+    assert store.latest("no email")["profile"] == {"name": "No Email"}
+    assert store.diff("alen@example.com", 1, 2) == {
+        "added": {"city": "Kochi"}, "removed": {}, "changed": {"tag": ["student", "engineer"]}}
+    assert store.find_pdf(b"%PDF first") == [("alen@example.com", 1, "classic")]
+    assert store.stats() == {"users": 2, "versions": 3, "renders": 1}
+    store.close()
@@ -0,0 +1,42 @@
+import json
+import urllib.request
+import pytest
+from blindcv import trace
+
+# Tracing: off, span() is the shared no-op; on, spans nest, land in the
+# JSON-lines file with their parent and error, and show up in /metrics.
+
+
+@trace.traced("outer")
+def outer(fail=False):
+    with trace.span("inner", field="email") as s:
+        s.set(cached=False)
+        if fail:
+            raise ValueError("boom")
+
+
+def test_disabled_is_a_no_op():
+    trace.disable()
+    assert trace.span("anything") is trace.NO_SPAN
+    outer()
+    assert trace.metrics() is None
+
+
+def test_spans_to_jsonl_and_prometheus(tmp_path):
+    path = tmp_path / "trace.jsonl"
+    tracer = trace.enable(str(path), port=0)
+    try:
+        outer()
+        with pytest.raises(ValueError):
+            outer(fail=True)
+        port = tracer.server.server_port
+        text = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics").read().decode()
+    finally:
+        trace.disable()
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(l["span"], l["parent"]) for l in lines] == [("inner", "outer"), ("outer", None)] * 2
+    assert lines[0]["field"] == "email" and lines[0]["cached"] is False
+    assert lines[2]["error"] == "ValueError: boom"
+    assert 'blindcv_span_seconds_count{span="outer"} 2' in text
+    assert 'blindcv_span_errors_total{span="inner"} 1' in text
@@ -0,0 +1,47 @@
+import threading
+from blindcv.tts import Speaker, URGENT, BACKGROUND
+
+# Speech service: lines are spoken one at a time on the speech thread in
+# priority order, queued lines can be cancelled, the current one interrupted,
+# and the blocking text_to_speech() still waits for its line.
+
+
+class FakePrompts:
+    """Stands in for the prompt-audio cache: 'long' lines play until stopped."""
+
+    def __init__(self):
+        self.played = []
+        self.playing = threading.Event()
+
+    def play(self, text, stop_event=None):
+        self.played.append(text)
+        if text.startswith("long"):
+            self.playing.set()
+            stop_event.wait(5)
+        return True
+
+
+def test_priority_cancel_and_interrupt(monkeypatch):
+    monkeypatch.setenv("BLINDCV_TTS", "null")
+    prompts = FakePrompts()
+    speaker = Speaker(prompt_audio=prompts)
+
+    first = speaker.speak("long welcome")
+    prompts.playing.wait(5)  # the speech thread is busy, so the rest queue up
+    later = speaker.speak("background status", BACKGROUND)
+    dropped = speaker.speak("never said")
+    normal = speaker.speak("normal line")
+    urgent = speaker.speak("urgent question", URGENT)
+    assert dropped.cancel()
+    assert speaker.stats()["queue_depth"] == 4
+
+    speaker.interrupt()
+    assert first.result(5) is False
+    assert later.result(5) is True and urgent.result() is True and normal.result() is True
+    speaker.text_to_speech("last line")  # blocks until spoken
+    speaker.close(5)
+
+    assert prompts.played == ["long welcome", "urgent question", "normal line", "background status", "last line"]
+    stats = speaker.stats()
+    assert (stats["spoken"], stats["interrupted"], stats["cancelled"]) == (4, 1, 1)
+    assert stats["max_depth"] == 4
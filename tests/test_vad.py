@@ -0,0 +1,57 @@
+import math
+import random
+import struct
+import speech_recognition as sr
+from blindcv.vad import PROFILES, VoiceActivityDetector, profile_for
+from benchmarks.bench_vad import RATE, THRESHOLD, Source, synth_answer
+
+# Capture ends on the question's profile, keeps long answers with thinking
+# pauses whole, and sends the recognizer the speech without the silence
+# around it.
+
+
+def seconds(audio):
+    return len(audio.frame_data) / audio.sample_width / audio.sample_rate
+
+
+def test_profiles_per_question():
+    assert profile_for("confirm") is PROFILES["short"]
+    assert profile_for("projects") is PROFILES["long"]
+    assert profile_for("name") is PROFILES["normal"]
+
+
+def test_short_answer_ends_quickly_and_is_trimmed():
+    pcm, start, end = synth_answer(random.Random(1), [1], 0)
+    source = Source(pcm)
+    audio = VoiceActivityDetector().capture(source, THRESHOLD, PROFILES["short"])
+    consumed = source.stream.offset / 2 / RATE
+    assert end < consumed < end + 0.6
+    assert seconds(audio) < (end - start) + 0.7
+
+
+def test_long_answer_survives_pauses():
+    pcm, start, end = synth_answer(random.Random(2), [6, 6, 6], 1.0)
+    vad = VoiceActivityDetector()
+    assert seconds(vad.capture(Source(pcm), THRESHOLD, PROFILES["long"])) > end - start
+    # the short profile stops at the first pause
+    assert seconds(vad.capture(Source(pcm), THRESHOLD, PROFILES["short"])) < end - start
+    assert vad.stats()["ended"]["pause"] == 2
+
+
+def test_hum_is_not_speech():
+    hum = [int(3000 * math.sin(2 * math.pi * 50 * n / RATE)) for n in range(RATE * 4)]
+    source = Source(struct.pack(f"<{len(hum)}h", *hum))
+    try:
+        VoiceActivityDetector().capture(source, THRESHOLD, PROFILES["short"])
+    except sr.WaitTimeoutError:
+        pass
+    else:
+        raise AssertionError("mains hum started a capture")
+
+
+def test_trim_recording():
+    pcm, start, end = synth_answer(random.Random(3), [3], 0)
+    audio = sr.AudioData(pcm, RATE, 2)
+    trimmed = VoiceActivityDetector().trim(audio)
+    assert end - start <= seconds(trimmed) < end - start + 0.5
+    assert seconds(trimmed) < seconds(audio) / 2